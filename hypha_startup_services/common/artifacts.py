@@ -117,6 +117,12 @@ async def delete_artifact(
             logger.warning("Error deleting artifact '%s'. Error: %s", artifact_id, e)
 
 
+def is_artifact_not_found(error: RemoteException) -> bool:
+    """Check whether an error of the artifact manager reports a missing artifact."""
+    message = str(error).lower()
+    return "does not exist" in message or "not found" in message
+
+
 async def artifact_exists(
     artifact_id: str,
 ) -> bool:
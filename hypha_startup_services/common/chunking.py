@@ -110,3 +110,46 @@ def chunk_documents(
             chunked_docs.append(chunked_doc)
 
     return chunked_docs
+
+
+def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+    """Count the tokens of a text.
+
+    Args:
+        text: The text to measure
+        encoding_name: Tiktoken encoding name to use
+
+    Returns:
+        Number of tokens in the text
+
+    """
+    if not text:
+        return 0
+    return len(tiktoken.get_encoding(encoding_name).encode(text))
+
+
+def truncate_tokens(
+    text: str,
+    max_tokens: int,
+    encoding_name: str = "cl100k_base",
+) -> str:
+    """Keep at most `max_tokens` tokens of a text.
+
+    Args:
+        text: The text to truncate
+        max_tokens: Maximum number of tokens to keep
+        encoding_name: Tiktoken encoding name to use
+
+    Returns:
+        The text, or its first `max_tokens` tokens
+
+    """
+    # A token spans at least one character, so short texts need no encoding
+    if len(text) <= max_tokens:
+        return text
+
+    encoding = tiktoken.get_encoding(encoding_name)
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
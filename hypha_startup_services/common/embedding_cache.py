@@ -0,0 +1,272 @@
+"""Cache for text embeddings computed by client-side embedders.
+
+Embeddings are keyed by the embedding model and a hash of the normalised text,
+so repeated texts (overlapping chunks, re-ingests, repeated queries) cost a
+hash lookup instead of a model call. The cache has an in-memory LRU tier and
+an optional on-disk tier that stores vectors in memory-mapped float32 arrays.
+"""
+
+import fcntl
+import hashlib
+import logging
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Environment variable enabling the on-disk tier of the default cache
+EMBEDDING_CACHE_DIR_ENV = "EMBEDDING_CACHE_DIR"
+# Number of embeddings kept in the in-memory tier
+DEFAULT_MAX_ENTRIES = 10_000
+# Initial number of rows of a newly created vector file
+INITIAL_DISK_ROWS = 1024
+
+_default_cache: "EmbeddingCache | None" = None
+_default_cache_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Normalise text so that trivially different inputs share an embedding.
+
+    Applies Unicode NFC normalisation and collapses whitespace. Case is kept,
+    since embedding models are generally case sensitive.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Get the cache key of a text embedded with a model."""
+    content = f"{model}\0{normalize_text(text)}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class DiskEmbeddingStore:
+    """Append-only on-disk store of embeddings.
+
+    Vectors of each dimension are kept in a memory-mapped float32 file
+    (`vectors_<dim>.f32`) that grows by doubling. The index file maps keys to
+    (dimension, row) and is appended to after the vector has been flushed to
+    disk, so an interrupted write never leaves an index entry without its
+    vector. Writes hold an exclusive lock on `index.lock` and first read index
+    entries appended by other processes, so several processes (e.g. service
+    workers) can share a directory without writing to the same rows.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Open or create the store in `directory`."""
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._index_path = self._directory / "index.tsv"
+        self._lock_path = self._directory / "index.lock"
+        self._index_offset = 0
+        self._rows: dict[str, tuple[int, int]] = {}
+        self._counts: dict[int, int] = {}
+        self._matrices: dict[int, np.memmap] = {}
+        self._load_index()
+
+    def __len__(self) -> int:
+        """Get the number of stored embeddings."""
+        return len(self._rows)
+
+    def get(self, key: str) -> list[float] | None:
+        """Get a stored embedding, or None if the key is unknown."""
+        location = self._rows.get(key)
+        if location is None:
+            self._load_index()
+            location = self._rows.get(key)
+        if location is None:
+            return None
+        dim, row = location
+        return self._matrix(dim, row + 1)[row].tolist()
+
+    def put(self, key: str, vector: Sequence[float]) -> None:
+        """Store an embedding unless the key is already stored.
+
+        Raises:
+            ValueError: If the vector is empty
+
+        """
+        dim = len(vector)
+        if dim < 1:
+            error_msg = "Cannot store an embedding without dimensions"
+            raise ValueError(error_msg)
+        if key in self._rows:
+            return
+
+        with self._lock_path.open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._load_index()
+            if key in self._rows:
+                return
+
+            row = self._counts.get(dim, 0)
+            matrix = self._matrix(dim, row + 1)
+            matrix[row] = vector
+            matrix.flush()
+            with self._index_path.open("a", encoding="utf-8") as index_file:
+                index_file.write(f"{key}\t{dim}\t{row}\n")
+                self._index_offset = index_file.tell()
+
+        self._rows[key] = (dim, row)
+        self._counts[dim] = row + 1
+
+    def flush(self) -> None:
+        """Write pending vector changes to disk."""
+        for matrix in self._matrices.values():
+            matrix.flush()
+
+    def _load_index(self) -> None:
+        """Read index entries appended since the last read."""
+        if not self._index_path.exists():
+            return
+
+        with self._index_path.open("rb") as index_file:
+            index_file.seek(self._index_offset)
+            for line in index_file:
+                if not line.endswith(b"\n"):
+                    break
+                self._index_offset += len(line)
+                parts = line.decode("utf-8").rstrip("\n").split("\t")
+                if len(parts) != 3:  # noqa: PLR2004
+                    continue
+                key, dim, row = parts[0], int(parts[1]), int(parts[2])
+                if dim < 1:
+                    continue
+                self._rows[key] = (dim, row)
+                self._counts[dim] = max(self._counts.get(dim, 0), row + 1)
+
+    def _matrix(self, dim: int, min_rows: int) -> np.memmap:
+        matrix = self._matrices.get(dim)
+        if matrix is not None and matrix.shape[0] >= min_rows:
+            return matrix
+
+        path = self._directory / f"vectors_{dim}.f32"
+        row_bytes = dim * np.dtype(np.float32).itemsize
+        capacity = path.stat().st_size // row_bytes if path.exists() else 0
+
+        if matrix is not None:
+            matrix.flush()
+        if capacity < min_rows:
+            capacity = max(min_rows, 2 * capacity, INITIAL_DISK_ROWS)
+            path.touch()
+            os.truncate(path, capacity * row_bytes)
+
+        matrix = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, dim))
+        self._matrices[dim] = matrix
+        return matrix
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache keyed by (model, normalised text hash).
+
+    Lookups check the in-memory LRU tier first, then the optional disk tier;
+    disk hits are promoted to memory. The cache is safe to use from several
+    threads, as embedders are often called from worker threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        directory: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of embeddings kept in memory
+            directory: Optional directory of the on-disk tier
+
+        """
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._disk = DiskEmbeddingStore(directory) if directory is not None else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        """Get the cached embedding of a text, or None on a miss."""
+        key = embedding_key(model, text)
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+            elif self._disk is not None:
+                vector = self._disk.get(key)
+                if vector is not None:
+                    self._remember(key, vector)
+
+            if vector is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return vector
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        """Cache the embedding of a text.
+
+        Raises:
+            ValueError: If the vector is empty and the disk tier is enabled
+
+        """
+        key = embedding_key(model, text)
+        with self._lock:
+            if self._disk is not None:
+                self._disk.put(key, vector)
+            self._remember(key, list(vector))
+
+    def get_or_embed(
+        self,
+        model: str,
+        text: str,
+        embed: Callable[[str], Sequence[float]],
+    ) -> list[float]:
+        """Get the cached embedding of a text, computing it on a miss.
+
+        Args:
+            model: Name of the embedding model
+            text: Text to embed
+            embed: Function computing the embedding of a text
+
+        Returns:
+            The embedding
+
+        """
+        vector = self.get(model, text)
+        if vector is None:
+            vector = list(embed(text))
+            self.put(model, text, vector)
+        return vector
+
+    def flush(self) -> None:
+        """Write pending changes of the disk tier to disk."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.flush()
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache.
+
+    The disk tier is enabled if the EMBEDDING_CACHE_DIR environment variable
+    is set when the cache is first used.
+    """
+    global _default_cache  # noqa: PLW0603
+    with _default_cache_lock:
+        if _default_cache is None:
+            directory = os.environ.get(EMBEDDING_CACHE_DIR_ENV)
+            _default_cache = EmbeddingCache(directory=directory or None)
+            if directory:
+                logger.info("Using on-disk embedding cache in %s", directory)
+        return _default_cache
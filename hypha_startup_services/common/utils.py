@@ -1,6 +1,6 @@
 """Common utility functions shared between services."""
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping, Sequence
 from typing import Any, TypeVar
 
 from hypha_rpc.utils import ObjectProxy
@@ -46,6 +46,15 @@ def stringify_keys(d: Mapping[Any, T]) -> dict[str, T]:
     return {str(k): v for k, v in d.items()}
 
 
+def batched(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive slices of at most `size` items."""
+    if size < 1:
+        error_msg = "Batch size must be at least 1"
+        raise ValueError(error_msg)
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
 def format_workspace(workspace: str) -> str:
     """Format workspace name to use in collection names.
 
@@ -4,6 +4,8 @@ import json
 import logging
 import math
 
+from hypha_startup_services.common.embedding_cache import get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 # Common constants
@@ -618,21 +620,29 @@ def patch_mem0_get_all_from_vector_store():
 
 
 def patch_ollama_embedding():
-    """Patch Ollama embedding model to handle list inputs gracefully."""
+    """Patch Ollama embedding model to handle list inputs and cache embeddings."""
     try:
         from mem0.embeddings.ollama import OllamaEmbedding
 
         original_embed = OllamaEmbedding.embed
 
         def patched_embed(self, text, memory_action=None):
-            """Patched embed method that handles both string and list inputs."""
+            """Patched embed method that handles both string and list inputs.
+
+            Embeddings are served from the shared embedding cache when the same
+            text has been embedded with the same model before.
+            """
             # If text is a list, join it into a single string
             if isinstance(text, list):
                 text = " ".join(str(item) for item in text)
             elif not isinstance(text, str):
                 text = str(text)
 
-            return original_embed(self, text, memory_action)
+            return get_embedding_cache().get_or_embed(
+                self.config.model,
+                text,
+                lambda value: original_embed(self, value, memory_action),
+            )
 
         OllamaEmbedding.embed = patched_embed
         logger.info("Successfully patched OllamaEmbedding.embed")
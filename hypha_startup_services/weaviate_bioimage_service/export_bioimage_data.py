@@ -41,36 +41,29 @@ async def export_all_objects():
         COLLECTION_NAME,
         SHARED_APPLICATION_ID,
     )
-    all_objects = []
-    batch_size = 100
-    offset = 0
-    while True:
-        result = await weaviate_service.query.fetch_objects(
-            collection_name=COLLECTION_NAME,
-            application_id=SHARED_APPLICATION_ID,
-            limit=batch_size,
-            offset=offset,
-        )
-        objects = result.get("objects", [])
-        if not objects:
-            break
-        all_objects.extend(objects)
-        logger.info(
-            "Fetched %d objects (total so far: %d)",
-            len(objects),
-            len(all_objects),
-        )
-        if len(objects) < batch_size:
-            break
-        offset += batch_size
-
-    logger.info(
-        "Fetched a total of %d objects. Writing to %s",
-        len(all_objects),
-        OUTPUT_FILE,
+    total = 0
+    batches = await weaviate_service.query.iterate(
+        collection_name=COLLECTION_NAME,
+        application_id=SHARED_APPLICATION_ID,
+        batch_size=100,
     )
+    # Objects are written as they arrive so memory stays bounded by one batch
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_objects, f, indent=2, ensure_ascii=False)
+        f.write("[")
+        async for batch in batches:
+            objects = batch.get("objects", [])
+            for obj in objects:
+                f.write(",\n" if total else "\n")
+                json.dump(obj, f, indent=2, ensure_ascii=False)
+                total += 1
+            logger.info(
+                "Fetched %d objects (total so far: %d)",
+                len(objects),
+                total,
+            )
+        f.write("\n]\n")
+
+    logger.info("Wrote a total of %d objects to %s", total, OUTPUT_FILE)
     logger.info("Export complete.")
     await server.disconnect()
 
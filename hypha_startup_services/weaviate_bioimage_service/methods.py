@@ -28,6 +28,8 @@ logger = logging.getLogger(__name__)
 BIOIMAGE_COLLECTION = "bioimage_data"
 SHARED_APPLICATION_ID = "eurobioimaging-shared"
 SHARED_APPLICATION_DESCRIPTION = "Shared EuroBioImaging nodes and technologies database"
+# Maximum number of tokens of search results summarized by a query
+GROUPED_TOKEN_BUDGET = 4000
 
 
 async def ensure_shared_application_exists(
@@ -104,17 +106,13 @@ async def query(
         filters=where_filter,
         limit=limit,
         target_vector="text_vector",  # Use available vector field
-        single_prompt=(
-            "Based on the bioimage data below, provide a comprehensive answer about"
-            " the user's query: '{query_text}'."
-            " Focus on nodes (facilities) and technologies that are relevant to"
-            " this query."
-        ),
+        generation_mode="grouped",
         grouped_task=(
             "Summarize the bioimage information to answer the user's"
             f" question about: '{query_text}'"
         ),
         grouped_properties=["text", "entity_type", "name"],
+        grouped_token_budget=GROUPED_TOKEN_BUDGET,
         context=context,
     )
 
@@ -34,6 +34,8 @@ COLLECTION_NAME = "bioimage_data"
 SHARED_APPLICATION_ID = "eurobioimaging-shared"
 DEFAULT_SERVER_URL = "https://hypha.aicell.io"
 WEAVIATE_SERVICE_ID = "hypha-agents/weaviate"
+# Seconds between progress polls of an ingest job
+JOB_POLL_INTERVAL = 2
 
 
 async def load_data_files() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -296,57 +298,52 @@ async def insert_data_in_batches(
     data_type: str,
     batch_size: int = 10,
 ):
-    """Insert data objects into the shared application in smaller batches."""
+    """Insert data objects into the shared application with a background job.
+
+    The job is submitted in a single short call and then polled, so the ingest
+    is not bound by the RPC method timeout. Object UUIDs are derived from the
+    entity IDs, so re-runs skip entities that are already stored.
+    """
     logger.info(
-        "Inserting %d %s objects in batches of %d...",
+        "Submitting ingest job for %d %s objects in batches of %d...",
         len(objects),
         data_type,
         batch_size,
     )
 
-    total_results = {"has_errors": False, "successful": 0, "failed": 0, "errors": []}
-
-    # Split objects into batches
-    for i in range(0, len(objects), batch_size):
-        batch = objects[i : i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(objects) + batch_size - 1) // batch_size
+    job = await weaviate_service.data.submit_insert_job(
+        collection_name=COLLECTION_NAME,
+        application_id=SHARED_APPLICATION_ID,
+        objects=objects,
+        enable_chunking=True,
+        chunk_size=512,
+        text_field="text",
+        batch_size=batch_size,
+        idempotent=True,
+        id_property="entity_id",
+    )
+    job_id = job["job_id"]
 
+    while job["status"] in {"pending", "running"}:
+        await asyncio.sleep(JOB_POLL_INTERVAL)
+        job = await weaviate_service.jobs.status(job_id=job_id)
         logger.info(
-            "Processing batch %d/%d (%d objects)...",
-            batch_num,
-            total_batches,
-            len(batch),
+            "Job %s: %d/%d objects processed (%s)",
+            job_id,
+            job["processed_objects"],
+            job["total_objects"],
+            job["status"],
         )
 
-        try:
-            result = await weaviate_service.data.insert_many(
-                collection_name=COLLECTION_NAME,
-                application_id=SHARED_APPLICATION_ID,
-                objects=batch,
-                enable_chunking=True,
-                chunk_size=512,
-                text_field="text",
-            )
+    result = await weaviate_service.jobs.result(job_id=job_id)
+    job = result["job"]
 
-            if result.get("has_errors"):
-                logger.warning(
-                    "Batch %d had errors: %s",
-                    batch_num,
-                    result.get("errors"),
-                )
-                total_results["has_errors"] = True
-                total_results["errors"].extend(result.get("errors", []))
-                total_results["failed"] += len(batch)
-            else:
-                logger.info("✅ Batch %d completed successfully", batch_num)
-                total_results["successful"] += len(batch)
-
-        except (TimeoutError, ConnectionError, Exception) as e:
-            logger.error("Failed to insert batch %d: %s", batch_num, e)
-            total_results["has_errors"] = True
-            total_results["failed"] += len(batch)
-            total_results["errors"].append(f"Batch {batch_num}: {e!s}")
+    total_results = {
+        "has_errors": result["has_errors"] or job["status"] != "completed",
+        "successful": len(result["uuids"]),
+        "failed": job["total_objects"] - len(result["uuids"]),
+        "errors": job["errors"],
+    }
 
     logger.info(
         "Batch insertion completed: %d successful, %d failed",
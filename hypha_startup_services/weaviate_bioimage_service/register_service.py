@@ -9,7 +9,14 @@ from hypha_startup_services.common.constants import DEFAULT_WEAVIATE_BIOIMAGE_SE
 from hypha_startup_services.common.data_index import (
     load_external_data,
 )
-from hypha_startup_services.weaviate_service.client import instantiate_and_connect
+from hypha_startup_services.weaviate_service.client_pool import (
+    WeaviateClientPool,
+    get_client_pool,
+)
+from hypha_startup_services.weaviate_service.utils.deadlines import (
+    DEFAULT_ENDPOINT_TIMEOUTS,
+    with_deadline,
+)
 
 from .methods import (
     create_get_entity,
@@ -28,21 +35,22 @@ async def register_weaviate_bioimage(
     """Register the Weaviate BioImage service with the Hypha server.
 
     This is the main registration function that follows the standard pattern.
-    It creates the Weaviate client internally.
+    It uses the Weaviate client pool shared by the services of the process.
 
     Args:
         server: RemoteService instance for service registration
         service_id: Unique identifier for the service
 
     """
-    # Create Weaviate client
-    weaviate_client = await instantiate_and_connect()
+    # Get the shared Weaviate client pool
+    client_pool = await get_client_pool()
 
     # Register the service
     await register_weaviate_bioimage_service(
         server=server,
-        weaviate_client=weaviate_client,
+        weaviate_client=client_pool.client,
         service_id=service_id,
+        client_pool=client_pool,
     )
 
 
@@ -50,6 +58,7 @@ async def register_weaviate_bioimage_service(
     server: RemoteService,
     weaviate_client: WeaviateAsyncClient,
     service_id: str = DEFAULT_WEAVIATE_BIOIMAGE_SERVICE_ID,
+    client_pool: WeaviateClientPool | None = None,
 ) -> None:
     """Register the Weaviate BioImage service with the Hypha server.
 
@@ -57,6 +66,8 @@ async def register_weaviate_bioimage_service(
         server: RemoteService instance for service registration
         weaviate_client: Weaviate client instance
         service_id: Unique identifier for the service
+        client_pool: Pool `weaviate_client` comes from, if any, whose
+            readiness is checked when a Weaviate call fails
 
     """
     logger.info("Loading bioimage data and creating service functions")
@@ -67,6 +78,27 @@ async def register_weaviate_bioimage_service(
     query_func = create_query(weaviate_client)
     get_entity_func = create_get_entity(weaviate_client)
     search_func = create_search(weaviate_client, bioimage_index)
+    if client_pool is not None:
+        query_func = client_pool.watch(query_func)
+        get_entity_func = client_pool.watch(get_entity_func)
+        search_func = client_pool.watch(search_func)
+
+    # Cancel each call at its deadline
+    query_func = with_deadline(
+        query_func,
+        DEFAULT_ENDPOINT_TIMEOUTS["generative"],
+        "query",
+    )
+    get_entity_func = with_deadline(
+        get_entity_func,
+        DEFAULT_ENDPOINT_TIMEOUTS["interactive"],
+        "get",
+    )
+    search_func = with_deadline(
+        search_func,
+        DEFAULT_ENDPOINT_TIMEOUTS["interactive"],
+        "search",
+    )
     get_related_func = create_get_related(bioimage_index)
 
     # Register the service
@@ -7,15 +7,21 @@ from weaviate.connect import ConnectionParams
 
 load_dotenv(override=True)
 
+WEAVIATE_HTTP_HOST = "hypha-weaviate.scilifelab-2-dev.sys.kth.se"
+WEAVIATE_GRPC_HOST = "hypha-weaviate-grpc.scilifelab-2-dev.sys.kth.se"
 
-async def instantiate_and_connect() -> WeaviateAsyncClient:
+
+async def instantiate_and_connect(
+    http_host: str = WEAVIATE_HTTP_HOST,
+    grpc_host: str = WEAVIATE_GRPC_HOST,
+) -> WeaviateAsyncClient:
     """Instantiate and connect to Weaviate client."""
     client = WeaviateAsyncClient(
         connection_params=ConnectionParams.from_params(
-            http_host="hypha-weaviate.scilifelab-2-dev.sys.kth.se",
+            http_host=http_host,
             http_port=443,
             http_secure=True,
-            grpc_host="hypha-weaviate-grpc.scilifelab-2-dev.sys.kth.se",
+            grpc_host=grpc_host,
             grpc_port=443,
             grpc_secure=True,
         ),
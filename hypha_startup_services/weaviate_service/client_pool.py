@@ -0,0 +1,398 @@
+"""Shared pools of Weaviate clients with readiness checks and reconnects.
+
+Services running in one process share a small pool of connected clients per
+Weaviate endpoint instead of each connecting its own client. A background
+task checks the readiness of every client periodically, and Weaviate calls
+failing with a connection error trigger an immediate check. A client that
+is not ready, or whose calls failed with a connection error, is replaced by
+a new connection as soon as Weaviate accepts one, so a Weaviate restart
+does not require restarting the services.
+
+Calls, streams and jobs hold a lease on the clients while they run. A
+replaced client is closed only once every lease taken before the replacement
+has ended, and no earlier than a grace period for work without a lease.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any, cast
+
+from grpc.aio import AioRpcError
+from weaviate.exceptions import (
+    WeaviateClosedClientError,
+    WeaviateConnectionError,
+    WeaviateGRPCUnavailableError,
+    WeaviateRetryError,
+    WeaviateTimeoutError,
+)
+
+from .client import WEAVIATE_GRPC_HOST, WEAVIATE_HTTP_HOST, instantiate_and_connect
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+
+    from weaviate import WeaviateAsyncClient
+
+logger = logging.getLogger(__name__)
+
+# Number of connected clients per Weaviate endpoint
+CLIENT_POOL_SIZE = 2
+# Seconds between readiness checks of the pooled clients
+READINESS_CHECK_INTERVAL = 10.0
+# Seconds a readiness check may take before the client counts as not ready
+READINESS_CHECK_TIMEOUT = 5.0
+# Minimum seconds a replaced client stays open for work without a lease
+CLIENT_CLOSE_DELAY = 60.0
+
+# Errors of Weaviate calls that can mean a broken connection
+CONNECTION_ERRORS = (
+    AioRpcError,
+    WeaviateClosedClientError,
+    WeaviateConnectionError,
+    WeaviateGRPCUnavailableError,
+    WeaviateRetryError,
+    WeaviateTimeoutError,
+)
+
+
+class PooledClient:
+    """Stand-in for a WeaviateAsyncClient backed by a client pool.
+
+    Within a watched call, every attribute access uses the client the call
+    was given. Elsewhere, each access uses the next client of the pool. Calls
+    are thereby spread over the pool and pick up reconnected clients.
+    """
+
+    def __init__(self, pool: WeaviateClientPool) -> None:
+        """Initialize the stand-in for `pool`."""
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the current call's client."""
+        return getattr(self._pool.current(), name)
+
+
+class WeaviateClientPool:
+    """Pool of connected clients kept ready by periodic checks."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[WeaviateAsyncClient]],
+        size: int = CLIENT_POOL_SIZE,
+        check_interval: float = READINESS_CHECK_INTERVAL,
+        close_delay: float = CLIENT_CLOSE_DELAY,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            connect: Coroutine factory returning a connected client
+            size: Number of clients kept connected
+            check_interval: Seconds between readiness checks
+            close_delay: Minimum seconds a replaced client stays open
+
+        """
+        self.size = size
+        self.check_interval = check_interval
+        self.close_delay = close_delay
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.client = cast("WeaviateAsyncClient", PooledClient(self))
+        self._connect = connect
+        self._clients: list[WeaviateAsyncClient] = []
+        self._retired: dict[WeaviateAsyncClient, int] = {}
+        self._closable: set[WeaviateAsyncClient] = set()
+        # Clients whose calls failed with a connection error since their check
+        self._failed: set[WeaviateAsyncClient] = set()
+        # Replacements so far; leases record it to know which clients they see
+        self._generation = 0
+        self._leases: Counter[int] = Counter()
+        self._lease_generation: contextvars.ContextVar[int | None] = (
+            contextvars.ContextVar(f"weaviate_pool_lease_{id(self)}", default=None)
+        )
+        self._call_client: contextvars.ContextVar[WeaviateAsyncClient | None] = (
+            contextvars.ContextVar(f"weaviate_pool_client_{id(self)}", default=None)
+        )
+        self._next = itertools.count()
+        self._check_requested = asyncio.Event()
+        self._starting: asyncio.Future[None] | None = None
+        self._monitor_task: asyncio.Task[None] | None = None
+        self._close_tasks: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        """Connect the clients and start the readiness checks.
+
+        Calling it again waits for the first start instead of connecting
+        new clients.
+        """
+        if self._starting is None:
+            self.loop = asyncio.get_running_loop()
+            self._starting = asyncio.ensure_future(self._start())
+        try:
+            await asyncio.shield(self._starting)
+        except Exception:
+            self._starting = None
+            raise
+
+    def get(self) -> WeaviateAsyncClient:
+        """Get the next client of the pool.
+
+        Raises:
+            RuntimeError: If the pool has not been started
+
+        """
+        if not self._clients:
+            error_msg = "The Weaviate client pool has not been started"
+            raise RuntimeError(error_msg)
+        return self._clients[next(self._next) % len(self._clients)]
+
+    def current(self) -> WeaviateAsyncClient:
+        """Get the client of the current watched call, or the next client.
+
+        Raises:
+            RuntimeError: If the pool has not been started
+
+        """
+        client = self._call_client.get()
+        return self.get() if client is None else client
+
+    def request_check(self) -> None:
+        """Check the readiness of the clients without waiting for the interval."""
+        self._check_requested.set()
+
+    async def check(self) -> int:
+        """Check the readiness of every client and replace those not ready.
+
+        Returns:
+            Number of replaced clients
+
+        """
+        replaced = await asyncio.gather(
+            *(self._replace_if_unready(index) for index in range(len(self._clients))),
+        )
+        return sum(replaced)
+
+    def lease(self) -> Callable[[], None]:
+        """Keep the clients that current work may use open until it ends.
+
+        Taken within a watched call, the lease covers the clients the call
+        may have used, so work it hands off, such as a job, can keep using
+        them after the call returns.
+
+        Returns:
+            Function ending the lease; calling it again has no effect
+
+        """
+        generation = self._current_generation()
+        self._leases[generation] += 1
+        released = False
+
+        def _release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._leases[generation] -= 1
+            if not self._leases[generation]:
+                del self._leases[generation]
+            self._close_unused()
+
+        return _release
+
+    def watch(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        """Run the endpoint on one client, holding a lease while it runs.
+
+        Every call, or stream, uses one client of the pool throughout. When it
+        hits a connection error, the client is marked as failed and a check
+        is requested, which replaces it.
+        """
+        if inspect.isasyncgenfunction(endpoint):
+
+            async def _stream(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+                release = self.lease()
+                client = self.get()
+                stream: AsyncGenerator[Any, None] = endpoint(*args, **kwargs)
+                try:
+                    while True:
+                        # Set per item, as items may be read from other tasks
+                        token = self._call_client.set(client)
+                        try:
+                            item = await anext(stream)
+                        except StopAsyncIteration:
+                            return
+                        except CONNECTION_ERRORS:
+                            self._mark_failed(client)
+                            raise
+                        finally:
+                            self._call_client.reset(token)
+                        yield item
+                finally:
+                    release()
+                    await stream.aclose()
+
+            return functools.update_wrapper(_stream, endpoint)
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            client = self.get()
+            generation_token = self._lease_generation.set(self._current_generation())
+            client_token = self._call_client.set(client)
+            release = self.lease()
+            try:
+                return await endpoint(*args, **kwargs)
+            except CONNECTION_ERRORS:
+                self._mark_failed(client)
+                raise
+            finally:
+                self._call_client.reset(client_token)
+                self._lease_generation.reset(generation_token)
+                release()
+
+        return functools.update_wrapper(_call, endpoint)
+
+    async def close(self) -> None:
+        """Stop the readiness checks and close all clients."""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_task
+        for task in list(self._close_tasks):
+            task.cancel()
+        clients = [*self._clients, *self._retired]
+        self._clients = []
+        self._retired.clear()
+        self._closable.clear()
+        self._failed.clear()
+        self._starting = None
+        await asyncio.gather(*(_close(client) for client in clients))
+
+    async def _start(self) -> None:
+        self._clients = list(
+            await asyncio.gather(*(self._connect() for _ in range(self.size))),
+        )
+        self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def _monitor(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._check_requested.wait(),
+                    self.check_interval,
+                )
+            self._check_requested.clear()
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Weaviate readiness check failed")
+
+    async def _replace_if_unready(self, index: int) -> bool:
+        client = self._clients[index]
+        if client not in self._failed and await _is_ready(client):
+            return False
+
+        try:
+            replacement = await self._connect()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Reconnecting to Weaviate failed: %s", e)
+            return False
+        if not await _is_ready(replacement):
+            logger.warning("Weaviate is not ready, keeping the current client")
+            await _close(replacement)
+            return False
+
+        self._clients[index] = replacement
+        self._failed.discard(client)
+        self._retire(client)
+        logger.info("Reconnected Weaviate client %d of the pool", index)
+        return True
+
+    def _mark_failed(self, client: WeaviateAsyncClient) -> None:
+        if client in self._clients:
+            self._failed.add(client)
+        self.request_check()
+
+    def _current_generation(self) -> int:
+        generation = self._lease_generation.get()
+        return self._generation if generation is None else generation
+
+    def _retire(self, client: WeaviateAsyncClient) -> None:
+        self._generation += 1
+        self._retired[client] = self._generation
+
+        async def _close_later() -> None:
+            await asyncio.sleep(self.close_delay)
+            self._closable.add(client)
+            self._close_unused()
+
+        self._run_later(_close_later())
+
+    def _close_unused(self) -> None:
+        """Close the retired clients past their delay that no lease can use.
+
+        A lease taken at generation `g` may use clients retired at a later
+        generation, so a client retired at `r` is unused once no lease older
+        than `r` remains.
+        """
+        oldest = min(self._leases, default=None)
+        for client in list(self._closable):
+            if oldest is None or oldest >= self._retired[client]:
+                self._closable.discard(client)
+                del self._retired[client]
+                self._run_later(_close(client))
+
+    def _run_later(self, work: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(work)
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+
+async def _is_ready(client: WeaviateAsyncClient) -> bool:
+    try:
+        async with asyncio.timeout(READINESS_CHECK_TIMEOUT):
+            return await client.is_ready()
+    except Exception:  # noqa: BLE001
+        return False
+
+
+async def _close(client: WeaviateAsyncClient) -> None:
+    try:
+        await client.close()
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Closing a Weaviate client failed: %s", e)
+
+
+_pools: dict[tuple[str, str], WeaviateClientPool] = {}
+
+
+async def get_client_pool(
+    http_host: str = WEAVIATE_HTTP_HOST,
+    grpc_host: str = WEAVIATE_GRPC_HOST,
+) -> WeaviateClientPool:
+    """Get the started client pool of a Weaviate endpoint.
+
+    All services of the process share the pool of an endpoint. It is created
+    on first use, and again if the event loop it was started in has changed.
+
+    Args:
+        http_host: HTTP host of the Weaviate endpoint
+        grpc_host: gRPC host of the Weaviate endpoint
+
+    Returns:
+        The pool, with its clients connected
+
+    """
+    key = (http_host, grpc_host)
+    pool = _pools.get(key)
+    loop = asyncio.get_running_loop()
+    if pool is None or (pool.loop is not None and pool.loop is not loop):
+        pool = WeaviateClientPool(
+            functools.partial(instantiate_and_connect, http_host, grpc_host),
+        )
+        _pools[key] = pool
+    await pool.start()
+    return pool
@@ -6,9 +6,14 @@ handling collections, data operations, and query functionality with user isolati
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, cast
+import uuid as uuid_class
+from dataclasses import replace
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast, get_args
 
+from weaviate.classes.data import DataObject
 from weaviate.classes.query import MetadataQuery
 
 from hypha_startup_services.common.artifacts import (
@@ -22,69 +27,175 @@ from hypha_startup_services.common.permissions import (
     assert_is_admin_ws,
 )
 from hypha_startup_services.common.utils import (
+    batched,
     get_application_artifact_name,
     get_full_collection_name,
-    stringify_keys,
 )
 from hypha_startup_services.common.workspace_utils import ws_from_context
 from hypha_startup_services.weaviate_service.utils.collection_utils import (
-    acquire_collection,
     and_app_filter,
-    get_short_name,
+    create_ids_filter,
+    delete_application_objects,
     objects_part_coll_name,
+    query_defaults_of,
 )
 
+from .service_codecs import encode_columnar
 from .utils.artifact_utils import (
     create_application_artifact,
     create_collection_artifact,
     delete_application_artifact,
     delete_collection_artifacts,
+    set_application_query_defaults,
 )
 from .utils.collection_utils import (
     InsertManyReturn,
     add_tenant_if_not_exists,
+    delete_application_tenant,
+    invalid_object_error,
+    is_application_tenant,
     is_multitenancy_enabled,
+    scope_to_application,
     to_data_object,
 )
+from .utils.config_cache import config_cache, project_fields
+from .utils.filter_dsl import resolve_filter
 from .utils.format_utils import (
     add_app_id,
     collection_to_config_dict,
-    config_with_short_name,
     get_full_collection_names,
     get_settings_full_name,
 )
+from .utils.generation_cache import generation_cache
+from .utils.index_profiles import (
+    PERFORMANCE_PROFILES,
+    apply_performance_profile,
+    estimate_memory,
+)
+from .utils.insert_buffer import buffered_insert
+from .utils.jobs import JOB_BATCH_SIZE
+from .utils.models import (
+    AdmissionClassStats,
+    CollectionPartitioning,
+    ExistingObjectPolicy,
+    GenerationEvent,
+    GenerationMode,
+    QueryDefaults,
+    ResultFormat,
+)
+from .utils.query_utils import (
+    DEFAULT_QUERY_LIMIT,
+    DEFAULT_RRF_K,
+    ITERATE_DEFAULT_BATCH_SIZE,
+    FusionMethod,
+    belongs_to_application,
+    collapse_by_property,
+    fuse_ranked_lists,
+    grouped_fetch_limit,
+    select_within_token_budget,
+    truncate_text_properties,
+    with_return_property,
+)
 from .utils.service_utils import (
     MissingContextError,
     collection_exists,
     get_permitted_collection,
     prepare_application_creation,
     prepare_tenant_collection,
+    restore_collection_artifact,
     ws_app_exists,
 )
+from .utils.snippets import DEFAULT_SNIPPET_CHARS, extract_snippets
+from .utils.vector_utils import decode_vector, split_batch_vectors
 
 if TYPE_CHECKING:
-    import uuid as uuid_class
+    from collections.abc import AsyncGenerator, Coroutine, Mapping, Sequence
 
     from weaviate import WeaviateAsyncClient
+    from weaviate.collections import CollectionAsync
     from weaviate.collections.classes.batch import (
         BatchObjectReturn,
+        DeleteManyObject,
         DeleteManyReturn,
     )
     from weaviate.collections.classes.internal import (
         GenerativeReturn,
+        Object,
         QueryReturn,
     )
     from weaviate.collections.classes.types import WeaviateField
 
+    from .utils.admission import AdmissionController, EndpointClass
+    from .utils.jobs import JobManager
+    from .utils.vector_utils import BatchVectors
+
 logger = logging.getLogger(__name__)
 
+QUERY_TYPES: tuple[QueryType, ...] = ("near_vector", "fetch_objects", "hybrid")
+# Maximum number of queries accepted by a single query_batch call
+MAX_BATCH_QUERIES = 100
+# Maximum number of Weaviate queries a batch runs at the same time
+BATCH_MAX_CONCURRENCY = 8
+# Arguments of the per-target queries that a federated search sets itself
+FEDERATED_RESERVED_KWARGS = frozenset(
+    {
+        "query",
+        "limit",
+        "return_metadata",
+        "tenant_collection",
+        "query_type",
+        "application_id",
+    },
+)
+
+# Keyword arguments of data_insert that a buffered insert can carry over
+BUFFERED_INSERT_KWARGS = frozenset({"uuid", "vector", "references"})
+
+# Maximum number of concurrent Weaviate requests of one bulk data operation
+BULK_MAX_CONCURRENCY = 16
+# Number of UUIDs matched by a single delete_many or fetch_objects request
+BULK_ID_PAGE_SIZE = 1000
+
+# Maximum number of generative requests running at the same time by default
+GENERATION_MAX_CONCURRENCY = 4
+# Keyword arguments of generate.near_text() that only matter for generation
+GENERATIVE_KWARGS = (
+    "single_prompt",
+    "grouped_task",
+    "grouped_properties",
+    "generative_provider",
+)
+
+# Prompts run by every generation mode
+GENERATION_PROMPTS: dict[GenerationMode, tuple[str, ...]] = {
+    "single": ("single_prompt",),
+    "grouped": ("grouped_task",),
+    "both": ("single_prompt", "grouped_task"),
+    "none": (),
+}
+
+_default_generation_limiter = asyncio.Semaphore(GENERATION_MAX_CONCURRENCY)
+
+TenantTarget = tuple[str, str, str | None]
+
 if TYPE_CHECKING:
     from .utils.models import (
         ApplicationReturn,
+        BulkItemResult,
         CollectionConfig,
         DataDeleteManyReturn,
+        FederatedQueryReturn,
+        FederatedTarget,
         HyphaContext,
+        IterateBatch,
+        JobInfo,
+        JobResult,
+        MemoryEstimate,
+        PerformanceProfile,
         PermissionMap,
+        QueryBatchResult,
+        QuerySpec,
+        QueryType,
         ServiceQueryReturn,
     )
 
@@ -121,6 +232,7 @@ async def collections_create(
     client: WeaviateAsyncClient,
     settings: CollectionConfig,
     context: HyphaContext | None = None,
+    profile: PerformanceProfile | None = None,
 ) -> CollectionConfig:
     """Create a new collection.
 
@@ -128,10 +240,20 @@ async def collections_create(
     Adds workspace prefix to collection name before creating it.
     Creates a collection artifact to track the collection.
 
+    With `"partitioning": "application"` in the settings, every application
+    gets its own tenant per workspace instead of sharing the workspace tenant,
+    so vector searches of an application run unfiltered on its own index.
+    Multi-tenancy is enabled for such collections.
+
+    A performance profile ("low-memory", "balanced" or "max-recall") expands
+    into HNSW and vector compression settings; explicit index settings take
+    precedence over it.
+
     Args:
         client: WeaviateAsyncClient instance
         settings: Collection configuration settings
         context: Context containing caller information
+        profile: Optional performance profile of the vector indexes
 
     Returns:
         The collection configuration with the short collection name
@@ -143,29 +265,126 @@ async def collections_create(
     caller_ws = ws_from_context(context)
     assert_is_admin_ws(caller_ws)
 
-    await create_collection_artifact(settings)
+    if profile is not None:
+        settings = apply_performance_profile(settings, profile)
 
     settings_full_name = get_settings_full_name(settings)
+    partitioning = settings_full_name.pop("partitioning", "workspace")
+    if partitioning not in get_args(CollectionPartitioning):
+        error_msg = f"Unknown partitioning '{partitioning}'"
+        raise ValueError(error_msg)
+    if partitioning == "application":
+        multi_tenancy = settings_full_name.get("multiTenancyConfig", {})
+        if multi_tenancy.get("enabled") is False:
+            error_msg = "Partitioning by application requires multi-tenancy"
+            raise ValueError(error_msg)
+        settings_full_name["multiTenancyConfig"] = {**multi_tenancy, "enabled": True}
+
+    await create_collection_artifact(settings)
+
     collection = await client.collections.create_from_dict(  # type: ignore[reportUnknownMemberType]
         cast("dict[str, Any]", settings_full_name),
     )
+    config_cache.invalidate(settings_full_name["class"])
 
     return await collection_to_config_dict(collection)
 
 
+async def collections_restore_artifact(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    partitioning: CollectionPartitioning = "workspace",
+    context: HyphaContext | None = None,
+) -> CollectionConfig:
+    """Recreate the lost artifact of a collection.
+
+    Verifies that the caller has admin permissions. The partitioning cannot
+    be read back from Weaviate, so it is stated by the caller.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Short collection name
+        partitioning: How applications of the collection map to tenants
+        context: Context containing caller information
+
+    Returns:
+        The settings stored in the artifact
+
+    Raises:
+        ValueError: If the collection does not exist or already has an
+            artifact, or the partitioning does not fit the collection
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    caller_ws = ws_from_context(context)
+    assert_is_admin_ws(caller_ws)
+
+    if partitioning not in get_args(CollectionPartitioning):
+        error_msg = f"Unknown partitioning '{partitioning}'"
+        raise ValueError(error_msg)
+    if not await collection_exists(client, collection_name):
+        error_msg = f"Collection '{collection_name}' does not exist."
+        raise ValueError(error_msg)
+    if await artifact_exists(get_full_collection_name(collection_name)):
+        error_msg = f"Collection '{collection_name}' already has an artifact."
+        raise ValueError(error_msg)
+    if partitioning == "application" and not await is_multitenancy_enabled(
+        client,
+        collection_name,
+    ):
+        error_msg = "Partitioning by application requires multi-tenancy"
+        raise ValueError(error_msg)
+
+    return await restore_collection_artifact(client, collection_name, partitioning)
+
+
+async def collections_estimate_memory(
+    client: WeaviateAsyncClient,  # noqa: ARG001
+    object_count: int,
+    dimensions: int,
+    profile: PerformanceProfile | None = None,
+    context: HyphaContext | None = None,  # noqa: ARG001
+) -> dict[str, MemoryEstimate]:
+    """Estimate the memory footprint of a vector index per performance profile.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        object_count: Number of objects (vectors) in the index
+        dimensions: Number of vector dimensions
+        profile: Optional profile to estimate (all profiles if None)
+        context: Context containing caller information
+
+    Returns:
+        Dictionary mapping profile names to estimated memory and disk usage
+
+    """
+    profiles = [profile] if profile is not None else list(PERFORMANCE_PROFILES)
+    return {name: estimate_memory(object_count, dimensions, name) for name in profiles}
+
+
 async def collections_list_all(
     client: WeaviateAsyncClient,
     context: HyphaContext | None = None,
-) -> dict[str, CollectionConfig]:
+    *,
+    simple: bool = False,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
     """List all collections in the database.
 
     Verifies that the caller has admin permissions.
     Retrieves all collections and converts their names to short names
-    (without workspace prefix).
+    (without workspace prefix). Configurations are served from the collection
+    config cache, so repeated listings do not download every schema again.
 
     Args:
         client: WeaviateAsyncClient instance
         context: Context containing caller information
+        simple: Whether to return summaries (name, description, multi_tenancy,
+            properties, vectors and a version stamp that changes with the
+            schema) instead of full configurations
+        fields: Optional top-level fields to keep of every configuration
 
     Returns:
         Dictionary mapping short collection names to their configuration
@@ -177,11 +396,10 @@ async def collections_list_all(
     caller_ws = ws_from_context(context)
     assert_is_admin_ws(caller_ws)
 
-    collections = await client.collections.list_all(simple=False)
-    return {
-        get_short_name(coll_name): config_with_short_name(coll_obj)
-        for coll_name, coll_obj in collections.items()
-    }
+    collections = await config_cache.list_all(client, simple=simple)
+    if fields is not None:
+        return project_fields(collections, fields)
+    return collections
 
 
 async def collections_get(
@@ -204,8 +422,7 @@ async def collections_get(
     caller_ws = ws_from_context(context)
     await assert_has_collection_permission(caller_ws, name)
 
-    collection = acquire_collection(client, name)
-    return await collection_to_config_dict(collection)
+    return await config_cache.get_dict(client, get_full_collection_name(name))
 
 
 async def collections_delete(
@@ -239,6 +456,8 @@ async def collections_delete(
 
     full_names = get_full_collection_names(short_names)
     await client.collections.delete(full_names)
+    for full_name in full_names:
+        config_cache.invalidate(full_name)
     await delete_collection_artifacts(short_names)
 
 
@@ -278,6 +497,8 @@ async def applications_create(
     description: str,
     user_ws: str | None = None,
     context: HyphaContext | None = None,
+    *,
+    query_defaults: QueryDefaults | None = None,
 ) -> ApplicationReturn:
     """Create a new application.
 
@@ -291,6 +512,8 @@ async def applications_create(
         description: Description of the application
         user_ws: Workspace ID of the user creating the application
         context: Context containing user information
+        query_defaults: Query options (return_properties, include_vector,
+            max_text_chars, max_text_tokens) used when a query omits them
 
     Returns:
         Dictionary with application details and artifact information
@@ -303,18 +526,15 @@ async def applications_create(
     if user_ws is None:
         user_ws = caller_ws
 
-    await prepare_application_creation(client, collection_name, user_ws)
+    if query_defaults is not None:
+        _validate_query_defaults(query_defaults)
 
-    # Ensure collection artifact exists
-    full_collection_name = get_full_collection_name(collection_name)
-    if not await artifact_exists(full_collection_name):
-        logger.info(
-            "Collection artifact for '%s' missing, creating it.",
-            collection_name,
-        )
-        collection_obj = client.collections.get(full_collection_name)
-        collection_config = await collection_to_config_dict(collection_obj)
-        await create_collection_artifact(collection_config)
+    await prepare_application_creation(
+        client,
+        collection_name,
+        user_ws,
+        application_id,
+    )
 
     result = await create_application_artifact(
         collection_name,
@@ -322,6 +542,7 @@ async def applications_create(
         description,
         user_ws,
         caller_ws=caller_ws,
+        query_defaults=query_defaults,
     )
 
     return cast(
@@ -346,7 +567,11 @@ async def applications_delete(
 ) -> DataDeleteManyReturn:
     """Delete an application by ID from the collection.
 
-    Deletes the application artifact and all associated objects in the collection.
+    Deletes all associated objects in the collection in bounded pages (or the
+    application's tenant, if the collection is partitioned by application),
+    then the application artifact. The artifact is only deleted once no objects are
+    left, so an interrupted deletion is resumed by calling this again. Use
+    applications.submit_delete_job for applications too large for one call.
 
     Args:
         client: WeaviateAsyncClient instance
@@ -377,15 +602,31 @@ async def applications_delete(
             client,
             collection_name,
             user_ws,
+            application_id,
         )
 
-    result = await data_delete_many(
+    tenant_collection = await prepare_tenant_collection(
         client,
         collection_name,
         application_id,
         user_ws=user_ws,
         context=context,
     )
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        if is_application_tenant(tenant_collection):
+            result = await delete_application_tenant(
+                client,
+                collection_name,
+                tenant_collection,
+            )
+        else:
+            result = await delete_application_objects(
+                tenant_collection,
+                application_id,
+            )
 
     if context is None:
         raise MissingContextError
@@ -397,6 +638,81 @@ async def applications_delete(
     return result
 
 
+async def applications_submit_delete_job(
+    client: WeaviateAsyncClient,
+    job_manager: JobManager,
+    collection_name: str,
+    application_id: str,
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+) -> JobInfo:
+    """Delete an application by ID from the collection in a background job.
+
+    Verifies the caller's permissions before returning, then deletes the
+    application's objects page by page and finally its artifact. The artifact
+    is only deleted once no objects are left, so a failed or interrupted job
+    is resumed by submitting it again. Use the jobs endpoints with the
+    returned job ID to follow the progress.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        job_manager: Job manager running the deletion
+        collection_name: Name of the collection containing the application
+        application_id: ID of the application to delete
+        user_ws: Workspace ID of the user deleting the application
+        context: Context containing user information
+
+    Returns:
+        Information about the submitted job, including its ID
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+    aggregate = await tenant_collection.aggregate.over_all(
+        filters=and_app_filter(application_id),
+        total_count=True,
+    )
+
+    caller_ws = ws_from_context(context)
+    full_collection_name = get_full_collection_name(collection_name)
+
+    async def _delete_artifact() -> None:
+        if is_application_tenant(tenant_collection):
+            with generation_cache.invalidating(full_collection_name, application_id):
+                await delete_application_tenant(
+                    client,
+                    collection_name,
+                    tenant_collection,
+                )
+        await delete_application_artifact(
+            full_collection_name,
+            application_id,
+            caller_ws,
+        )
+
+    return job_manager.submit_delete(
+        tenant_collection,
+        owner_ws=caller_ws,
+        collection_name=collection_name,
+        application_id=application_id,
+        total_objects=aggregate.total_count or 0,
+        on_deleted=_delete_artifact,
+        on_written=partial(
+            generation_cache.invalidate,
+            full_collection_name,
+            application_id,
+        ),
+    )
+
+
 async def applications_get(
     client: WeaviateAsyncClient,
     collection_name: str,
@@ -582,6 +898,58 @@ async def applications_set_permissions(
     )
 
 
+def _validate_query_defaults(query_defaults: QueryDefaults) -> None:
+    """Check that query defaults only hold known options with valid limits."""
+    unknown = set(query_defaults) - set(QueryDefaults.__annotations__)
+    if unknown:
+        error_msg = (
+            f"Unknown query defaults: {', '.join(sorted(unknown))}. "
+            f"Available: {', '.join(QueryDefaults.__annotations__)}"
+        )
+        raise ValueError(error_msg)
+
+    for key in ("max_text_chars", "max_text_tokens"):
+        limit = query_defaults.get(key)
+        if limit is not None and limit < 1:
+            error_msg = f"{key} must be at least 1"
+            raise ValueError(error_msg)
+
+
+async def applications_set_query_defaults(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    query_defaults: QueryDefaults,
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+) -> None:
+    """Set the query options an application uses when a query omits them.
+
+    Applies to query.fetch_objects, query.hybrid, query.near_vector and
+    query.batch. Options passed to a query, including None, take precedence.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection containing the application
+        application_id: ID of the application
+        query_defaults: Default return_properties, include_vector,
+            max_text_chars and max_text_tokens. Replaces the previous defaults.
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+
+    """
+    _validate_query_defaults(query_defaults)
+
+    artifact_name = await applications_get_artifact(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+    await set_application_query_defaults(artifact_name, query_defaults)
+
+
 async def data_insert_many(
     client: WeaviateAsyncClient,
     collection_name: str,
@@ -594,6 +962,10 @@ async def data_insert_many(
     context: HyphaContext | None = None,
     *,
     enable_chunking: bool = False,
+    idempotent: bool = False,
+    id_property: str | None = None,
+    on_existing: ExistingObjectPolicy = "skip",
+    vectors: BatchVectors | None = None,
 ) -> InsertManyReturn:
     """Insert multiple objects into the collection.
 
@@ -601,6 +973,14 @@ async def data_insert_many(
     Automatically adds application_id to each object before insertion.
     Optionally chunks text content for better vector search performance.
 
+    In idempotent mode, objects without a UUID get a deterministic UUIDv5
+    derived from the application and `id_property` (or a hash of their
+    properties), so retried inserts address the same objects. Objects that
+    already exist are skipped, or overwritten if `on_existing` is "update".
+    Neither re-vectorizes them: updated objects without a vector of their own
+    keep their stored vectors. Objects without a value for `id_property` are
+    reported in `errors` instead of being inserted.
+
     Args:
         client: WeaviateAsyncClient instance
         collection_name: Name of the collection to insert into
@@ -612,11 +992,20 @@ async def data_insert_many(
         chunk_size: Maximum number of tokens per chunk (if chunking enabled)
         chunk_overlap: Number of tokens to overlap between chunks (if chunking enabled)
         text_field: Name of the field containing text to chunk
+        idempotent: Whether to derive deterministic UUIDs and skip existing objects
+        id_property: Property holding a unique key (content hash if None)
+        on_existing: "skip" or "update" objects that already exist (idempotent),
+            keeping their stored vectors
+        vectors: Vectors of all objects as one float array (NumPy or packed
+            bytes) with a row per object, or a dictionary of such arrays by
+            vector name. Rows are passed on without converting them to lists.
 
     Returns:
-        Dictionary with insertion results including UUIDs and any errors
+        Dictionary with insertion results including UUIDs and any errors.
+        In idempotent mode, `skipped` lists the indices of existing objects.
 
     """
+    _validate_existing_policy(on_existing)
     tenant_collection = await prepare_tenant_collection(
         client,
         collection_name,
@@ -625,7 +1014,111 @@ async def data_insert_many(
         context=context,
     )
 
-    # Process objects with optional chunking
+    data_objects, invalid = _to_insert_objects(
+        objects,
+        application_id,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        text_field=text_field,
+        enable_chunking=enable_chunking,
+        idempotent=idempotent,
+        id_property=id_property,
+        vectors=vectors,
+    )
+    result = InsertManyReturn(
+        elapsed_seconds=0.0,
+        errors={
+            str(position): invalid_object_error(tenant_collection, position, message)
+            for position, message in invalid.items()
+        },
+        uuids={},
+        has_errors=bool(invalid),
+    )
+
+    if idempotent and on_existing == "skip":
+        existing = await _existing_uuids(
+            tenant_collection,
+            application_id,
+            [cast("uuid_class.UUID", obj.uuid) for _, obj in data_objects],
+        )
+        result["skipped"] = [
+            str(position) for position, obj in data_objects if str(obj.uuid) in existing
+        ]
+        result["uuids"].update(
+            (str(position), cast("uuid_class.UUID", obj.uuid))
+            for position, obj in data_objects
+            if str(obj.uuid) in existing
+        )
+        data_objects = [
+            (position, obj)
+            for position, obj in data_objects
+            if str(obj.uuid) not in existing
+        ]
+    elif idempotent:
+        updated = await _with_stored_vectors(
+            tenant_collection,
+            application_id,
+            [obj for _, obj in data_objects],
+        )
+        data_objects = [
+            (position, obj)
+            for (position, _), obj in zip(data_objects, updated, strict=True)
+        ]
+
+    if data_objects:
+        with generation_cache.invalidating(
+            get_full_collection_name(collection_name),
+            application_id,
+        ):
+            response: BatchObjectReturn = await tenant_collection.data.insert_many(
+                objects=[obj for _, obj in data_objects],
+            )
+        result["elapsed_seconds"] = response.elapsed_seconds
+        result["errors"].update(
+            (str(data_objects[int(index)][0]), error)
+            for index, error in response.errors.items()
+        )
+        result["uuids"].update(
+            (str(data_objects[int(index)][0]), uuid)
+            for index, uuid in response.uuids.items()
+        )
+        result["has_errors"] = result["has_errors"] or response.has_errors
+
+    return result
+
+
+def _to_insert_objects(
+    objects: list[dict[str, Any]],
+    application_id: str,
+    *,
+    chunk_size: int,
+    chunk_overlap: int,
+    text_field: str,
+    enable_chunking: bool,
+    idempotent: bool = False,
+    id_property: str | None = None,
+    vectors: BatchVectors | None = None,
+) -> tuple[list[tuple[int, DataObject[Any, Any]]], dict[int, str]]:
+    """Chunk objects if requested and convert them to application data objects.
+
+    In idempotent mode, objects without a UUID get a deterministic one. Rows of
+    the batch `vectors` are assigned to the objects before chunking.
+
+    Returns:
+        The data objects with their position among all (chunked) objects, and
+        error messages by position of objects whose UUID cannot be derived
+
+    """
+    if vectors is not None:
+        objects = [
+            {**obj, "vector": vector}
+            for obj, vector in zip(
+                objects,
+                split_batch_vectors(vectors, len(objects)),
+                strict=True,
+            )
+        ]
+
     if enable_chunking:
         chunked_objects: list[dict[str, Any]] = []
         for obj in objects:
@@ -647,58 +1140,155 @@ async def data_insert_many(
         processed_objects = objects
 
     app_objects = add_app_id(processed_objects, application_id)
-    data_objects = [to_data_object(obj) for obj in app_objects]
+    uuid_namespace = application_id if idempotent else None
+    data_objects: list[tuple[int, DataObject[Any, Any]]] = []
+    invalid: dict[int, str] = {}
+    for position, obj in enumerate(app_objects):
+        try:
+            data_object = to_data_object(
+                obj,
+                uuid_namespace=uuid_namespace,
+                id_property=id_property,
+            )
+        except ValueError as e:
+            invalid[position] = str(e)
+        else:
+            data_objects.append((position, data_object))
+    return data_objects, invalid
+
+
+def _validate_existing_policy(on_existing: str) -> None:
+    """Raise ValueError if `on_existing` is not a known policy."""
+    if on_existing not in get_args(ExistingObjectPolicy):
+        error_msg = (
+            f"Unknown on_existing policy {on_existing!r}. "
+            f"Use one of: {', '.join(get_args(ExistingObjectPolicy))}"
+        )
+        raise ValueError(error_msg)
 
-    response: BatchObjectReturn = await tenant_collection.data.insert_many(
-        objects=data_objects,
-    )
 
-    return InsertManyReturn(
-        elapsed_seconds=response.elapsed_seconds,
-        errors=stringify_keys(response.errors),
-        uuids=stringify_keys(response.uuids),
-        has_errors=response.has_errors,
-    )
+async def _existing_uuids(
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    uuids: list[uuid_class.UUID],
+) -> set[str]:
+    """Look up which UUIDs exist in the application, in ID-filtered pages."""
+    found: set[str] = set()
+    for page in batched(uuids, BULK_ID_PAGE_SIZE):
+        response = cast(
+            "QueryReturn[object, object]",
+            await tenant_collection.query.fetch_objects(
+                filters=and_app_filter(application_id, create_ids_filter(page)),
+                limit=len(page),
+                return_properties=[],
+            ),
+        )
+        found.update(str(obj.uuid) for obj in response.objects)
+    return found
 
 
-async def data_insert(
+async def _with_stored_vectors(
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    data_objects: list[DataObject[Any, Any]],
+) -> list[DataObject[Any, Any]]:
+    """Give objects that already exist and bring no vector their stored vectors.
+
+    Overwriting an object with its stored vectors keeps Weaviate from
+    vectorizing it again.
+    """
+    missing = [
+        cast("uuid_class.UUID", obj.uuid) for obj in data_objects if obj.vector is None
+    ]
+    stored: dict[str, Any] = {}
+    for page in batched(missing, BULK_ID_PAGE_SIZE):
+        response = cast(
+            "QueryReturn[object, object]",
+            await tenant_collection.query.fetch_objects(
+                filters=and_app_filter(application_id, create_ids_filter(page)),
+                limit=len(page),
+                return_properties=[],
+                include_vector=True,
+            ),
+        )
+        stored.update(
+            (str(obj.uuid), _insert_vector(obj.vector))
+            for obj in response.objects
+            if obj.vector
+        )
+    return [
+        replace(obj, vector=stored[str(obj.uuid)])
+        if obj.vector is None and str(obj.uuid) in stored
+        else obj
+        for obj in data_objects
+    ]
+
+
+def _insert_vector(vector: dict[str, Any]) -> Any:
+    """Convert vectors returned by a query into vectors accepted on insert.
+
+    Collections with a single unnamed vector return it as "default".
+    """
+    if set(vector) == {"default"}:
+        return vector["default"]
+    return vector
+
+
+async def data_submit_insert_job(
     client: WeaviateAsyncClient,
+    job_manager: JobManager,
     collection_name: str,
     application_id: str,
-    properties: dict[str, Any],
+    objects: list[dict[str, Any]],
     user_ws: str | None = None,
-    chunk_size: int = 512,
-    chunk_overlap: int = 50,
-    text_field: str = "text",
     context: HyphaContext | None = None,
     *,
     enable_chunking: bool = False,
-    **kwargs: Any,
-) -> uuid_class.UUID:
-    """Insert a single object into the collection.
-
-    Gets a tenant-specific collection after verifying permissions.
-    Automatically adds application_id to the object before insertion.
-    Optionally chunks text content for better vector search performance.
-    Forwards all kwargs to collection.data.insert().
+    chunk_size: int = 512,
+    chunk_overlap: int = 50,
+    text_field: str = "text",
+    batch_size: int = JOB_BATCH_SIZE,
+    idempotent: bool = False,
+    id_property: str | None = None,
+    on_existing: ExistingObjectPolicy = "skip",
+    vectors: BatchVectors | None = None,
+) -> JobInfo:
+    """Insert multiple objects into the collection in a background job.
+
+    Verifies the application and the caller's permissions before returning,
+    then inserts the objects in batches after the call has returned. Use the
+    jobs endpoints with the returned job ID to follow the progress. The
+    idempotent mode works as in data_insert_many, with existing objects
+    looked up batch by batch.
 
     Args:
         client: WeaviateAsyncClient instance
+        job_manager: Job manager running the ingest
         collection_name: Name of the collection to insert into
-        application_id: ID of the application the object belongs to
-        properties: Object properties to insert
+        application_id: ID of the application the objects belong to
+        objects: List of objects to insert
         user_ws: Optional user workspace to use as tenant (if different from caller)
         context: Context containing caller information
         enable_chunking: Whether to chunk text content
         chunk_size: Maximum number of tokens per chunk (if chunking enabled)
         chunk_overlap: Number of tokens to overlap between chunks (if chunking enabled)
         text_field: Name of the field containing text to chunk
-        **kwargs: Additional arguments to pass to insert()
+        batch_size: Number of objects per insert_many request
+        idempotent: Whether to derive deterministic UUIDs and skip existing objects
+        id_property: Property holding a unique key (content hash if None)
+        on_existing: "skip" or "update" objects that already exist (idempotent),
+            keeping their stored vectors
+        vectors: Vectors of all objects with a row per object, as in
+            data_insert_many
 
     Returns:
-        UUID of the inserted object (or first chunk if chunking enabled)
+        Information about the submitted job, including its ID
 
     """
+    if context is None:
+        raise MissingContextError
+
+    _validate_existing_policy(on_existing)
     tenant_collection = await prepare_tenant_collection(
         client,
         collection_name,
@@ -707,113 +1297,1186 @@ async def data_insert(
         context=context,
     )
 
-    if enable_chunking and text_field in properties and properties[text_field]:
-        # For single insert with chunking, use data_insert_many and return first UUID
-        result = await data_insert_many(
-            client=client,
-            collection_name=collection_name,
-            application_id=application_id,
-            objects=[properties],
-            user_ws=user_ws,
-            context=context,
-            enable_chunking=True,
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            text_field=text_field,
-        )
-        # Return the first UUID from the chunked inserts
-        if result.get("uuids"):
-            return next(iter(result["uuids"].values()))
-
-        error_msg = "No UUIDs returned from chunked insert"
-        raise RuntimeError(error_msg)
+    data_objects, invalid = _to_insert_objects(
+        objects,
+        application_id,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        text_field=text_field,
+        enable_chunking=enable_chunking,
+        idempotent=idempotent,
+        id_property=id_property,
+        vectors=vectors,
+    )
 
-    app_properties = cast("dict[str, WeaviateField]", properties).copy()
-    app_properties["application_id"] = application_id
+    async def _find_existing(batch: list[DataObject[Any, Any]]) -> set[str]:
+        return await _existing_uuids(
+            tenant_collection,
+            application_id,
+            [cast("uuid_class.UUID", obj.uuid) for obj in batch],
+        )
 
-    return await tenant_collection.data.insert(app_properties, **kwargs)
+    return job_manager.submit_insert(
+        tenant_collection,
+        data_objects,
+        owner_ws=ws_from_context(context),
+        collection_name=collection_name,
+        application_id=application_id,
+        batch_size=batch_size,
+        find_existing=_find_existing if idempotent and on_existing == "skip" else None,
+        prepare_batch=(
+            partial(_with_stored_vectors, tenant_collection, application_id)
+            if idempotent and on_existing == "update"
+            else None
+        ),
+        invalid=invalid,
+        on_written=partial(
+            generation_cache.invalidate,
+            get_full_collection_name(collection_name),
+            application_id,
+        ),
+    )
 
 
-async def query_near_vector(
-    client: WeaviateAsyncClient,
-    collection_name: str,
-    application_id: str,
-    user_ws: str | None = None,
+async def jobs_status(
+    job_manager: JobManager,
+    job_id: str,
     context: HyphaContext | None = None,
-    return_metadata: dict[str, bool] | None = None,
-    **kwargs: Any,
-) -> ServiceQueryReturn:
-    """Query the collection using vector similarity search.
-
-    Gets a tenant-specific collection after verifying permissions.
-    Automatically adds application_id filter to limit results to the specified
-    application. Forwards all kwargs to collection.query.near_vector().
+) -> JobInfo:
+    """Get the progress, throughput and errors of a background job.
 
     Args:
-        client: WeaviateAsyncClient instance
-        collection_name: Name of the collection to query
-        application_id: ID of the application to filter results by
+        job_manager: Job manager running the job
+        job_id: ID of the job
+        context: Context containing caller information
+
+    Returns:
+        Information about the job
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    return job_manager.status(job_id, ws_from_context(context))
+
+
+async def jobs_cancel(
+    job_manager: JobManager,
+    job_id: str,
+    context: HyphaContext | None = None,
+) -> JobInfo:
+    """Cancel a background job. Objects inserted or deleted so far stay so.
+
+    Args:
+        job_manager: Job manager running the job
+        job_id: ID of the job
+        context: Context containing caller information
+
+    Returns:
+        Information about the job
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    return job_manager.cancel(job_id, ws_from_context(context))
+
+
+async def jobs_result(
+    job_manager: JobManager,
+    job_id: str,
+    context: HyphaContext | None = None,
+) -> JobResult:
+    """Get the outcome and inserted UUIDs of a finished background job.
+
+    Args:
+        job_manager: Job manager running the job
+        job_id: ID of the job
+        context: Context containing caller information
+
+    Returns:
+        Job information with the UUIDs keyed by object index
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    return job_manager.result(job_id, ws_from_context(context))
+
+
+async def admission_stats(
+    admission: AdmissionController,
+    context: HyphaContext | None = None,  # noqa: ARG001
+) -> dict[EndpointClass, AdmissionClassStats]:
+    """Get the load of the service per endpoint class.
+
+    Args:
+        admission: Admission controller of the service
+        context: Context containing caller information
+
+    Returns:
+        Running, queued, admitted and rejected calls and queue times in
+        seconds per endpoint class
+
+    """
+    return admission.stats()
+
+
+async def data_insert(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    properties: dict[str, Any],
+    user_ws: str | None = None,
+    chunk_size: int = 512,
+    chunk_overlap: int = 50,
+    text_field: str = "text",
+    context: HyphaContext | None = None,
+    *,
+    enable_chunking: bool = False,
+    buffered: bool = False,
+    **kwargs: Any,
+) -> uuid_class.UUID:
+    """Insert a single object into the collection.
+
+    Gets a tenant-specific collection after verifying permissions.
+    Automatically adds application_id to the object before insertion.
+    Optionally chunks text content for better vector search performance.
+    Forwards all kwargs to collection.data.insert().
+
+    With `buffered`, the object is queued in a write-behind buffer shared by
+    all buffered inserts of the same caller into the same application and
+    tenant. The buffer writes its objects with a single insert_many once it
+    is full or after a short delay, and the call returns once the object's
+    batch has been written.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection to insert into
+        application_id: ID of the application the object belongs to
+        properties: Object properties to insert
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+        enable_chunking: Whether to chunk text content
+        chunk_size: Maximum number of tokens per chunk (if chunking enabled)
+        chunk_overlap: Number of tokens to overlap between chunks (if chunking enabled)
+        text_field: Name of the field containing text to chunk
+        buffered: Whether to coalesce the insert with concurrent buffered inserts
+        **kwargs: Additional arguments to pass to insert()
+
+    Returns:
+        UUID of the inserted object (or first chunk if chunking enabled)
+
+    """
+    if buffered:
+        return await _data_insert_buffered(
+            client,
+            collection_name,
+            application_id,
+            properties,
+            user_ws=user_ws,
+            context=context,
+            enable_chunking=enable_chunking,
+            **kwargs,
+        )
+
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    if enable_chunking and text_field in properties and properties[text_field]:
+        # For single insert with chunking, use data_insert_many and return first UUID
+        result = await data_insert_many(
+            client=client,
+            collection_name=collection_name,
+            application_id=application_id,
+            objects=[properties],
+            user_ws=user_ws,
+            context=context,
+            enable_chunking=True,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            text_field=text_field,
+        )
+        # Return the first UUID from the chunked inserts
+        if result.get("uuids"):
+            return next(iter(result["uuids"].values()))
+
+        error_msg = "No UUIDs returned from chunked insert"
+        raise RuntimeError(error_msg)
+
+    app_properties = cast("dict[str, WeaviateField]", properties).copy()
+    app_properties["application_id"] = application_id
+
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        return await tenant_collection.data.insert(app_properties, **kwargs)
+
+
+async def _data_insert_buffered(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    properties: dict[str, Any],
+    *,
+    user_ws: str | None,
+    context: HyphaContext | None,
+    enable_chunking: bool,
+    **kwargs: Any,
+) -> uuid_class.UUID:
+    if context is None:
+        raise MissingContextError
+
+    if enable_chunking:
+        error_msg = "Buffered inserts do not support chunking"
+        raise ValueError(error_msg)
+
+    unsupported = set(kwargs) - BUFFERED_INSERT_KWARGS
+    if unsupported:
+        error_msg = f"Unsupported arguments for buffered insert: {sorted(unsupported)}"
+        raise ValueError(error_msg)
+
+    caller_ws = ws_from_context(context)
+    tenant_ws = user_ws or caller_ws
+
+    app_properties = cast("dict[str, WeaviateField]", properties).copy()
+    app_properties["application_id"] = application_id
+
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        return await buffered_insert(
+            (collection_name, application_id, tenant_ws, caller_ws),
+            partial(
+                prepare_tenant_collection,
+                client,
+                collection_name,
+                application_id,
+                user_ws=user_ws,
+                context=context,
+            ),
+            DataObject(properties=app_properties, **kwargs),
+        )
+
+
+def _prepare_grouping(
+    kwargs: dict[str, Any],
+    group_by_property: str | None,
+    group_size: int,
+) -> int | None:
+    """Rewrite query kwargs to over-fetch candidates for grouped results.
+
+    Returns:
+        The number of groups the caller asked for (the original limit)
+
+    """
+    limit = cast("int | None", kwargs.get("limit"))
+    if group_by_property is None:
+        return limit
+
+    kwargs["limit"] = grouped_fetch_limit(limit, group_size)
+    kwargs["return_properties"] = with_return_property(
+        kwargs.get("return_properties"),
+        group_by_property,
+    )
+    return limit
+
+
+async def _execute_query(
+    tenant_collection: CollectionAsync,
+    query_type: QueryType,
+    application_id: str,
+    *,
+    return_metadata: dict[str, bool] | None = None,
+    group_by_property: str | None = None,
+    group_size: int = 1,
+    result_format: ResultFormat = "objects",
+    snippet_property: str | None = None,
+    snippet_chars: int = DEFAULT_SNIPPET_CHARS,
+    **kwargs: Any,
+) -> ServiceQueryReturn:
+    """Run a query on an already prepared tenant collection.
+
+    Fills in the application's query defaults, compiles DSL filters, scopes
+    them to the application, converts `return_metadata` and applies optional
+    grouping before forwarding kwargs to collection.query.<query_type>().
+    With `snippet_property`, that text property is replaced by the snippet
+    best matching the query. String properties are then truncated to
+    `max_text_chars` characters and `max_text_tokens` tokens if given.
+
+    Returns:
+        Dictionary containing objects with shortened collection names, encoded
+        column by column if `result_format` is "columnar"
+
+    """
+    if result_format not in get_args(ResultFormat):
+        error_msg = (
+            f"Unknown result format {result_format!r}. Use 'objects' or 'columnar'."
+        )
+        raise ValueError(error_msg)
+
+    kwargs = {**query_defaults_of(tenant_collection), **kwargs}
+    max_text_chars = kwargs.pop("max_text_chars", None)
+    max_text_tokens = kwargs.pop("max_text_tokens", None)
+
+    snippet_query = kwargs.get("query")
+    if snippet_property is not None:
+        if not isinstance(snippet_query, str):
+            error_msg = "Snippets need a text query"
+            raise ValueError(error_msg)
+        kwargs["return_properties"] = with_return_property(
+            kwargs.get("return_properties"),
+            snippet_property,
+        )
+
+    kwargs["filters"] = scope_to_application(
+        tenant_collection,
+        application_id,
+        resolve_filter(kwargs.get("filters")),
+    )
+
+    if "near_vector" in kwargs:
+        kwargs["near_vector"] = decode_vector(kwargs["near_vector"])
+
+    if return_metadata:
+        kwargs["return_metadata"] = MetadataQuery(**return_metadata)
+
+    group_limit = _prepare_grouping(kwargs, group_by_property, group_size)
+
+    query_method = getattr(tenant_collection.query, query_type)
+    response = cast(
+        "QueryReturn[object, object]",  # NOSONAR (S1192) Repeated literal necessary
+        await query_method(**kwargs),
+    )
+
+    objects = response.objects
+    if group_by_property is not None:
+        objects = collapse_by_property(
+            objects,
+            group_by_property,
+            group_limit,
+            group_size,
+        )
+
+    objects = objects_part_coll_name(objects)
+    if snippet_property is not None:
+        objects = extract_snippets(
+            objects,
+            cast("str", snippet_query),
+            snippet_property,
+            snippet_chars,
+        )
+    objects = truncate_text_properties(
+        objects,
+        max_chars=max_text_chars,
+        max_tokens=max_text_tokens,
+    )
+    if result_format == "columnar":
+        metadata_fields = [
+            field for field, wanted in (return_metadata or {}).items() if wanted
+        ]
+        return {"objects": encode_columnar(objects, metadata_fields)}
+
+    return {
+        "objects": objects,
+    }
+
+
+async def query_near_vector(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+    return_metadata: dict[str, bool] | None = None,
+    *,
+    group_by_property: str | None = None,
+    group_size: int = 1,
+    result_format: ResultFormat = "objects",
+    **kwargs: Any,
+) -> ServiceQueryReturn:
+    """Query the collection using vector similarity search.
+
+    Gets a tenant-specific collection after verifying permissions.
+    Automatically adds application_id filter to limit results to the specified
+    application. Forwards all kwargs to collection.query.near_vector().
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection to query
+        application_id: ID of the application to filter results by
         user_ws: Optional user workspace to use as tenant (if different from caller)
         context: Context containing caller information
         return_metadata: Dictionary of specific metadata fields to return
+        group_by_property: Property holding a parent key (e.g. a document ID).
+            If set, `limit` counts distinct parents instead of objects.
+        group_size: Number of best-ranked objects kept per parent when grouping
+        result_format: "objects" for a list of objects, or "columnar" for one
+            array per field with vectors packed as binary buffers
         **kwargs: Additional arguments to pass to near_vector()
 
     Returns:
-        Dictionary containing objects with shortened collection names
+        Dictionary containing objects with shortened collection names
+
+    """
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    return await _execute_query(
+        tenant_collection,
+        "near_vector",
+        application_id,
+        return_metadata=return_metadata,
+        result_format=result_format,
+        group_by_property=group_by_property,
+        group_size=group_size,
+        **kwargs,
+    )
+
+
+async def query_fetch_objects(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+    *,
+    return_metadata: dict[str, bool] | None = None,
+    result_format: ResultFormat = "objects",
+    **kwargs: Any,
+) -> ServiceQueryReturn:
+    """Query the collection to fetch objects based on filters.
+
+    Gets a tenant-specific collection after verifying permissions.
+    Automatically adds application_id filter to limit results to the specified
+    application. Forwards all kwargs to collection.query.fetch_objects().
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection to query
+        application_id: ID of the application to filter results by (optional)
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+        return_metadata: Dictionary of specific metadata fields to return
+        result_format: "objects" for a list of objects, or "columnar" for one
+            array per field with vectors packed as binary buffers
+        **kwargs: Additional arguments to pass to fetch_objects()
+
+    Returns:
+        Dictionary containing objects with shortened collection names
+
+    """
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    return await _execute_query(
+        tenant_collection,
+        "fetch_objects",
+        application_id,
+        return_metadata=return_metadata,
+        result_format=result_format,
+        **kwargs,
+    )
+
+
+async def query_iterate(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+    *,
+    batch_size: int = ITERATE_DEFAULT_BATCH_SIZE,
+    cursor: str | None = None,
+    return_properties: list[str] | None = None,
+    include_vector: bool | list[str] = False,
+) -> AsyncGenerator[IterateBatch, None]:
+    """Stream all objects of an application in batches using a UUID cursor.
+
+    Gets a tenant-specific collection after verifying permissions.
+    Walks the tenant with Weaviate's `after` cursor, so every page costs the same
+    regardless of how far the scan has progressed. Weaviate does not support
+    filters together with `after`, so objects of other applications are skipped
+    by the service: a full iteration reads every object of the workspace
+    tenant. In collections partitioned by application, the tenant only holds
+    the application's objects and nothing is skipped.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection to iterate
+        application_id: ID of the application whose objects are streamed
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+        batch_size: Number of objects per yielded batch and per Weaviate page
+        cursor: Cursor of a previous batch to resume after
+        return_properties: Properties to return (all properties if None)
+        include_vector: Whether (or which named) vectors to include
+
+    Yields:
+        Batches with objects, the cursor to resume after the batch and a flag
+        telling whether the scan is complete
+
+    """
+    if batch_size < 1:
+        error_msg = "batch_size must be at least 1"
+        raise ValueError(error_msg)
+
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    properties = with_return_property(return_properties, "application_id")
+    # Only fetched to skip objects of other applications
+    strip_application_id = (
+        properties is not None and "application_id" not in return_properties
+    )
+    batch: list[Any] = []
+    after = cursor
+
+    while True:
+        response = cast(
+            "QueryReturn[object, object]",
+            await tenant_collection.query.fetch_objects(
+                after=after,
+                limit=batch_size,
+                return_properties=properties,
+                include_vector=include_vector,
+            ),
+        )
+
+        for obj in response.objects:
+            after = str(obj.uuid)
+            if not belongs_to_application(obj, application_id):
+                continue
+            if strip_application_id:
+                obj.properties.pop("application_id", None)
+            batch.append(obj)
+            if len(batch) == batch_size:
+                yield {
+                    "objects": objects_part_coll_name(batch),
+                    "cursor": after,
+                    "done": False,
+                }
+                batch = []
+
+        if len(response.objects) < batch_size:
+            break
+
+    yield {
+        "objects": objects_part_coll_name(batch),
+        "cursor": after,
+        "done": True,
+    }
+
+
+async def query_hybrid(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+    *,
+    return_metadata: dict[str, bool] | None = None,
+    group_by_property: str | None = None,
+    group_size: int = 1,
+    result_format: ResultFormat = "objects",
+    snippet_property: str | None = None,
+    snippet_chars: int = DEFAULT_SNIPPET_CHARS,
+    **kwargs: Any,
+) -> ServiceQueryReturn:
+    """Query collection using hybrid search (combination of vector and keyword search).
+
+    Gets a tenant-specific collection after verifying permissions.
+    Automatically adds application_id filter to limit results to the
+    specified application.
+    Forwards all kwargs to collection.query.hybrid().
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection to query
+        application_id: ID of the application to filter results by (optional)
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+        return_metadata: Dictionary of specific metadata fields to return
+        group_by_property: Property holding a parent key (e.g. a document ID).
+            If set, `limit` counts distinct parents instead of objects.
+        group_size: Number of best-ranked objects kept per parent when grouping
+        result_format: "objects" for a list of objects, or "columnar" for one
+            array per field with vectors packed as binary buffers
+        snippet_property: Text property to replace by the passage best matching
+            `query`, with its offsets added under the "_snippet" property
+        snippet_chars: Maximum length of a snippet in characters
+        **kwargs: Additional arguments to pass to hybrid()
+
+    Returns:
+        Dictionary containing objects with shortened collection names
+
+    """
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    return await _execute_query(
+        tenant_collection,
+        "hybrid",
+        application_id,
+        return_metadata=return_metadata,
+        result_format=result_format,
+        snippet_property=snippet_property,
+        snippet_chars=snippet_chars,
+        group_by_property=group_by_property,
+        group_size=group_size,
+        **kwargs,
+    )
+
+
+async def _prepare_tenant_collections(
+    client: WeaviateAsyncClient,
+    targets: set[TenantTarget],
+    context: HyphaContext | None,
+) -> dict[TenantTarget, CollectionAsync | Exception]:
+    """Prepare tenant collections for several targets concurrently.
+
+    Each (collection_name, application_id, user_ws) target is checked once.
+    Failures are returned in place of the collection so that callers can report
+    them per target instead of failing the whole request.
+    """
+
+    async def _prepare(target: TenantTarget) -> CollectionAsync | Exception:
+        collection_name, application_id, user_ws = target
+        try:
+            return await prepare_tenant_collection(
+                client,
+                collection_name,
+                application_id,
+                user_ws=user_ws,
+                context=context,
+            )
+        except Exception as e:  # noqa: BLE001 - reported per target
+            return e
+
+    ordered = list(targets)
+    prepared = await asyncio.gather(*(_prepare(target) for target in ordered))
+    return dict(zip(ordered, prepared, strict=True))
+
+
+def _uuid_key(value: uuid_class.UUID | str) -> str:
+    """Normalise a UUID given as object, hex or hyphenated string."""
+    return str(uuid_class.UUID(str(value)))
+
+
+def _spec_target(spec: QuerySpec) -> TenantTarget:
+    """Extract the (collection_name, application_id, user_ws) of a query spec."""
+    return (spec["collection_name"], spec["application_id"], spec.get("user_ws"))
+
+
+def _spec_error(spec: QuerySpec) -> str | None:
+    """Describe what makes a query spec unusable, or None if it is valid."""
+    if not isinstance(spec, dict):
+        return f"Query spec must be a dictionary, got {type(spec).__name__}"
+    if spec.get("type") not in QUERY_TYPES:
+        return f"Query type must be one of {QUERY_TYPES}, got {spec.get('type')!r}"
+    return _target_error(spec, "Query spec")
+
+
+def _target_error(target: Mapping[str, Any], label: str) -> str | None:
+    """Describe what makes the tenant target of a query unusable, if anything."""
+    for key in ("collection_name", "application_id"):
+        if not isinstance(target.get(key), str) or not target.get(key):
+            return f"{label} needs a non-empty {key}"
+    user_ws = target.get("user_ws")
+    if user_ws is not None and not isinstance(user_ws, str):
+        return f"{label} user_ws must be a string"
+    return None
+
+
+async def query_batch(
+    client: WeaviateAsyncClient,
+    queries: list[QuerySpec],
+    context: HyphaContext | None = None,
+) -> list[QueryBatchResult]:
+    """Run several queries in one call.
+
+    Each query spec is a dictionary with `type` ("hybrid", "near_vector" or
+    "fetch_objects"), `collection_name`, `application_id`, an optional `user_ws`
+    and the keyword arguments of the matching query method. Permissions and
+    tenant collections are resolved once per distinct application, then the
+    Weaviate queries run concurrently.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        queries: List of query specifications
+        context: Context containing caller information
+
+    Returns:
+        One result per query, in input order. A failed or malformed query
+        yields a dictionary with an `error` message instead of `objects`.
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    if len(queries) > MAX_BATCH_QUERIES:
+        error_msg = f"A query batch accepts at most {MAX_BATCH_QUERIES} queries."
+        raise ValueError(error_msg)
+
+    spec_errors = [_spec_error(spec) for spec in queries]
+    tenants = await _prepare_tenant_collections(
+        client,
+        {
+            _spec_target(spec)
+            for spec, spec_error in zip(queries, spec_errors, strict=True)
+            if spec_error is None
+        },
+        context,
+    )
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+    async def _run(spec: QuerySpec, spec_error: str | None) -> QueryBatchResult:
+        if spec_error is not None:
+            return {"error": spec_error}
+        tenant_collection = tenants[_spec_target(spec)]
+        if isinstance(tenant_collection, Exception):
+            return {"error": str(tenant_collection)}
+
+        query_kwargs = {
+            key: value
+            for key, value in spec.items()
+            if key not in ("type", "collection_name", "application_id", "user_ws")
+        }
+        try:
+            async with semaphore:
+                result = await _execute_query(
+                    tenant_collection,
+                    spec["type"],
+                    spec["application_id"],
+                    **query_kwargs,
+                )
+        except Exception as e:  # noqa: BLE001 - errors are isolated per query
+            logger.info("Batched %s query failed: %s", spec["type"], e)
+            return {"error": str(e)}
+        return {"objects": result["objects"]}
+
+    return list(
+        await asyncio.gather(
+            *(
+                _run(spec, spec_error)
+                for spec, spec_error in zip(queries, spec_errors, strict=True)
+            ),
+        ),
+    )
+
+
+def _federated_targets(targets: list[FederatedTarget]) -> dict[TenantTarget, int]:
+    """Validate federated targets and index the first target of each tenant.
+
+    Raises:
+        ValueError: If a target has no valid collection or application
+
+    """
+    first_index: dict[TenantTarget, int] = {}
+    for index, target in enumerate(targets):
+        target_error = (
+            _target_error(target, f"Federated target {index}")
+            if isinstance(target, dict)
+            else f"Federated target {index} must be a dictionary"
+        )
+        if target_error is not None:
+            raise ValueError(target_error)
+        first_index.setdefault(
+            (
+                target["collection_name"],
+                target["application_id"],
+                target.get("user_ws"),
+            ),
+            index,
+        )
+    return first_index
+
+
+async def query_federated(
+    client: WeaviateAsyncClient,
+    targets: list[FederatedTarget],
+    query: str,
+    limit: int = DEFAULT_QUERY_LIMIT,
+    context: HyphaContext | None = None,
+    *,
+    fusion: FusionMethod = "rrf",
+    rrf_k: int = DEFAULT_RRF_K,
+    return_metadata: dict[str, bool] | None = None,
+    **kwargs: Any,
+) -> FederatedQueryReturn:
+    """Run one hybrid search over several applications and merge the results.
+
+    Permissions and tenant collections are resolved for all targets at once,
+    then each target is searched concurrently for at most `limit` objects, which
+    is all a target can contribute to the merged top-k. Results are merged with
+    reciprocal rank fusion ("rrf") or min-max normalised hybrid scores ("score").
+    Targets are distinct applications, so no object is found by two targets
+    and "rrf" interleaves the targets' results by rank.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        targets: Applications to search, each with `collection_name`,
+            `application_id` and an optional `user_ws`
+        query: Search query
+        limit: Number of merged results to return
+        context: Context containing caller information
+        fusion: How to merge the per-target rankings, "rrf" or "score"
+        rrf_k: Rank offset for reciprocal rank fusion
+        return_metadata: Dictionary of specific metadata fields to return
+        **kwargs: Additional arguments to pass to hybrid() for every target,
+            except the query, limit and metadata set from the arguments above
+
+    Returns:
+        Dictionary with the merged objects, their fused scores, the index of the
+        target each object came from, and error messages of failed targets keyed
+        by target index
+
+    Raises:
+        ValueError: If a target has no valid collection or application, or
+            kwargs hold arguments the federated search sets itself
+
+    """
+    if context is None:
+        raise MissingContextError
+
+    if fusion not in ("rrf", "score"):
+        error_msg = f"Unknown fusion method {fusion!r}. Use 'rrf' or 'score'."
+        raise ValueError(error_msg)
+
+    if kwargs.get("result_format", "objects") != "objects":
+        error_msg = "Federated search only returns objects, not columnar results"
+        raise ValueError(error_msg)
+
+    reserved = sorted(FEDERATED_RESERVED_KWARGS.intersection(kwargs))
+    if reserved:
+        error_msg = f"Federated search sets {', '.join(reserved)} itself"
+        raise ValueError(error_msg)
+
+    first_index = _federated_targets(targets)
+    tenants = await _prepare_tenant_collections(client, set(first_index), context)
+
+    metadata = dict(return_metadata or {})
+    if fusion == "score":
+        metadata["score"] = True
+
+    async def _search(target: TenantTarget) -> ServiceQueryReturn:
+        tenant_collection = tenants[target]
+        if isinstance(tenant_collection, Exception):
+            raise tenant_collection
+        return await _execute_query(
+            tenant_collection,
+            "hybrid",
+            target[1],
+            return_metadata=metadata or None,
+            query=query,
+            limit=limit,
+            **kwargs,
+        )
+
+    searched = list(first_index)
+    results = await asyncio.gather(
+        *(_search(target) for target in searched),
+        return_exceptions=True,
+    )
+
+    errors: dict[str, str] = {}
+    ranked_lists: list[list[tuple[Any, float | None]]] = []
+    for target, result in zip(searched, results, strict=True):
+        if isinstance(result, BaseException):
+            errors[str(first_index[target])] = str(result)
+            ranked_lists.append([])
+            continue
+        ranked_lists.append(
+            [
+                (obj, obj.metadata.score if obj.metadata else None)
+                for obj in result["objects"]
+            ],
+        )
+
+    merged = fuse_ranked_lists(ranked_lists, limit, fusion, rrf_k)
+    return {
+        "objects": [obj for _, obj, _ in merged],
+        "scores": [score for _, _, score in merged],
+        "targets": [first_index[searched[source]] for source, _, _ in merged],
+        "errors": errors,
+    }
+
+
+def _resolve_generation_mode(
+    kwargs: dict[str, Any],
+    generation_mode: GenerationMode | None,
+) -> GenerationMode:
+    """Check the prompts of a generation mode and drop those it does not use.
+
+    Without a mode, the mode follows from the prompts given.
+
+    Returns:
+        The generation mode to run
 
     """
-    tenant_collection = await prepare_tenant_collection(
-        client,
-        collection_name,
-        application_id,
-        user_ws=user_ws,
-        context=context,
+    given = tuple(
+        key for key in ("single_prompt", "grouped_task") if kwargs.get(key) is not None
     )
+    if generation_mode is None:
+        generation_mode = next(
+            mode for mode, prompts in GENERATION_PROMPTS.items() if prompts == given
+        )
+    elif generation_mode not in GENERATION_PROMPTS:
+        error_msg = (
+            f"Unknown generation mode {generation_mode!r}. Use one of: "
+            f"{', '.join(GENERATION_PROMPTS)}"
+        )
+        raise ValueError(error_msg)
 
-    kwargs["filters"] = and_app_filter(application_id, kwargs.get("filters"))
+    prompts = GENERATION_PROMPTS[generation_mode]
+    for prompt in prompts:
+        if prompt not in given:
+            error_msg = f"Generation mode '{generation_mode}' needs a {prompt}"
+            raise ValueError(error_msg)
 
-    if return_metadata:
-        kwargs["return_metadata"] = MetadataQuery(**return_metadata)
+    if "single_prompt" not in prompts:
+        kwargs.pop("single_prompt", None)
+    if "grouped_task" not in prompts:
+        kwargs.pop("grouped_task", None)
+        kwargs.pop("grouped_properties", None)
+    if not prompts:
+        kwargs.pop("generative_provider", None)
+    return generation_mode
+
+
+def _with_update_time(return_metadata: Any) -> MetadataQuery | list[str]:
+    """Add the last update time to the metadata returned by a search."""
+    if return_metadata is None:
+        return MetadataQuery(last_update_time=True)
+    if isinstance(return_metadata, MetadataQuery):
+        return return_metadata.model_copy(update={"last_update_time": True})
+    if isinstance(return_metadata, dict):
+        return MetadataQuery(**{**return_metadata, "last_update_time": True})
+    return [*return_metadata, "last_update_time"]
+
+
+def _pop_generative_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Split generation options off search kwargs.
+
+    The search is extended to return the grouped properties and update times,
+    so that the results can be measured against a token budget and used as a
+    cache key.
+
+    Returns:
+        The generation options
+
+    """
+    generative_kwargs = {
+        key: kwargs.pop(key) for key in GENERATIVE_KWARGS if key in kwargs
+    }
+    for name in generative_kwargs.get("grouped_properties") or ():
+        kwargs["return_properties"] = with_return_property(
+            kwargs.get("return_properties"),
+            name,
+        )
+    kwargs["return_metadata"] = _with_update_time(kwargs.get("return_metadata"))
+    return generative_kwargs
+
+
+async def _generate_for_objects(
+    tenant_collection: CollectionAsync,
+    uuids: list[uuid_class.UUID],
+    limiter: asyncio.Semaphore,
+    **generative_kwargs: Any,
+) -> GenerativeReturn[object, object]:
+    """Run generations over objects already found by a search."""
+    async with limiter:
+        return cast(
+            "GenerativeReturn[object, object]",
+            await tenant_collection.generate.fetch_objects(
+                filters=create_ids_filter(uuids),
+                limit=len(uuids),
+                **generative_kwargs,
+            ),
+        )
+
+
+async def _grouped_text(
+    client: WeaviateAsyncClient,
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    objects: Sequence[Object[Any, Any]],
+    limiter: asyncio.Semaphore,
+    *,
+    generative_kwargs: dict[str, Any],
+    max_tokens: int | None,
+    use_cache: bool,
+) -> str | None:
+    """Run a grouped task over objects, reusing a cached generation if any.
+
+    Weaviate fetches the objects by ID and sends their `grouped_properties`
+    to the generative module, in its fetch order. Stored properties cannot be
+    shortened on the way, so a best object exceeding the token budget on its
+    own is sent whole. Cached generations are keyed by the collection's
+    generative module as well, so changing the module's model or settings
+    does not serve old texts.
+    """
+    key = None
+    if use_cache:
+        config = await config_cache.get(client, tenant_collection.name)
+        key = generation_cache.key(
+            tenant_collection.name,
+            application_id,
+            tenant_collection.tenant,
+            {
+                **generative_kwargs,
+                "grouped_token_budget": max_tokens,
+                "generative_config": config.generative_config,
+            },
+            objects,
+        )
+        cached = generation_cache.get(key)
+        if cached is not None:
+            return cached
+
+    generation = await _generate_for_objects(
+        tenant_collection,
+        [obj.uuid for obj in objects],
+        limiter,
+        return_properties=generative_kwargs.get("grouped_properties"),
+        **generative_kwargs,
+    )
+    text = generation.generative.text if generation.generative else None
+    if key is not None and text is not None:
+        generation_cache.put(key, text)
+    return text
+
+
+async def _generate_grouped(
+    client: WeaviateAsyncClient,
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    limiter: asyncio.Semaphore,
+    kwargs: dict[str, Any],
+    *,
+    max_tokens: int | None,
+    use_cache: bool,
+) -> ServiceQueryReturn:
+    """Search, then run a grouped task over the results.
 
+    The search runs without generation. Its results are cut to the token
+    budget, if any, and the grouped task runs over the kept objects only,
+    unless a generation for the same objects is cached. All results are
+    returned.
+    """
+    generative_kwargs = _pop_generative_kwargs(kwargs)
     response = cast(
-        "QueryReturn[object, object]",  # NOSONAR (S1192) Repeated literal necessary
-        await tenant_collection.query.near_vector(**kwargs),
+        "QueryReturn[object, object]",
+        await tenant_collection.query.near_text(**kwargs),
     )
+    objects = response.objects
+    if max_tokens is not None:
+        objects = select_within_token_budget(
+            objects,
+            generative_kwargs.get("grouped_properties"),
+            max_tokens,
+        )
+
+    generated = None
+    if objects:
+        generated = await _grouped_text(
+            client,
+            tenant_collection,
+            application_id,
+            objects,
+            limiter,
+            generative_kwargs=generative_kwargs,
+            max_tokens=max_tokens,
+            use_cache=use_cache,
+        )
 
     return {
         "objects": objects_part_coll_name(response.objects),
+        "generated": generated,
     }
 
 
-async def query_fetch_objects(
+async def generate_near_text(
     client: WeaviateAsyncClient,
     collection_name: str,
     application_id: str,
     user_ws: str | None = None,
     context: HyphaContext | None = None,
     *,
-    return_metadata: dict[str, bool] | None = None,
+    generation_mode: GenerationMode | None = None,
+    grouped_token_budget: int | None = None,
+    generation_limiter: asyncio.Semaphore | None = None,
+    cache_generation: bool = True,
     **kwargs: Any,
 ) -> ServiceQueryReturn:
-    """Query the collection to fetch objects based on filters.
+    """Generate content based on query text and similar objects in the collection.
 
     Gets a tenant-specific collection after verifying permissions.
-    Automatically adds application_id filter to limit results to the specified
-    application. Forwards all kwargs to collection.query.fetch_objects().
+    Automatically adds application_id filter to limit context to the specified
+    application.
+    Forwards all kwargs to collection.generate.near_text().
+
+    A `single_prompt` costs one LLM call per returned object, and a
+    `grouped_task` one call for all of them. `generation_mode` picks which of
+    the given prompts run. Generative requests wait for `generation_limiter`,
+    which defaults to a process-wide limit of GENERATION_MAX_CONCURRENCY.
+    In "grouped" mode, the search runs first, and a grouped generation over
+    the same unchanged objects is served from the generation cache.
 
     Args:
         client: WeaviateAsyncClient instance
-        collection_name: Name of the collection to query
-        application_id: ID of the application to filter results by (optional)
+        collection_name: Name of the collection to search
+        application_id: ID of the application to filter results by
         user_ws: Optional user workspace to use as tenant (if different from caller)
         context: Context containing caller information
-        return_metadata: Dictionary of specific metadata fields to return
-        **kwargs: Additional arguments to pass to fetch_objects()
+        generation_mode: "single", "grouped", "both" or "none". Defaults to
+            the prompts given.
+        grouped_token_budget: Maximum number of tokens of `grouped_properties`
+            sent to the grouped task. Only the best results that fit are used.
+            Requires generation_mode "grouped".
+        generation_limiter: Semaphore bounding concurrent generative requests
+        cache_generation: Whether grouped generations may be served from and
+            stored in the generation cache
+        **kwargs: Additional arguments to pass to near_text()
 
     Returns:
-        Dictionary containing objects with shortened collection names
+        Dictionary containing objects with shortened collection names and generated
+        content.
 
     """
+    mode = _resolve_generation_mode(kwargs, generation_mode)
+    if grouped_token_budget is not None and mode != "grouped":
+        error_msg = "grouped_token_budget needs generation_mode 'grouped'"
+        raise ValueError(error_msg)
+    limiter = generation_limiter or _default_generation_limiter
+
     tenant_collection = await prepare_tenant_collection(
         client,
         collection_name,
@@ -822,51 +2485,137 @@ async def query_fetch_objects(
         context=context,
     )
 
-    kwargs["filters"] = and_app_filter(application_id, kwargs.get("filters"))
+    kwargs["filters"] = scope_to_application(
+        tenant_collection,
+        application_id,
+        resolve_filter(kwargs.get("filters")),
+    )
 
-    if return_metadata:
-        kwargs["return_metadata"] = MetadataQuery(**return_metadata)
+    if mode == "none":
+        query_response = cast(
+            "QueryReturn[object, object]",
+            await tenant_collection.query.near_text(**kwargs),
+        )
+        return {
+            "objects": objects_part_coll_name(query_response.objects),
+            "generated": None,
+        }
 
-    response = cast(
-        "QueryReturn[object, object]",  # NOSONAR (S1192) Repeated literal necessary
-        await tenant_collection.query.fetch_objects(**kwargs),
-    )
+    if mode == "grouped":
+        return await _generate_grouped(
+            client,
+            tenant_collection,
+            application_id,
+            limiter,
+            kwargs,
+            max_tokens=grouped_token_budget,
+            use_cache=cache_generation,
+        )
+
+    async with limiter:
+        response = cast(
+            "GenerativeReturn[object, object]",
+            await tenant_collection.generate.near_text(**kwargs),
+        )
 
     return {
         "objects": objects_part_coll_name(response.objects),
+        "generated": response.generative.text if response.generative else None,
     }
 
 
-async def query_hybrid(
+async def _single_generation(
+    tenant_collection: CollectionAsync,
+    uuid: uuid_class.UUID,
+    limiter: asyncio.Semaphore,
+    generative_kwargs: dict[str, Any],
+) -> GenerationEvent:
+    generation = await _generate_for_objects(
+        tenant_collection,
+        [uuid],
+        limiter,
+        **generative_kwargs,
+    )
+    generated = [obj.generative.text for obj in generation.objects if obj.generative]
+    return {
+        "type": "single",
+        "uuid": uuid,
+        "text": generated[0] if generated else None,
+    }
+
+
+async def _grouped_generation(
+    client: WeaviateAsyncClient,
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    objects: Sequence[Object[Any, Any]],
+    limiter: asyncio.Semaphore,
+    *,
+    generative_kwargs: dict[str, Any],
+    max_tokens: int | None,
+    use_cache: bool,
+) -> GenerationEvent:
+    text = await _grouped_text(
+        client,
+        tenant_collection,
+        application_id,
+        objects,
+        limiter,
+        generative_kwargs=generative_kwargs,
+        max_tokens=max_tokens,
+        use_cache=use_cache,
+    )
+    return {"type": "grouped", "text": text}
+
+
+async def generate_near_text_stream(
     client: WeaviateAsyncClient,
     collection_name: str,
     application_id: str,
     user_ws: str | None = None,
     context: HyphaContext | None = None,
     *,
-    return_metadata: dict[str, bool] | None = None,
+    generation_mode: GenerationMode | None = None,
+    grouped_token_budget: int | None = None,
+    generation_limiter: asyncio.Semaphore | None = None,
+    cache_generation: bool = True,
     **kwargs: Any,
-) -> ServiceQueryReturn:
-    """Query collection using hybrid search (combination of vector and keyword search).
+) -> AsyncGenerator[GenerationEvent, None]:
+    """Stream retrieved objects first and generated text as it completes.
 
-    Gets a tenant-specific collection after verifying permissions.
-    Automatically adds application_id filter to limit results to the
-    specified application.
-    Forwards all kwargs to collection.query.hybrid().
+    Takes the same arguments as generate_near_text. The search runs without
+    generation and its objects are yielded right away. Each single prompt then
+    runs as its own generative request, next to the grouped task, and every
+    generation is yielded as soon as it finishes. In "grouped" mode the
+    grouped text is not streamed: it arrives complete, no earlier than from
+    generate_near_text, and only the objects come first.
 
     Args:
         client: WeaviateAsyncClient instance
-        collection_name: Name of the collection to query
-        application_id: ID of the application to filter results by (optional)
+        collection_name: Name of the collection to search
+        application_id: ID of the application to filter results by
         user_ws: Optional user workspace to use as tenant (if different from caller)
         context: Context containing caller information
-        return_metadata: Dictionary of specific metadata fields to return
-        **kwargs: Additional arguments to pass to hybrid()
+        generation_mode: "single", "grouped", "both" or "none". Defaults to
+            the prompts given.
+        grouped_token_budget: Maximum number of tokens of `grouped_properties`
+            sent to the grouped task. Requires generation_mode "grouped".
+        generation_limiter: Semaphore bounding concurrent generative requests
+        cache_generation: Whether the grouped generation may be served from
+            and stored in the generation cache
+        **kwargs: Additional arguments to pass to near_text()
 
-    Returns:
-        Dictionary containing objects with shortened collection names
+    Yields:
+        An "objects" event with the search results, then one "single" event
+        per object and one "grouped" event, in order of completion
 
     """
+    mode = _resolve_generation_mode(kwargs, generation_mode)
+    if grouped_token_budget is not None and mode != "grouped":
+        error_msg = "grouped_token_budget needs generation_mode 'grouped'"
+        raise ValueError(error_msg)
+    limiter = generation_limiter or _default_generation_limiter
+
     tenant_collection = await prepare_tenant_collection(
         client,
         collection_name,
@@ -875,47 +2624,90 @@ async def query_hybrid(
         context=context,
     )
 
-    kwargs["filters"] = and_app_filter(application_id, kwargs.get("filters"))
-
-    if return_metadata:
-        kwargs["return_metadata"] = MetadataQuery(**return_metadata)
+    kwargs["filters"] = scope_to_application(
+        tenant_collection,
+        application_id,
+        resolve_filter(kwargs.get("filters")),
+    )
 
+    generative_kwargs = _pop_generative_kwargs(kwargs)
     response = cast(
         "QueryReturn[object, object]",
-        await tenant_collection.query.hybrid(**kwargs),
+        await tenant_collection.query.near_text(**kwargs),
     )
+    uuids = [obj.uuid for obj in response.objects]
+    grouped_objects = response.objects
+    if grouped_token_budget is not None:
+        grouped_objects = select_within_token_budget(
+            response.objects,
+            generative_kwargs.get("grouped_properties"),
+            grouped_token_budget,
+        )
 
-    return {
-        "objects": objects_part_coll_name(response.objects),
-    }
+    yield {"type": "objects", "objects": objects_part_coll_name(response.objects)}
+
+    generations: list[Coroutine[Any, Any, GenerationEvent]] = []
+    if "single_prompt" in generative_kwargs:
+        single_kwargs = {
+            key: value
+            for key, value in generative_kwargs.items()
+            if key not in {"grouped_task", "grouped_properties"}
+        }
+        generations.extend(
+            _single_generation(tenant_collection, uuid, limiter, single_kwargs)
+            for uuid in uuids
+        )
+    if "grouped_task" in generative_kwargs and grouped_objects:
+        grouped_kwargs = {
+            key: value
+            for key, value in generative_kwargs.items()
+            if key != "single_prompt"
+        }
+        generations.append(
+            _grouped_generation(
+                client,
+                tenant_collection,
+                application_id,
+                grouped_objects,
+                limiter,
+                generative_kwargs=grouped_kwargs,
+                max_tokens=grouped_token_budget,
+                use_cache=cache_generation,
+            ),
+        )
 
+    tasks = [asyncio.ensure_future(generation) for generation in generations]
+    try:
+        for next_event in asyncio.as_completed(tasks):
+            yield await next_event
+    finally:
+        for task in tasks:
+            task.cancel()
 
-async def generate_near_text(
+
+async def data_update(
     client: WeaviateAsyncClient,
     collection_name: str,
     application_id: str,
     user_ws: str | None = None,
     context: HyphaContext | None = None,
     **kwargs: Any,
-) -> ServiceQueryReturn:
-    """Generate content based on query text and similar objects in the collection.
+) -> None:
+    """Update an object in the collection.
 
     Gets a tenant-specific collection after verifying permissions.
-    Automatically adds application_id filter to limit context to the specified
-    application.
-    Forwards all kwargs to collection.generate.near_text().
+    Forwards all kwargs to collection.data.update().
 
     Args:
         client: WeaviateAsyncClient instance
-        collection_name: Name of the collection to search
-        application_id: ID of the application to filter results by
+        collection_name: Name of the collection containing the object
+        application_id: ID of the application the object belongs to
         user_ws: Optional user workspace to use as tenant (if different from caller)
         context: Context containing caller information
-        **kwargs: Additional arguments to pass to near_text()
+        **kwargs: Additional arguments to pass to update() including uuid and properties
 
     Returns:
-        Dictionary containing objects with shortened collection names and generated
-        content.
+        None
 
     """
     tenant_collection = await prepare_tenant_collection(
@@ -926,44 +2718,72 @@ async def generate_near_text(
         context=context,
     )
 
-    kwargs["filters"] = and_app_filter(application_id, kwargs.get("filters"))
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        await tenant_collection.data.update(**kwargs)
 
-    response = cast(
-        "GenerativeReturn[object, object]",
-        await tenant_collection.generate.near_text(**kwargs),
-    )
 
-    return {
-        "objects": objects_part_coll_name(response.objects),
-        "generated": response.generative.text if response.generative else None,
-    }
+def _update_keys(objects: list[dict[str, Any]]) -> list[str]:
+    """Get the UUID keys of update items, rejecting missing and repeated UUIDs.
 
+    Raises:
+        ValueError: Listing every item without a valid or with a repeated UUID
 
-async def data_update(
+    """
+    keys: list[str] = []
+    seen: set[str] = set()
+    errors: list[str] = []
+    for position, obj in enumerate(objects):
+        try:
+            key = _uuid_key(obj["uuid"])
+        except (KeyError, TypeError, ValueError):
+            errors.append(f"Object {position}: missing or invalid uuid")
+            continue
+        if key in seen:
+            errors.append(f"Object {position}: uuid {key} is updated twice")
+        seen.add(key)
+        keys.append(key)
+    if errors:
+        error_msg = "; ".join(errors)
+        raise ValueError(error_msg)
+    return keys
+
+
+async def data_update_many(
     client: WeaviateAsyncClient,
     collection_name: str,
     application_id: str,
+    objects: list[dict[str, Any]],
     user_ws: str | None = None,
     context: HyphaContext | None = None,
-    **kwargs: Any,
-) -> None:
-    """Update an object in the collection.
+) -> dict[str, BulkItemResult]:
+    """Update many objects in the collection.
 
-    Gets a tenant-specific collection after verifying permissions.
-    Forwards all kwargs to collection.data.update().
+    Gets a tenant-specific collection once after verifying permissions, then
+    runs the updates concurrently. Weaviate has no batch variant of a partial
+    update, so each object is still its own Weaviate request, but the tenant,
+    permission and artifact checks are shared.
 
     Args:
         client: WeaviateAsyncClient instance
-        collection_name: Name of the collection containing the object
-        application_id: ID of the application the object belongs to
+        collection_name: Name of the collection containing the objects
+        application_id: ID of the application the objects belong to
+        objects: Keyword arguments for update() per object, including `uuid`
+            and `properties`
         user_ws: Optional user workspace to use as tenant (if different from caller)
         context: Context containing caller information
-        **kwargs: Additional arguments to pass to update() including uuid and properties
 
     Returns:
-        None
+        Dictionary mapping each UUID to the outcome of its update
+
+    Raises:
+        ValueError: If an object has no valid `uuid` or a UUID appears twice;
+            nothing is updated then
 
     """
+    keys = _update_keys(objects)
     tenant_collection = await prepare_tenant_collection(
         client,
         collection_name,
@@ -971,8 +2791,22 @@ async def data_update(
         user_ws=user_ws,
         context=context,
     )
-
-    await tenant_collection.data.update(**kwargs)
+    semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+
+    async def _update(update_kwargs: dict[str, Any]) -> BulkItemResult:
+        try:
+            async with semaphore:
+                await tenant_collection.data.update(**update_kwargs)
+        except Exception as e:  # noqa: BLE001 - reported per object
+            return {"successful": False, "error": str(e)}
+        return {"successful": True, "error": None}
+
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        results = await asyncio.gather(*(_update(obj) for obj in objects))
+    return dict(zip(keys, results, strict=True))
 
 
 async def data_delete_by_id(
@@ -1008,7 +2842,71 @@ async def data_delete_by_id(
         context=context,
     )
 
-    await tenant_collection.data.delete_by_id(uuid=uuid)
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        await tenant_collection.data.delete_by_id(uuid=uuid)
+
+
+async def data_delete_by_ids(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    uuids: list[uuid_class.UUID],
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+) -> dict[str, BulkItemResult]:
+    """Delete many objects by ID from the collection.
+
+    Gets a tenant-specific collection once after verifying permissions, then
+    deletes the objects with delete_many() on an ID filter, in pages of
+    BULK_ID_PAGE_SIZE. Only objects of the application are deleted.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection containing the objects
+        application_id: ID of the application the objects belong to
+        uuids: UUIDs of the objects to delete
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+
+    Returns:
+        Dictionary mapping each UUID to the outcome of its deletion. UUIDs that
+        match no object of the application are reported as not found.
+
+    """
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    results: dict[str, BulkItemResult] = {
+        _uuid_key(uuid): {"successful": False, "error": "Object not found"}
+        for uuid in uuids
+    }
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        for page in batched(uuids, BULK_ID_PAGE_SIZE):
+            response = cast(
+                "DeleteManyReturn[list[DeleteManyObject]]",
+                await tenant_collection.data.delete_many(
+                    where=and_app_filter(application_id, create_ids_filter(page)),
+                    verbose=True,
+                ),
+            )
+            for deleted in response.objects:
+                results[str(deleted.uuid)] = {
+                    "successful": deleted.successful,
+                    "error": deleted.error,
+                }
+
+    return results
 
 
 async def data_delete_many(
@@ -1046,11 +2944,18 @@ async def data_delete_many(
         context=context,
     )
 
-    kwargs["where"] = and_app_filter(application_id, kwargs.get("where"))
-    response = cast(
-        "DeleteManyReturn[None]",
-        await tenant_collection.data.delete_many(**kwargs),
+    kwargs["where"] = and_app_filter(
+        application_id,
+        resolve_filter(kwargs.get("where")),
     )
+    with generation_cache.invalidating(
+        get_full_collection_name(collection_name),
+        application_id,
+    ):
+        response = cast(
+            "DeleteManyReturn[None]",
+            await tenant_collection.data.delete_many(**kwargs),
+        )
 
     return {
         "failed": response.failed,
@@ -1095,3 +3000,41 @@ async def data_exists(
     )
 
     return await tenant_collection.data.exists(uuid=uuid)
+
+
+async def data_exists_many(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    application_id: str,
+    uuids: list[uuid_class.UUID],
+    user_ws: str | None = None,
+    context: HyphaContext | None = None,
+) -> dict[str, bool]:
+    """Check which of the given UUIDs exist in the application.
+
+    Gets a tenant-specific collection once after verifying permissions, then
+    looks the UUIDs up with fetch_objects() on an ID filter, in pages of
+    BULK_ID_PAGE_SIZE, without returning properties.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection to check
+        application_id: ID of the application the objects belong to
+        uuids: UUIDs of the objects to check
+        user_ws: Optional user workspace to use as tenant (if different from caller)
+        context: Context containing caller information
+
+    Returns:
+        Dictionary mapping each UUID to whether it exists in the application
+
+    """
+    tenant_collection = await prepare_tenant_collection(
+        client,
+        collection_name,
+        application_id,
+        user_ws=user_ws,
+        context=context,
+    )
+
+    found = await _existing_uuids(tenant_collection, application_id, uuids)
+    return {_uuid_key(uuid): _uuid_key(uuid) in found for uuid in uuids}
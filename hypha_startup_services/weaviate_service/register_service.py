@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 from functools import partial
+from typing import Any
 
 from hypha_rpc.rpc import RemoteService
 from weaviate import WeaviateAsyncClient
@@ -11,39 +13,72 @@ from hypha_startup_services.common.constants import (
     DEFAULT_WEAVIATE_SERVICE_ID as DEFAULT_SERVICE_ID,
 )
 
-from .client import (
-    instantiate_and_connect,
-)
+from .client_pool import WeaviateClientPool, get_client_pool
 from .methods import (
+    GENERATION_MAX_CONCURRENCY,
+    admission_stats,
     applications_create,
     applications_delete,
     applications_exists,
     applications_get,
     applications_get_artifact,
     applications_set_permissions,
+    applications_set_query_defaults,
+    applications_submit_delete_job,
     collections_create,
     collections_delete,
+    collections_estimate_memory,
     collections_exists,
     collections_get,
     collections_get_artifact,
     collections_list_all,
+    collections_restore_artifact,
     data_delete_by_id,
+    data_delete_by_ids,
     data_delete_many,
     data_exists,
+    data_exists_many,
     data_insert,
     data_insert_many,
+    data_submit_insert_job,
     data_update,
+    data_update_many,
     generate_near_text,
+    generate_near_text_stream,
+    jobs_cancel,
+    jobs_result,
+    jobs_status,
+    query_batch,
+    query_federated,
     query_fetch_objects,
     query_hybrid,
+    query_iterate,
     query_near_vector,
 )
 from .service_codecs import (
     register_weaviate_codecs,
 )
+from .utils.admission import AdmissionController, EndpointClass
+from .utils.deadlines import DEFAULT_ENDPOINT_TIMEOUTS, with_deadline
+from .utils.jobs import DEFAULT_JOB_RETENTION_SECONDS, JobManager
 
 logger = logging.getLogger(__name__)
 
+# Admission class of endpoints by group and name; all others are interactive
+ENDPOINT_ADMISSION_CLASSES: dict[str, dict[str, EndpointClass]] = {
+    "collections": {"create": "bulk", "delete": "bulk"},
+    "applications": {"delete": "bulk", "submit_delete_job": "bulk"},
+    "data": {
+        "insert_many": "bulk",
+        "update_many": "bulk",
+        "delete_by_ids": "bulk",
+        "delete_many": "bulk",
+        "submit_insert_job": "bulk",
+    },
+    "query": {"iterate": "bulk", "batch": "bulk", "federated": "bulk"},
+    "generate": {"near_text": "generative", "near_text_stream": "generative"},
+}
+
 # Set to keep references to background tasks to prevent garbage collection
 _background_tasks: set[asyncio.Task[None]] = set()
 
@@ -57,20 +92,154 @@ async def register_weaviate(
     Sets up all service endpoints for collections, data operations, and queries.
     """
     register_weaviate_codecs(server)
-    client = await instantiate_and_connect()
+    client_pool = await get_client_pool()
+
+    await register_weaviate_service(
+        server,
+        client_pool.client,
+        service_id,
+        client_pool=client_pool,
+    )
 
-    await register_weaviate_service(server, client, service_id)
+
+def admit_endpoints(
+    endpoints: dict[str, dict[str, Callable[..., Any]]],
+    admission: AdmissionController,
+    timeouts: dict[str, float] | None = None,
+) -> dict[str, dict[str, Callable[..., Any]]]:
+    """Wrap every endpoint in admission control and a deadline.
+
+    Both depend on the endpoint class. `timeouts` overrides the default
+    timeout of endpoints by "group.name".
+    """
+    timeouts = timeouts or {}
+    admitted: dict[str, dict[str, Callable[..., Any]]] = {}
+    for group, group_endpoints in endpoints.items():
+        admitted[group] = {}
+        for name, endpoint in group_endpoints.items():
+            endpoint_name = f"{group}.{name}"
+            endpoint_class = ENDPOINT_ADMISSION_CLASSES.get(group, {}).get(
+                name,
+                "interactive",
+            )
+            admitted[group][name] = with_deadline(
+                admission.wrap(endpoint, endpoint_class),
+                timeouts.get(endpoint_name, DEFAULT_ENDPOINT_TIMEOUTS[endpoint_class]),
+                endpoint_name,
+            )
+    return admitted
 
 
 async def register_weaviate_service(
     server: RemoteService,
     client: WeaviateAsyncClient,
     service_id: str,
+    job_retention_seconds: float = DEFAULT_JOB_RETENTION_SECONDS,
+    generation_concurrency: int = GENERATION_MAX_CONCURRENCY,
+    *,
+    admission: AdmissionController | None = None,
+    timeouts: dict[str, float] | None = None,
+    client_pool: WeaviateClientPool | None = None,
 ) -> None:
     """Register the Weaviate service with the Hypha server.
 
     Sets up all service endpoints for collections, data operations, and queries.
+    Finished background jobs are kept for `job_retention_seconds`, and at most
+    `generation_concurrency` generative requests run at the same time. Every
+    endpoint runs under `admission` control, with default limits if None, and
+    is cancelled at its deadline. `timeouts` overrides the default timeout of
+    endpoints by "group.name". If `client` comes from `client_pool`, failing
+    Weaviate calls trigger a readiness check of the pool, and calls and jobs
+    keep the clients they use open across reconnects.
     """
+    job_manager = JobManager(
+        retention_seconds=job_retention_seconds,
+        lease=client_pool.lease if client_pool is not None else None,
+    )
+    generation_limiter = asyncio.Semaphore(generation_concurrency)
+    if admission is None:
+        admission = AdmissionController()
+
+    endpoints: dict[str, dict[str, Callable[..., Any]]] = {
+        "collections": {
+            "create": partial(collections_create, client),
+            "estimate_memory": partial(collections_estimate_memory, client),
+            "delete": partial(collections_delete, client),
+            "list_all": partial(collections_list_all, client),
+            "get": partial(collections_get, client),
+            "exists": partial(collections_exists, client),
+            "get_artifact": partial(collections_get_artifact, client),
+            "restore_artifact": partial(collections_restore_artifact, client),
+        },
+        "applications": {
+            "create": partial(applications_create, client),
+            "delete": partial(applications_delete, client),
+            "get": partial(applications_get, client),
+            "exists": partial(applications_exists, client),
+            "get_artifact": partial(applications_get_artifact, client),
+            "set_permissions": partial(applications_set_permissions, client),
+            "set_query_defaults": partial(
+                applications_set_query_defaults,
+                client,
+            ),
+            "submit_delete_job": partial(
+                applications_submit_delete_job,
+                client,
+                job_manager,
+            ),
+        },
+        "data": {
+            "insert_many": partial(data_insert_many, client),
+            "insert": partial(data_insert, client),
+            "update": partial(data_update, client),
+            "update_many": partial(data_update_many, client),
+            "delete_by_id": partial(data_delete_by_id, client),
+            "delete_by_ids": partial(data_delete_by_ids, client),
+            "delete_many": partial(data_delete_many, client),
+            "exists": partial(data_exists, client),
+            "exists_many": partial(data_exists_many, client),
+            "submit_insert_job": partial(
+                data_submit_insert_job,
+                client,
+                job_manager,
+            ),
+        },
+        "jobs": {
+            "status": partial(jobs_status, job_manager),
+            "cancel": partial(jobs_cancel, job_manager),
+            "result": partial(jobs_result, job_manager),
+        },
+        "query": {
+            "near_vector": partial(query_near_vector, client),
+            "fetch_objects": partial(query_fetch_objects, client),
+            "hybrid": partial(query_hybrid, client),
+            "iterate": partial(query_iterate, client),
+            "batch": partial(query_batch, client),
+            "federated": partial(query_federated, client),
+        },
+        "generate": {
+            "near_text": partial(
+                generate_near_text,
+                client,
+                generation_limiter=generation_limiter,
+            ),
+            "near_text_stream": partial(
+                generate_near_text_stream,
+                client,
+                generation_limiter=generation_limiter,
+            ),
+        },
+    }
+
+    if client_pool is not None:
+        endpoints = {
+            group: {
+                name: client_pool.watch(endpoint)
+                for name, endpoint in group_endpoints.items()
+            }
+            for group, group_endpoints in endpoints.items()
+        }
+
     await server.register_service(
         {
             "name": "Hypha Weaviate Service",
@@ -79,37 +248,9 @@ async def register_weaviate_service(
                 "visibility": "public",
                 "require_context": True,
             },
-            "collections": {
-                "create": partial(collections_create, client),
-                "delete": partial(collections_delete, client),
-                "list_all": partial(collections_list_all, client),
-                "get": partial(collections_get, client),
-                "exists": partial(collections_exists, client),
-                "get_artifact": partial(collections_get_artifact, client),
-            },
-            "applications": {
-                "create": partial(applications_create, client),
-                "delete": partial(applications_delete, client),
-                "get": partial(applications_get, client),
-                "exists": partial(applications_exists, client),
-                "get_artifact": partial(applications_get_artifact, client),
-                "set_permissions": partial(applications_set_permissions, client),
-            },
-            "data": {
-                "insert_many": partial(data_insert_many, client),
-                "insert": partial(data_insert, client),
-                "update": partial(data_update, client),
-                "delete_by_id": partial(data_delete_by_id, client),
-                "delete_many": partial(data_delete_many, client),
-                "exists": partial(data_exists, client),
-            },
-            "query": {
-                "near_vector": partial(query_near_vector, client),
-                "fetch_objects": partial(query_fetch_objects, client),
-                "hybrid": partial(query_hybrid, client),
-            },
-            "generate": {
-                "near_text": partial(generate_near_text, client),
+            **admit_endpoints(endpoints, admission, timeouts),
+            "admission": {
+                "stats": partial(admission_stats, admission),
             },
         },
     )
@@ -4,7 +4,11 @@ This module provides encoder and decoder functions for Weaviate collection objec
 allowing them to be serialized and transferred through Hypha RPC.
 """
 
+import functools
+import hashlib
+import json
 import uuid
+from collections.abc import Iterable, Sequence
 from dataclasses import asdict
 from datetime import datetime
 from typing import Any
@@ -18,6 +22,14 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.internal import Object
 
+from .utils.models import ColumnarObjects
+from .utils.vector_utils import as_vector_array, pack_vectors
+
+# Maximum number of model classes generated from received schemas kept cached
+MAX_DECODED_MODELS = 256
+
+_decoded_models: dict[str, type[BaseModel]] = {}
+
 
 def encode_uuid(obj: uuid.UUID) -> str:
     """Encode UUID to string."""
@@ -35,13 +47,160 @@ def encode_object(obj: Object[object, object]) -> dict[str, object]:
     }
 
 
+def encode_columnar(
+    objects: Sequence[Object[Any, Any]],
+    metadata_fields: Iterable[str] = (),
+) -> ColumnarObjects:
+    """Encode Weaviate Objects as one array per field.
+
+    Collection names are stored once and referenced by index, objects missing a
+    property or vector get None in its column, and only the given metadata
+    fields are kept. Float vectors of equal length are packed into a binary
+    buffer; multi-vectors and vectors of mixed length stay lists.
+
+    Args:
+        objects: Objects returned by a query
+        metadata_fields: Names of the metadata fields to include
+
+    Returns:
+        Columnar representation of the objects
+
+    """
+    collections: dict[str, int] = {}
+    property_names: dict[str, None] = {}
+    vector_names: dict[str, None] = {}
+    for obj in objects:
+        collections.setdefault(obj.collection, len(collections))
+        property_names.update(dict.fromkeys(obj.properties or {}))
+        vector_names.update(dict.fromkeys(obj.vector or {}))
+
+    return ColumnarObjects(
+        format="columnar",
+        count=len(objects),
+        uuids=[str(obj.uuid) for obj in objects],
+        collections=list(collections),
+        collection_index=[collections[obj.collection] for obj in objects],
+        properties={
+            name: [(obj.properties or {}).get(name) for obj in objects]
+            for name in property_names
+        },
+        metadata={
+            field: [obj.metadata and getattr(obj.metadata, field) for obj in objects]
+            for field in metadata_fields
+        },
+        vectors={
+            name: pack_vectors([(obj.vector or {}).get(name) for obj in objects])
+            for name in vector_names
+        },
+    )
+
+
+def decode_columnar(columns: ColumnarObjects) -> list[dict[str, Any]]:
+    """Decode columnar query results into one dictionary per object.
+
+    Packed vectors are returned as rows of a numpy array.
+
+    Args:
+        columns: Columnar results returned by a query
+
+    Returns:
+        Objects with uuid, properties, metadata, vector and collection keys
+
+    """
+    vectors: dict[str, Any] = {
+        name: column if isinstance(column, list) else as_vector_array(column)
+        for name, column in columns["vectors"].items()
+    }
+
+    return [
+        {
+            "uuid": columns["uuids"][row],
+            "properties": {
+                name: values[row]
+                for name, values in columns["properties"].items()
+                if values[row] is not None
+            },
+            "metadata": {
+                field: values[row] for field, values in columns["metadata"].items()
+            },
+            "vector": {
+                name: values[row]
+                for name, values in vectors.items()
+                if values[row] is not None
+            },
+            "collection": columns["collections"][columns["collection_index"][row]],
+        }
+        for row in range(columns["count"])
+    ]
+
+
+def schema_hash(schema: dict[str, Any]) -> str:
+    """Hash a JSON schema independently of its key order."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@functools.cache
+def model_schema(model_type: type[BaseModel]) -> tuple[dict[str, Any], str]:
+    """Get the JSON schema of a pydantic model type and its hash, once per type."""
+    schema = model_type.model_json_schema()
+    return schema, schema_hash(schema)
+
+
+def model_from_schema(
+    schema: dict[str, Any] | None,
+    schema_ref: str | None = None,
+) -> type[BaseModel]:
+    """Get the model class generated from a schema, creating it only once.
+
+    Models are cached by schema hash. The hash sent along with a schema saves
+    hashing it again once a model was cached for it; new schemas are hashed
+    here, so a wrong reference is never cached.
+
+    Args:
+        schema: JSON schema of the model
+        schema_ref: Hash of the schema sent by the encoder
+
+    Returns:
+        The cached or newly generated model class
+
+    Raises:
+        ValueError: If no schema is given
+
+    """
+    if schema is None:
+        error_msg = "Pydantic model received without its schema"
+        raise ValueError(error_msg)
+
+    if schema_ref is not None:
+        model_type = _decoded_models.get(schema_ref)
+        if model_type is not None:
+            return model_type
+
+    schema_ref = schema_hash(schema)
+    model_type = _decoded_models.get(schema_ref)
+    if model_type is not None:
+        return model_type
+
+    if len(_decoded_models) >= MAX_DECODED_MODELS:
+        del _decoded_models[next(iter(_decoded_models))]
+    model_type = create_model_from_schema(schema)
+    _decoded_models[schema_ref] = model_type
+    return model_type
+
+
 def _datetime_encoder(dt: datetime) -> str:
     """Encode datetime to ISO format string."""
     return dt.isoformat()
 
 
 def register_weaviate_codecs(server: RemoteService) -> None:
-    """Register all Weaviate codecs with the Hypha server."""
+    """Register all Weaviate codecs with the Hypha server.
+
+    Pydantic schemas are generated once per model type and models are built
+    once per schema. Every message carries the full schema, as one connection
+    serves many peers and the encoder cannot know which of them has seen it.
+    """
     server.register_codec(
         {
             "name": "uuid-uuid",
@@ -54,20 +213,17 @@ def register_weaviate_codecs(server: RemoteService) -> None:
     # Override the built-in Pydantic codec to handle _FilterValue specially
     def custom_pydantic_encoder(obj: BaseModel) -> dict[str, object]:
         """Encode pydantic model with special case _FilterValue."""
-        if isinstance(obj, _FilterValue):
-            # Use model_dump("json") as suggested by maintainer
-            return {
-                "_rtype": "pydantic_model",
-                "_rvalue": obj.model_dump(mode="json"),
-                "_rschema": obj.model_json_schema(),
-                "_special_filter": True,  # Mark this as special
-            }
-
-        return {
+        schema, schema_ref = model_schema(type(obj))
+        encoded: dict[str, object] = {
             "_rtype": "pydantic_model",
+            # Use model_dump("json") as suggested by maintainer
             "_rvalue": obj.model_dump(mode="json"),
-            "_rschema": obj.model_json_schema(),
+            "_rschema": schema,
+            "_rschema_ref": schema_ref,
         }
+        if isinstance(obj, _FilterValue):
+            encoded["_special_filter"] = True  # Mark this as special
+        return encoded
 
     def custom_pydantic_decoder(encoded_obj: dict[str, Any]) -> BaseModel:
         """Decode pydantic model with special case _FilterValue."""
@@ -78,7 +234,10 @@ def register_weaviate_codecs(server: RemoteService) -> None:
                 data["operator"] = _Operator(data["operator"])
             return _FilterValue(**data)
 
-        model_type = create_model_from_schema(encoded_obj["_rschema"])
+        model_type = model_from_schema(
+            encoded_obj.get("_rschema"),
+            encoded_obj.get("_rschema_ref"),
+        )
         return model_type(**encoded_obj["_rvalue"])
 
     server.register_codec(
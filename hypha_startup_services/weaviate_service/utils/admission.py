@@ -0,0 +1,351 @@
+"""Admission control in front of the service endpoints.
+
+Every endpoint belongs to a class: "interactive" queries and lookups,
+"generative" LLM calls, or "bulk" writes, deletions and scans. A call waits
+in its class's queue until a slot is free: overall, for its class and for
+its workspace. Interactive calls are admitted before generative ones and
+those before bulk ones, so a bulk loader cannot starve queries. Token
+buckets per workspace and class reject calls above their rate; buckets of
+idle workspaces are evicted. Full queues reject new calls instead of
+growing without bound, and streams hold their slot for a bounded time.
+Queue times are recorded per class.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, get_args
+
+from hypha_startup_services.common.workspace_utils import ws_from_context
+
+from .models import AdmissionClassStats
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+EndpointClass = Literal["interactive", "generative", "bulk"]
+# Classes in order of priority
+ENDPOINT_CLASSES: tuple[EndpointClass, ...] = get_args(EndpointClass)
+
+# Maximum number of calls running at the same time across all classes
+ADMISSION_MAX_RUNNING = 64
+# Maximum number of calls of one workspace running at the same time
+WORKSPACE_MAX_RUNNING = 16
+# Workspace of calls without a context
+ANONYMOUS_WORKSPACE = "anonymous"
+# Number of token buckets above which refilled buckets are evicted
+BUCKET_EVICTION_THRESHOLD = 1024
+# Seconds a stream may hold its slot, including time its consumer stalls
+STREAM_MAX_SLOT_SECONDS = 600.0
+
+
+@dataclass(frozen=True)
+class ClassLimits:
+    """Limits of one endpoint class.
+
+    Attributes:
+        max_running: Maximum number of calls running at the same time
+        max_queued: Maximum number of calls waiting; later calls are rejected
+        rate: Calls per second a workspace may start (token refill rate), or
+            None for no rate limit
+        burst: Calls a workspace may start at once (token bucket size)
+
+    """
+
+    max_running: int
+    max_queued: int
+    rate: float | None = None
+    burst: float = 1
+
+
+DEFAULT_CLASS_LIMITS: dict[EndpointClass, ClassLimits] = {
+    "interactive": ClassLimits(max_running=48, max_queued=512),
+    "generative": ClassLimits(max_running=8, max_queued=64, rate=2, burst=10),
+    "bulk": ClassLimits(max_running=8, max_queued=128, rate=10, burst=50),
+}
+
+
+class AdmissionRejectedError(RuntimeError):
+    """Raised when a call exceeds a rate limit or finds its queue full.
+
+    Also raised by a stream that held its slot longer than allowed.
+    """
+
+
+@dataclass
+class _TokenBucket:
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.rate,
+        )
+        self.updated_at = now
+
+    def take(self) -> float:
+        """Take a token, or return the seconds until one is available."""
+        self.refill(time.monotonic())
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass
+class _Waiter:
+    workspace: str
+    future: asyncio.Future[None]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _ClassStats:
+    admitted: int = 0
+    rejected: int = 0
+    queue_seconds_total: float = 0.0
+    queue_seconds_max: float = 0.0
+
+
+class AdmissionController:
+    """Admit calls by priority within overall, class and workspace limits."""
+
+    def __init__(
+        self,
+        class_limits: dict[EndpointClass, ClassLimits] | None = None,
+        max_running: int = ADMISSION_MAX_RUNNING,
+        workspace_max_running: int = WORKSPACE_MAX_RUNNING,
+        stream_max_slot_seconds: float = STREAM_MAX_SLOT_SECONDS,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            class_limits: Limits per endpoint class, defaulting to
+                DEFAULT_CLASS_LIMITS for classes not given
+            max_running: Maximum number of calls running across all classes
+            workspace_max_running: Maximum number of calls of one workspace
+                running at the same time
+            stream_max_slot_seconds: Seconds an async generator endpoint may
+                hold its slot
+
+        """
+        self.class_limits = {**DEFAULT_CLASS_LIMITS, **(class_limits or {})}
+        self.max_running = max_running
+        self.workspace_max_running = workspace_max_running
+        self.stream_max_slot_seconds = stream_max_slot_seconds
+        self._queues: dict[EndpointClass, deque[_Waiter]] = {
+            endpoint_class: deque() for endpoint_class in ENDPOINT_CLASSES
+        }
+        self._running = 0
+        self._running_by_class: dict[EndpointClass, int] = defaultdict(int)
+        self._running_by_workspace: dict[str, int] = defaultdict(int)
+        self._buckets: dict[tuple[str, EndpointClass], _TokenBucket] = {}
+        self._evict_at = BUCKET_EVICTION_THRESHOLD
+        self._stats = {
+            endpoint_class: _ClassStats() for endpoint_class in ENDPOINT_CLASSES
+        }
+
+    async def acquire(self, workspace: str, endpoint_class: EndpointClass) -> None:
+        """Wait until a call may run.
+
+        The queue is checked before the rate limit, so calls rejected at a
+        full queue do not use up the workspace's rate.
+
+        Raises:
+            AdmissionRejectedError: If the workspace exceeds the class's rate
+                or the class's queue is full
+
+        """
+        limits = self.class_limits[endpoint_class]
+        stats = self._stats[endpoint_class]
+
+        queue = self._queues[endpoint_class]
+        if len(queue) >= limits.max_queued:
+            stats.rejected += 1
+            error_msg = f"Too many queued {endpoint_class} calls. Retry later."
+            raise AdmissionRejectedError(error_msg)
+
+        bucket = self._bucket(workspace, endpoint_class, limits)
+        retry_after = bucket.take() if bucket is not None else 0.0
+        if retry_after:
+            stats.rejected += 1
+            error_msg = (
+                f"Rate limit of {endpoint_class} calls exceeded for workspace "
+                f"{workspace}. Retry in {retry_after:.2f} seconds."
+            )
+            raise AdmissionRejectedError(error_msg)
+
+        waiter = _Waiter(workspace, asyncio.get_running_loop().create_future())
+        queue.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted right before being cancelled: give the slot back
+                self.release(workspace, endpoint_class)
+            else:
+                queue.remove(waiter)
+            raise
+
+        queued = time.monotonic() - waiter.enqueued_at
+        stats.admitted += 1
+        stats.queue_seconds_total += queued
+        stats.queue_seconds_max = max(stats.queue_seconds_max, queued)
+
+    def release(self, workspace: str, endpoint_class: EndpointClass) -> None:
+        """Free the slot of a finished call and admit waiting calls."""
+        self._running -= 1
+        self._running_by_class[endpoint_class] -= 1
+        self._running_by_workspace[workspace] -= 1
+        if not self._running_by_workspace[workspace]:
+            del self._running_by_workspace[workspace]
+        self._dispatch()
+
+    def stats(self) -> dict[EndpointClass, AdmissionClassStats]:
+        """Get admission counts and queue times per endpoint class."""
+        return {
+            endpoint_class: AdmissionClassStats(
+                running=self._running_by_class[endpoint_class],
+                queued=len(self._queues[endpoint_class]),
+                admitted=stats.admitted,
+                rejected=stats.rejected,
+                queue_seconds_total=stats.queue_seconds_total,
+                queue_seconds_max=stats.queue_seconds_max,
+                queue_seconds_mean=(
+                    stats.queue_seconds_total / stats.admitted
+                    if stats.admitted
+                    else 0.0
+                ),
+            )
+            for endpoint_class, stats in self._stats.items()
+        }
+
+    def wrap(
+        self,
+        endpoint: Callable[..., Any],
+        endpoint_class: EndpointClass,
+    ) -> Callable[..., Any]:
+        """Run an endpoint under admission control.
+
+        The workspace is read from the call's context. Async generator
+        endpoints hold their slot until the generator is exhausted or closed,
+        but for `stream_max_slot_seconds` at most. A stream whose consumer
+        stalls past that loses its slot and fails when it resumes.
+        """
+        if inspect.isasyncgenfunction(endpoint):
+
+            async def _stream(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+                workspace = _workspace(kwargs.get("context"))
+                await self.acquire(workspace, endpoint_class)
+                released = False
+
+                def _release() -> None:
+                    nonlocal released
+                    if not released:
+                        released = True
+                        self.release(workspace, endpoint_class)
+
+                expiry = asyncio.get_running_loop().call_later(
+                    self.stream_max_slot_seconds,
+                    _release,
+                )
+                error_msg = (
+                    f"Stream held its {endpoint_class} slot for more than "
+                    f"{self.stream_max_slot_seconds:g} seconds"
+                )
+                stream: AsyncGenerator[Any, None] = endpoint(*args, **kwargs)
+                try:
+                    async for item in stream:
+                        if released:
+                            raise AdmissionRejectedError(error_msg)
+                        yield item
+                        if released:
+                            raise AdmissionRejectedError(error_msg)
+                finally:
+                    expiry.cancel()
+                    _release()
+                    await stream.aclose()
+
+            return functools.update_wrapper(_stream, endpoint)
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            workspace = _workspace(kwargs.get("context"))
+            await self.acquire(workspace, endpoint_class)
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                self.release(workspace, endpoint_class)
+
+        return functools.update_wrapper(_call, endpoint)
+
+    def _bucket(
+        self,
+        workspace: str,
+        endpoint_class: EndpointClass,
+        limits: ClassLimits,
+    ) -> _TokenBucket | None:
+        if limits.rate is None:
+            return None
+        key = (workspace, endpoint_class)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self._evict_at:
+                self._evict_full_buckets()
+            bucket = _TokenBucket(limits.rate, limits.burst, limits.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _evict_full_buckets(self) -> None:
+        """Drop the buckets of idle workspaces.
+
+        A bucket that has refilled completely behaves like a new one, so
+        dropping it changes no limit. The threshold grows with the buckets
+        still in use to keep eviction cheap.
+        """
+        now = time.monotonic()
+        for key, bucket in list(self._buckets.items()):
+            bucket.refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del self._buckets[key]
+        self._evict_at = max(BUCKET_EVICTION_THRESHOLD, 2 * len(self._buckets))
+
+    def _dispatch(self) -> None:
+        """Admit waiting calls in priority order while slots are free.
+
+        Within a class, calls of workspaces at their limit are skipped so that
+        other workspaces are not blocked behind them.
+        """
+        for endpoint_class in ENDPOINT_CLASSES:
+            queue = self._queues[endpoint_class]
+            limit = self.class_limits[endpoint_class].max_running
+            for waiter in list(queue):
+                if self._running >= self.max_running:
+                    return
+                if self._running_by_class[endpoint_class] >= limit:
+                    break
+                if (
+                    self._running_by_workspace.get(waiter.workspace, 0)
+                    >= self.workspace_max_running
+                ):
+                    continue
+                queue.remove(waiter)
+                self._running += 1
+                self._running_by_class[endpoint_class] += 1
+                self._running_by_workspace[waiter.workspace] += 1
+                waiter.future.set_result(None)
+
+
+def _workspace(context: dict[str, Any] | None) -> str:
+    if context is None:
+        return ANONYMOUS_WORKSPACE
+    return ws_from_context(context)
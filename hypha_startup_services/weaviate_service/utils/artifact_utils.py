@@ -1,10 +1,17 @@
 """Artifact util functions."""
 
 import logging
+import time
+from typing import Any, cast
+
+from hypha_rpc.rpc import RemoteException
 
 from hypha_startup_services.common.artifacts import (
+    artifact_edit,
     create_artifact,
     delete_artifact,
+    get_artifact,
+    is_artifact_not_found,
 )
 from hypha_startup_services.common.constants import (
     ADMIN_WORKSPACES,
@@ -21,10 +28,19 @@ from .models import (
     ApplicationArtifactReturn,
     CollectionArtifactParams,
     CollectionConfig,
+    CollectionPartitioning,
+    QueryDefaults,
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds the partitioning of a collection is cached before it is read again,
+# so other service processes see collections recreated with another one
+PARTITIONING_CACHE_SECONDS = 60.0
+
+# Partitioning and expiry time (monotonic) of collections by artifact name
+_collection_partitioning: dict[str, tuple[CollectionPartitioning, float]] = {}
+
 
 def get_collection_artifact_name(short_name: str) -> str:
     """Create a full collection artifact name."""
@@ -69,6 +85,7 @@ async def delete_collection_artifacts(short_names: list[str]) -> None:
 
     """
     for coll_name in short_names:
+        _collection_partitioning.pop(get_collection_artifact_name(coll_name), None)
         await delete_collection_artifact(
             coll_name,
         )
@@ -96,6 +113,60 @@ async def create_collection_artifact(
     await create_artifact(
         artifact_params=artifact_params,
     )
+    _collection_partitioning[artifact_params.artifact_name] = (
+        settings.get("partitioning", "workspace"),
+        time.monotonic() + PARTITIONING_CACHE_SECONDS,
+    )
+
+
+async def get_collection_partitioning(
+    collection_name: str,
+) -> CollectionPartitioning:
+    """Get how applications of a collection map to tenants.
+
+    The partitioning is read from the collection artifact and cached for
+    PARTITIONING_CACHE_SECONDS. Collections without an artifact count as
+    partitioned by workspace, the partitioning of collections created without
+    one; the artifact is read again on the next call.
+
+    Args:
+        collection_name: Short collection name
+
+    Returns:
+        "application" if every application has its own tenant, else "workspace"
+
+    Raises:
+        RemoteException: If the artifact cannot be read for another reason
+            than not existing
+
+    """
+    artifact_name = get_collection_artifact_name(collection_name)
+    cached = _collection_partitioning.get(artifact_name)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    try:
+        artifact = await get_artifact(artifact_name)
+    except RemoteException as e:
+        if not is_artifact_not_found(e):
+            raise
+        logger.warning(
+            "Collection %s has no artifact, assuming it is partitioned by workspace",
+            collection_name,
+        )
+        return "workspace"
+
+    manifest = cast("dict[str, Any]", artifact.get("manifest") or {})
+    settings = cast(
+        "CollectionConfig",
+        manifest.get("metadata", {}).get("settings", {}),
+    )
+    partitioning = settings.get("partitioning", "workspace")
+    _collection_partitioning[artifact_name] = (
+        partitioning,
+        time.monotonic() + PARTITIONING_CACHE_SECONDS,
+    )
+    return partitioning
 
 
 async def create_application_artifact(
@@ -104,6 +175,8 @@ async def create_application_artifact(
     description: str,
     user_ws: str,
     caller_ws: str,
+    *,
+    query_defaults: QueryDefaults | None = None,
 ) -> ApplicationArtifactReturn:
     """Create an application artifact.
 
@@ -113,6 +186,7 @@ async def create_application_artifact(
         description: Application description
         user_ws: User workspace
         caller_ws: Caller workspace
+        query_defaults: Query options applied to queries of the application
 
     Returns:
         Result of artifact creation
@@ -129,13 +203,13 @@ async def create_application_artifact(
         metadata={
             "application_id": application_id,
             "short_collection_name": collection_name,
+            "query_defaults": query_defaults or {},
         },
     )
 
     result = await create_artifact(
         artifact_params=artifact_params,
     )
-
     return {
         "artifact_name": artifact_params.artifact_name,
         "description": description,
@@ -166,3 +240,65 @@ async def delete_application_artifact(
     await delete_artifact(
         artifact_name,
     )
+
+
+async def get_application_artifact(
+    collection_name: str,
+    application_id: str,
+    user_ws: str,
+) -> dict[str, object] | None:
+    """Read the artifact of an application.
+
+    Args:
+        collection_name: Short collection name
+        application_id: Application ID
+        user_ws: Workspace owning the application
+
+    Returns:
+        The artifact, or None if the application does not exist
+
+    """
+    artifact_name = get_application_artifact_name(
+        get_full_collection_name(collection_name),
+        user_ws,
+        application_id,
+    )
+    try:
+        return await get_artifact(artifact_name)
+    except RemoteException:
+        logger.debug("Artifact '%s' does not exist.", artifact_name)
+        return None
+
+
+def application_query_defaults(artifact: dict[str, object]) -> QueryDefaults:
+    """Get the query defaults stored in an application artifact.
+
+    Returns:
+        Query options applied unless a query sets them
+
+    """
+    manifest = cast("dict[str, Any]", artifact.get("manifest") or {})
+    return cast(
+        "QueryDefaults",
+        manifest.get("metadata", {}).get("query_defaults") or {},
+    )
+
+
+async def set_application_query_defaults(
+    artifact_name: str,
+    query_defaults: QueryDefaults,
+) -> None:
+    """Store the query defaults of an application in its artifact.
+
+    Args:
+        artifact_name: Name of the application artifact
+        query_defaults: Query options applied to queries of the application
+
+    """
+    artifact = await get_artifact(artifact_name)
+    manifest = dict(cast("dict[str, Any]", artifact.get("manifest") or {}))
+    manifest["metadata"] = {
+        **manifest.get("metadata", {}),
+        "query_defaults": query_defaults,
+    }
+    await artifact_edit(artifact_id=artifact_name, manifest=manifest)
@@ -1,15 +1,19 @@
 """Utility functions for managing Weaviate collections."""
 
+import hashlib
+import json
+import re
 import uuid as uuid_class
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, TypedDict, TypeVar, cast
+import weakref
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict, TypeVar, cast
 
 from weaviate import WeaviateAsyncClient
 from weaviate.classes.data import DataObject
 from weaviate.classes.query import Filter
 from weaviate.classes.tenants import Tenant
 from weaviate.collections import CollectionAsync
-from weaviate.collections.classes.batch import ErrorObject
+from weaviate.collections.classes.batch import BatchObject, ErrorObject
 from weaviate.collections.classes.filters import (
     _Filters,  # type: ignore[reportPrivateUsage]
 )
@@ -20,14 +24,34 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import WeaviateProperties
 
+from .artifact_utils import get_collection_partitioning
+from .config_cache import config_cache
 from .format_utils import (
     get_full_collection_name,
     get_short_name,
 )
+from .models import DataDeleteManyReturn, QueryDefaults
+from .vector_utils import decode_vector
 
 if TYPE_CHECKING:
+    from weaviate.collections.classes.data import DeleteManyReturn
+    from weaviate.collections.classes.internal import QueryReturn
     from weaviate.types import UUID, VECTORS
 
+# Number of objects looked up and deleted per request when deleting an application
+APP_DELETE_PAGE_SIZE = 1000
+# Maximum length of a Weaviate tenant name
+MAX_TENANT_NAME_LENGTH = 64
+# Separates workspace and application in the tenant names of applications
+APPLICATION_TENANT_SEPARATOR = "__"
+
+# Tenant collections returned for the tenant of a single application
+_application_tenant_collections: "weakref.WeakSet[CollectionAsync]" = weakref.WeakSet()
+# Query defaults of the application a tenant collection was prepared for
+_tenant_query_defaults: "weakref.WeakKeyDictionary[CollectionAsync, QueryDefaults]" = (
+    weakref.WeakKeyDictionary()
+)
+
 P = TypeVar("P")
 R = TypeVar("R")
 
@@ -39,20 +63,68 @@ class InsertManyReturn(TypedDict):
     errors: dict[str, ErrorObject]
     uuids: dict[str, uuid_class.UUID]
     has_errors: bool
+    skipped: NotRequired[list[str]]
+
+
+def deterministic_uuid(
+    application_id: str,
+    properties: dict[str, Any],
+    id_property: str | None = None,
+) -> uuid_class.UUID:
+    """Derive a stable UUIDv5 for an object of an application.
+
+    The key is the value of `id_property` (plus the chunk index of chunked
+    objects), or a hash of all properties if no property is given. The same
+    object therefore always gets the same UUID within an application.
+
+    Args:
+        application_id: ID of the application the object belongs to
+        properties: Properties of the object
+        id_property: Optional property holding a unique key of the object
+
+    Returns:
+        The derived UUID
+
+    """
+    if id_property is None:
+        content = json.dumps(properties, sort_keys=True, default=str)
+        key = hashlib.sha256(content.encode()).hexdigest()
+    else:
+        value = properties.get(id_property)
+        if value is None or value == "":
+            error_msg = f"Object has no value for id_property '{id_property}'"
+            raise ValueError(error_msg)
+        key = f"{id_property}={value}"
+        chunk_index = properties.get("chunk_index")
+        if chunk_index is not None:
+            key = f"{key}#{chunk_index}"
+
+    namespace = uuid_class.uuid5(uuid_class.NAMESPACE_URL, application_id)
+    return uuid_class.uuid5(namespace, key)
 
 
 def to_data_object(
     obj: dict[str, Any],
+    uuid_namespace: str | None = None,
+    id_property: str | None = None,
 ) -> DataObject[WeaviateProperties, ReferenceInputs]:
-    """Convert a dictionary to a DataObject."""
+    """Convert a dictionary to a DataObject.
+
+    If `uuid_namespace` is given and the object has no UUID, a deterministic
+    UUID is derived from it (see `deterministic_uuid`). Vectors given as NumPy
+    arrays or packed bytes are passed on as float32 arrays.
+    """
     props = dict(obj)
 
     raw_vector = props.pop("vector", None)
     raw_uuid = props.pop("uuid", props.pop("id", None))
     raw_references = props.pop("references", None)
 
+    if raw_uuid is None and uuid_namespace is not None:
+        raw_uuid = deterministic_uuid(uuid_namespace, props, id_property)
+
     uuid_value = raw_uuid if raw_uuid is not None else None
-    vector_value = raw_vector if raw_vector is not None else None
+    vector_value = decode_vector(raw_vector)
 
     return DataObject(
         properties=cast("WeaviateProperties", props),
@@ -62,6 +134,32 @@ def to_data_object(
     )
 
 
+def invalid_object_error(
+    tenant_collection: CollectionAsync,
+    index: int,
+    message: str,
+) -> ErrorObject:
+    """Describe an object that could not be converted for insertion.
+
+    Args:
+        tenant_collection: Collection the object was to be inserted into
+        index: Position of the object in the inserted batch
+        message: Why the object could not be converted
+
+    Returns:
+        An error in the form Weaviate reports failed batch objects
+
+    """
+    return ErrorObject(
+        message=message,
+        object_=BatchObject(
+            collection=tenant_collection.name,
+            tenant=tenant_collection.tenant,
+            index=index,
+        ),
+    )
+
+
 def acquire_collection(
     client: WeaviateAsyncClient,
     collection_name: str,
@@ -85,6 +183,11 @@ def create_application_filter(application_id: str) -> _Filters:
     return Filter.by_property("application_id").equal(application_id)
 
 
+def create_ids_filter(uuids: "Sequence[UUID]") -> _Filters:
+    """Create a filter matching any of the given object UUIDs."""
+    return Filter.by_id().contains_any(uuids)
+
+
 def and_app_filter(
     application_id: str,
     current_filter: _Filters | None = None,
@@ -106,9 +209,85 @@ def and_app_filter(
     return current_filter & app_filter
 
 
-def format_tenant_name(tenant_name: str) -> str:
-    """Format tenant name to lowercase and replace spaces with underscores."""
-    return tenant_name.lower().replace("|", "_")
+async def delete_application_objects(
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    page_size: int = APP_DELETE_PAGE_SIZE,
+    on_page: Callable[[int], None] | None = None,
+) -> DataDeleteManyReturn:
+    """Delete all objects of an application in bounded pages.
+
+    A single delete_many is capped by the server at QUERY_MAXIMUM_RESULTS
+    matches, so the IDs of up to `page_size` objects are fetched and deleted
+    until no objects are left. Every page is independent, so an interrupted
+    deletion is resumed by calling this function again.
+
+    Args:
+        tenant_collection: Tenant collection holding the objects
+        application_id: ID of the application whose objects are deleted
+        page_size: Number of objects deleted per request
+        on_page: Optional callback receiving the number of objects deleted
+            by each page
+
+    Returns:
+        Dictionary with the summed deletion results of all pages
+
+    Raises:
+        RuntimeError: If a page deletes none of its objects
+
+    """
+    app_filter = create_application_filter(application_id)
+    result = DataDeleteManyReturn(failed=0, matches=0, objects=None, successful=0)
+    while True:
+        response = cast(
+            "QueryReturn[object, object]",
+            await tenant_collection.query.fetch_objects(
+                filters=app_filter,
+                limit=page_size,
+                return_properties=[],
+            ),
+        )
+        page = [obj.uuid for obj in response.objects]
+        if not page:
+            return result
+
+        deleted = cast(
+            "DeleteManyReturn[None]",
+            await tenant_collection.data.delete_many(
+                where=and_app_filter(application_id, create_ids_filter(page)),
+            ),
+        )
+        result["failed"] += deleted.failed
+        result["matches"] += deleted.matches
+        result["successful"] += deleted.successful
+        if deleted.successful == 0:
+            error_msg = (
+                f"Deleting objects of application {application_id} made no "
+                f"progress: {deleted.failed} of {len(page)} objects failed"
+            )
+            raise RuntimeError(error_msg)
+        if on_page is not None:
+            on_page(deleted.successful)
+
+
+def format_tenant_name(tenant_name: str, application_id: str | None = None) -> str:
+    """Format tenant name to lowercase and replace spaces with underscores.
+
+    With an application ID, the name of the application's own tenant in a
+    collection partitioned by application is returned. Names Weaviate would
+    reject, by length or characters, are shortened with a hash of the name.
+    """
+    formatted = tenant_name.lower().replace("|", "_")
+    if application_id is None:
+        return formatted
+
+    app_tenant_name = f"{formatted}{APPLICATION_TENANT_SEPARATOR}{application_id}"
+    safe_name = re.sub(r"[^A-Za-z0-9_-]", "_", app_tenant_name)
+    if safe_name == app_tenant_name and len(safe_name) <= MAX_TENANT_NAME_LENGTH:
+        return safe_name
+
+    digest = hashlib.sha256(app_tenant_name.encode()).hexdigest()[:16]
+    return f"{safe_name[: MAX_TENANT_NAME_LENGTH - len(digest) - 1]}_{digest}"
 
 
 async def is_multitenancy_enabled(
@@ -116,19 +295,47 @@ async def is_multitenancy_enabled(
     collection_name: str,
 ) -> bool:
     """Check if multitenancy is enabled for the collection."""
-    collection = acquire_collection(client, collection_name)
-    collection_config = await collection.config.get()
+    collection_config = await config_cache.get(
+        client,
+        get_full_collection_name(collection_name),
+    )
     return collection_config.multi_tenancy_config.enabled
 
 
+async def partition_application(
+    collection_name: str,
+    application_id: str | None,
+) -> str | None:
+    """Get the application a tenant is partitioned by, if any.
+
+    Returns:
+        The application ID if the collection gives every application its own
+        tenant, else None
+
+    """
+    if application_id is None:
+        return None
+    if await get_collection_partitioning(collection_name) != "application":
+        return None
+    return application_id
+
+
 async def add_tenant_if_not_exists(
     client: WeaviateAsyncClient,
     collection_name: str,
     tenant_name: str,
+    application_id: str | None = None,
 ) -> None:
-    """Add a tenant to the collection if it doesn't already exist."""
+    """Add a tenant to the collection if it doesn't already exist.
+
+    In collections partitioned by application, the tenant of the application
+    is added if `application_id` is given.
+    """
     collection = acquire_collection(client, collection_name)
-    formatted_tenant_name = format_tenant_name(tenant_name)
+    formatted_tenant_name = format_tenant_name(
+        tenant_name,
+        await partition_application(collection_name, application_id),
+    )
     existing_tenant = await collection.tenants.get_by_name(formatted_tenant_name)
     if existing_tenant is None or existing_tenant.name != formatted_tenant_name:
         await collection.tenants.create(
@@ -140,11 +347,82 @@ async def get_tenant_collection(
     client: WeaviateAsyncClient,
     collection_name: str,
     tenant_name: str,
+    application_id: str | None = None,
 ) -> CollectionAsync:
-    """Get the tenant collection from the client."""
+    """Get the tenant collection from the client.
+
+    In collections partitioned by application, the tenant of the application
+    is returned if `application_id` is given.
+    """
     collection = acquire_collection(client, collection_name)
     if await is_multitenancy_enabled(client, collection_name):
-        formatted_tenant_name = format_tenant_name(tenant_name)
-        return collection.with_tenant(formatted_tenant_name)
+        partition = await partition_application(collection_name, application_id)
+        formatted_tenant_name = format_tenant_name(tenant_name, partition)
+        tenant_collection = collection.with_tenant(formatted_tenant_name)
+        if partition is not None:
+            _application_tenant_collections.add(tenant_collection)
+        return tenant_collection
 
     return collection
+
+
+def is_application_tenant(tenant_collection: CollectionAsync) -> bool:
+    """Check if a tenant collection holds the objects of a single application."""
+    return tenant_collection in _application_tenant_collections
+
+
+def attach_query_defaults(
+    tenant_collection: CollectionAsync,
+    query_defaults: QueryDefaults,
+) -> None:
+    """Remember the query defaults of the application a collection serves."""
+    _tenant_query_defaults[tenant_collection] = query_defaults
+
+
+def query_defaults_of(tenant_collection: CollectionAsync) -> QueryDefaults:
+    """Get the query defaults attached to a tenant collection, if any."""
+    return _tenant_query_defaults.get(tenant_collection, {})
+
+
+def scope_to_application(
+    tenant_collection: CollectionAsync,
+    application_id: str,
+    current_filter: _Filters | None = None,
+) -> _Filters | None:
+    """Restrict a filter to the objects of an application.
+
+    Tenants of collections partitioned by application only hold objects of
+    their application, so the filter is left unchanged and vector searches
+    on them run unfiltered.
+    """
+    if is_application_tenant(tenant_collection):
+        return current_filter
+    return and_app_filter(application_id, current_filter)
+
+
+async def delete_application_tenant(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    tenant_collection: CollectionAsync,
+) -> DataDeleteManyReturn:
+    """Delete the tenant of an application together with all its objects.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Name of the collection partitioned by application
+        tenant_collection: Tenant collection of the application
+
+    Returns:
+        Dictionary with the number of deleted objects
+
+    """
+    aggregate = await tenant_collection.aggregate.over_all(total_count=True)
+    count = aggregate.total_count or 0
+    collection = acquire_collection(client, collection_name)
+    await collection.tenants.remove([cast("str", tenant_collection.tenant)])
+    return DataDeleteManyReturn(
+        failed=0,
+        matches=count,
+        objects=None,
+        successful=count,
+    )
@@ -0,0 +1,243 @@
+"""Process-wide cache of Weaviate collection configurations.
+
+Fetching a collection's configuration costs a schema request, and listing all
+collections downloads every schema. The cache keeps the configurations for a
+short time, converts them to dictionaries or summaries only when asked, and
+stamps every collection with a version derived from the content of its schema,
+so clients can skip collections they have already seen. Versions therefore
+agree between service processes and survive restarts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
+
+from .format_utils import config_with_short_name, get_short_name
+from .models import CollectionSummary
+
+if TYPE_CHECKING:
+    from weaviate import WeaviateAsyncClient
+    from weaviate.collections.classes.config import _CollectionConfig
+
+    from .models import CollectionConfig
+
+# Seconds a fetched configuration is served from the cache
+DEFAULT_CONFIG_CACHE_TTL = 30.0
+
+
+@dataclass
+class _CachedConfig:
+    config: _CollectionConfig
+    fetched_at: float
+    full: CollectionConfig | None = None
+    summary: CollectionSummary | None = None
+
+
+@dataclass
+class _ClientConfigs:
+    entries: dict[str, _CachedConfig] = field(default_factory=dict)
+    listed_at: float | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def config_version(config: _CollectionConfig) -> str:
+    """Get a version stamp that changes whenever a configuration does.
+
+    Returns:
+        A hash of the configuration's content
+
+    """
+    content = json.dumps(config.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def summarize_config(config: _CollectionConfig, version: str) -> CollectionSummary:
+    """Summarize a collection configuration without converting it to a dict.
+
+    Args:
+        config: Configuration of the collection
+        version: Version stamp of the configuration
+
+    Returns:
+        Short name, description, multi-tenancy, property names and the index
+        type of every vector
+
+    """
+    if config.vector_config:
+        vectors = {
+            name: vector.vector_index_config.vector_index_type()
+            for name, vector in config.vector_config.items()
+        }
+    elif config.vector_index_type is not None:
+        vectors = {"default": config.vector_index_type.value}
+    else:
+        vectors = {}
+
+    return CollectionSummary(
+        name=get_short_name(config.name),
+        description=config.description,
+        multi_tenancy=config.multi_tenancy_config.enabled,
+        properties=[prop.name for prop in config.properties],
+        vectors=vectors,
+        version=version,
+    )
+
+
+class CollectionConfigCache:
+    """Cache collection configurations by client and full collection name.
+
+    Clients may connect to different Weaviate instances, so every client has
+    its own entries. Entries expire after `ttl` seconds. Collections created,
+    changed or deleted through the service are invalidated right away;
+    changes made elsewhere show up once the entry has expired.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CONFIG_CACHE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a fetched configuration is served from the cache
+
+        """
+        self.ttl = ttl
+        self._clients: weakref.WeakKeyDictionary[
+            WeaviateAsyncClient,
+            _ClientConfigs,
+        ] = weakref.WeakKeyDictionary()
+
+    async def get(
+        self,
+        client: WeaviateAsyncClient,
+        full_name: str,
+    ) -> _CollectionConfig:
+        """Get the configuration of a collection."""
+        return (await self._entry(client, full_name)).config
+
+    async def get_dict(
+        self,
+        client: WeaviateAsyncClient,
+        full_name: str,
+    ) -> CollectionConfig:
+        """Get the configuration of a collection as a dict with its short name."""
+        return self._full(await self._entry(client, full_name))
+
+    async def list_all(
+        self,
+        client: WeaviateAsyncClient,
+        *,
+        simple: bool = False,
+    ) -> dict[str, CollectionConfig | CollectionSummary]:
+        """Get the configurations of all collections by short name.
+
+        Args:
+            client: WeaviateAsyncClient instance
+            simple: Whether to return summaries instead of full configurations
+
+        Returns:
+            Dictionary mapping short collection names to their configuration
+
+        """
+        cached = self._configs(client)
+        async with cached.lock:
+            if cached.listed_at is None or self._expired(cached.listed_at):
+                configs = await client.collections.list_all(simple=False)
+                for full_name in set(cached.entries) - set(configs):
+                    del cached.entries[full_name]
+                for full_name, config in configs.items():
+                    self._store(cached, full_name, config)
+                cached.listed_at = time.monotonic()
+            entries = dict(cached.entries)
+
+        return {
+            get_short_name(full_name): (
+                self._summary(entry) if simple else self._full(entry)
+            )
+            for full_name, entry in entries.items()
+        }
+
+    def invalidate(self, full_name: str | None = None) -> None:
+        """Drop the cached configuration of one collection, or of all.
+
+        The configuration is dropped for every client.
+        """
+        for cached in self._clients.values():
+            cached.listed_at = None
+            if full_name is None:
+                cached.entries.clear()
+            else:
+                cached.entries.pop(full_name, None)
+
+    def _configs(self, client: WeaviateAsyncClient) -> _ClientConfigs:
+        cached = self._clients.get(client)
+        if cached is None:
+            cached = self._clients[client] = _ClientConfigs()
+        return cached
+
+    async def _entry(
+        self,
+        client: WeaviateAsyncClient,
+        full_name: str,
+    ) -> _CachedConfig:
+        cached = self._configs(client)
+        entry = cached.entries.get(full_name)
+        if entry is None or self._expired(entry.fetched_at):
+            config = await client.collections.get(full_name).config.get()
+            entry = self._store(cached, full_name, config)
+        return entry
+
+    @staticmethod
+    def _store(
+        cached: _ClientConfigs,
+        full_name: str,
+        config: _CollectionConfig,
+    ) -> _CachedConfig:
+        previous = cached.entries.get(full_name)
+        if previous is not None and previous.config == config:
+            previous.fetched_at = time.monotonic()
+            return previous
+
+        entry = _CachedConfig(config=config, fetched_at=time.monotonic())
+        cached.entries[full_name] = entry
+        return entry
+
+    def _expired(self, fetched_at: float) -> bool:
+        return time.monotonic() - fetched_at > self.ttl
+
+    @staticmethod
+    def _full(entry: _CachedConfig) -> CollectionConfig:
+        if entry.full is None:
+            entry.full = config_with_short_name(entry.config)
+        return entry.full
+
+    @staticmethod
+    def _summary(entry: _CachedConfig) -> CollectionSummary:
+        if entry.summary is None:
+            entry.summary = summarize_config(
+                entry.config,
+                config_version(entry.config),
+            )
+        return entry.summary
+
+
+def project_fields(
+    configs: dict[str, CollectionConfig | CollectionSummary],
+    fields: list[str],
+) -> dict[str, dict[str, object]]:
+    """Keep only the given top-level fields of every configuration."""
+    return {
+        name: {
+            field: cast("dict[str, object]", config)[field]
+            for field in fields
+            if field in config
+        }
+        for name, config in configs.items()
+    }
+
+
+config_cache = CollectionConfigCache()
@@ -0,0 +1,142 @@
+"""Deadlines for endpoint calls.
+
+A Hypha call can time out on the client while the service keeps working on
+it. Every endpoint call therefore runs until a deadline: a default timeout of
+the endpoint, shortened by the `deadline` of the call's context when the
+caller sets an earlier one. When the deadline passes, the call is cancelled.
+That cancels whatever it is waiting on, such as its admission slot, artifact
+reads, permission checks in `prepare_tenant_collection`, or Weaviate
+requests, and the caller gets a DeadlineExceededError. Work nobody waits for anymore is
+shed instead of piling up under load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator, Callable
+
+    from .admission import EndpointClass
+
+# Default seconds a call of each endpoint class may run
+DEFAULT_ENDPOINT_TIMEOUTS: dict[EndpointClass, float] = {
+    "interactive": 30.0,
+    "generative": 120.0,
+    "bulk": 600.0,
+}
+# Context key holding the caller's deadline as a Unix timestamp
+CONTEXT_DEADLINE_KEY = "deadline"
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call does not finish before its deadline."""
+
+
+def call_deadline(context: dict[str, Any] | None, timeout: float) -> float:
+    """Get the deadline of a call in event loop time.
+
+    A caller's deadline can shorten the call but never extend it beyond
+    `timeout`, so callers cannot turn off shedding.
+
+    Args:
+        context: Context of the call, possibly holding the caller's deadline
+        timeout: Seconds the call may run at most
+
+    Returns:
+        The earlier of the caller's deadline and `timeout` seconds from now
+
+    Raises:
+        ValueError: If the caller's deadline is not a finite Unix timestamp
+
+    """
+    loop = asyncio.get_running_loop()
+    default_deadline = loop.time() + timeout
+    caller_deadline = (context or {}).get(CONTEXT_DEADLINE_KEY)
+    if caller_deadline is None:
+        return default_deadline
+    if (
+        isinstance(caller_deadline, bool)
+        or not isinstance(caller_deadline, int | float)
+        or not math.isfinite(caller_deadline)
+    ):
+        error_msg = (
+            f"Invalid '{CONTEXT_DEADLINE_KEY}' in the call context: "
+            f"{caller_deadline!r}. Expected a Unix timestamp in seconds."
+        )
+        raise ValueError(error_msg)
+    return min(default_deadline, loop.time() + caller_deadline - time.time())
+
+
+@asynccontextmanager
+async def run_until(deadline: float, name: str) -> AsyncIterator[None]:
+    """Cancel the enclosed work once `deadline` (event loop time) passes.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed, before or while the
+            enclosed work runs
+
+    """
+    error_msg = f"Call to {name} did not finish before its deadline"
+    if deadline <= asyncio.get_running_loop().time():
+        raise DeadlineExceededError(error_msg)
+
+    scope = asyncio.timeout_at(deadline)
+    try:
+        async with scope:
+            yield
+    except TimeoutError as e:
+        if not scope.expired():
+            raise
+        raise DeadlineExceededError(error_msg) from e
+
+
+def with_deadline(
+    endpoint: Callable[..., Any],
+    timeout: float,
+    name: str,
+) -> Callable[..., Any]:
+    """Run an endpoint until the deadline of each call.
+
+    The deadline of an async generator endpoint covers the whole stream,
+    including the time its consumer takes between items. A stream past its
+    deadline fails when it is read again.
+
+    Args:
+        endpoint: Endpoint taking the call's context as `context` keyword
+        timeout: Seconds a call may run at most
+        name: Name of the endpoint used in error messages
+
+    Returns:
+        The endpoint, cancelled once a call exceeds its deadline
+
+    """
+    if inspect.isasyncgenfunction(endpoint):
+
+        async def _stream(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+            deadline = call_deadline(kwargs.get("context"), timeout)
+            stream: AsyncGenerator[Any, None] = endpoint(*args, **kwargs)
+            try:
+                while True:
+                    async with run_until(deadline, name):
+                        try:
+                            item = await anext(stream)
+                        except StopAsyncIteration:
+                            return
+                    yield item
+            finally:
+                await stream.aclose()
+
+        return functools.update_wrapper(_stream, endpoint)
+
+    async def _call(*args: Any, **kwargs: Any) -> Any:
+        async with run_until(call_deadline(kwargs.get("context"), timeout), name):
+            return await endpoint(*args, **kwargs)
+
+    return functools.update_wrapper(_call, endpoint)
@@ -0,0 +1,153 @@
+"""Compact JSON filter DSL compiled to Weaviate filters.
+
+Weaviate filter objects travel over Hypha RPC as pydantic models with their
+JSON schema. A filter can instead be written as plain JSON:
+
+    {"and": [{"eq": ["entity_type", "node"]}, {"gte": ["year", 2000]}]}
+
+A condition maps one operator to `[property, value]`. "and" and "or" take a
+list of filters. The properties "_id", "_creation_time" and "_update_time"
+filter on object metadata, with times given as ISO 8601 strings. Compiled
+filters are cached by their canonical JSON, which also serves as a stable
+cache key for the query.
+"""
+
+import functools
+import json
+from datetime import datetime
+from typing import Any
+
+from weaviate.classes.query import Filter
+from weaviate.collections.classes.filters import (
+    _Filters,  # type: ignore[reportPrivateUsage]
+)
+
+# Number of compiled filters kept in the cache
+FILTER_CACHE_SIZE = 1024
+
+# DSL operators and the corresponding methods of a Weaviate filter builder
+CONDITION_OPERATORS = {
+    "eq": "equal",
+    "ne": "not_equal",
+    "gt": "greater_than",
+    "gte": "greater_or_equal",
+    "lt": "less_than",
+    "lte": "less_or_equal",
+    "like": "like",
+    "contains_any": "contains_any",
+    "contains_all": "contains_all",
+    "is_null": "is_none",
+}
+LOGICAL_OPERATORS = ("and", "or")
+
+# Operators supported by the object metadata properties
+_ID_OPERATORS = frozenset({"eq", "ne", "contains_any"})
+_TIME_OPERATORS = frozenset({"eq", "ne", "gt", "gte", "lt", "lte", "contains_any"})
+
+FilterDSL = dict[str, Any]
+
+
+def canonical_filter(dsl: FilterDSL) -> str:
+    """Serialize a filter to canonical JSON, independent of key order."""
+    return json.dumps(dsl, sort_keys=True, separators=(",", ":"))
+
+
+def _parse_time(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_parse_time(item) for item in value]
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        error_msg = f"Times must be ISO 8601 strings, got {value!r}"
+        raise ValueError(error_msg) from e
+
+
+def _compile_condition(operator: str, operands: Any, path: str) -> _Filters:
+    if not isinstance(operands, list) or len(operands) != 2:  # noqa: PLR2004
+        error_msg = f"{path}: '{operator}' takes a [property, value] pair"
+        raise ValueError(error_msg)
+
+    prop, value = operands
+    if not isinstance(prop, str) or not prop:
+        error_msg = f"{path}: property must be a non-empty string, got {prop!r}"
+        raise ValueError(error_msg)
+
+    if prop == "_id":
+        allowed, builder = _ID_OPERATORS, Filter.by_id()
+    elif prop in ("_creation_time", "_update_time"):
+        allowed = _TIME_OPERATORS
+        builder = (
+            Filter.by_creation_time()
+            if prop == "_creation_time"
+            else Filter.by_update_time()
+        )
+        value = _parse_time(value)
+    else:
+        allowed, builder = frozenset(CONDITION_OPERATORS), Filter.by_property(prop)
+
+    if operator not in allowed:
+        error_msg = f"{path}: '{operator}' is not supported on '{prop}'"
+        raise ValueError(error_msg)
+
+    return getattr(builder, CONDITION_OPERATORS[operator])(value)
+
+
+def _compile(dsl: Any, path: str) -> _Filters:
+    if not isinstance(dsl, dict) or len(dsl) != 1:
+        error_msg = f"{path}: a filter must be an object with exactly one operator"
+        raise ValueError(error_msg)
+
+    ((operator, operands),) = dsl.items()
+    if operator in LOGICAL_OPERATORS:
+        if not isinstance(operands, list) or not operands:
+            error_msg = f"{path}: '{operator}' takes a non-empty list of filters"
+            raise ValueError(error_msg)
+        compiled = [
+            _compile(operand, f"{path}.{operator}[{index}]")
+            for index, operand in enumerate(operands)
+        ]
+        if operator == "and":
+            return Filter.all_of(compiled)
+        return Filter.any_of(compiled)
+
+    if operator in CONDITION_OPERATORS:
+        return _compile_condition(operator, operands, path)
+
+    error_msg = (
+        f"{path}: unknown filter operator '{operator}'. Available operators: "
+        f"{', '.join((*LOGICAL_OPERATORS, *CONDITION_OPERATORS))}"
+    )
+    raise ValueError(error_msg)
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _compile_canonical(canonical: str) -> _Filters:
+    return _compile(json.loads(canonical), "filter")
+
+
+def compile_filter(dsl: FilterDSL) -> _Filters:
+    """Validate a DSL filter and compile it to a Weaviate filter.
+
+    Args:
+        dsl: Filter in the JSON filter DSL
+
+    Returns:
+        The compiled filter, shared between equal DSL filters
+
+    Raises:
+        ValueError: If the filter is not valid
+
+    """
+    try:
+        canonical = canonical_filter(dsl)
+    except TypeError as e:
+        error_msg = f"filter: values must be JSON serializable ({e})"
+        raise ValueError(error_msg) from e
+    return _compile_canonical(canonical)
+
+
+def resolve_filter(value: FilterDSL | _Filters | None) -> _Filters | None:
+    """Compile a DSL filter, and pass Weaviate filters and None through."""
+    if isinstance(value, dict):
+        return compile_filter(value)
+    return value
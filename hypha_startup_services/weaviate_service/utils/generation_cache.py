@@ -0,0 +1,153 @@
+"""Process-wide cache of grouped generations keyed by their retrieved context.
+
+A grouped task sent to an LLM depends only on the task, the generation
+options and the objects it summarizes. When a query retrieves the same
+objects, unchanged since the last time, the earlier generation is reused
+instead of calling the LLM again. Writes to an application drop its cached
+generations.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, Mapping, Sequence
+
+    from weaviate.collections.classes.internal import GenerativeObject, Object
+
+# Maximum number of generations kept in the cache
+DEFAULT_GENERATION_CACHE_SIZE = 512
+# Seconds a generation is served from the cache
+DEFAULT_GENERATION_CACHE_TTL = 3600.0
+
+
+@dataclass
+class _CachedGeneration:
+    text: str
+    stored_at: float
+
+
+class GenerationCache:
+    """Bounded LRU cache of generated texts.
+
+    Keys combine the generation options with the sorted UUIDs and update
+    times of the objects sent to the LLM, so a changed object yields a new
+    key. Entries expire after `ttl` seconds, and
+    `invalidate` drops the entries of an application right away.
+
+    Applications are versioned from one counter. At most `max_entries`
+    application versions are kept; beyond that, all versions and entries are
+    dropped and a new floor version makes every earlier key unreachable.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_GENERATION_CACHE_SIZE,
+        ttl: float = DEFAULT_GENERATION_CACHE_TTL,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of generations kept
+            ttl: Seconds a generation is served from the cache
+
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, _CachedGeneration] = OrderedDict()
+        self._counter = itertools.count(1)
+        self._floor = 0
+        self._versions: dict[tuple[str, str], int] = {}
+
+    def key(
+        self,
+        collection_name: str,
+        application_id: str,
+        tenant: str | None,
+        generative_kwargs: Mapping[str, Any],
+        objects: Sequence[Object[Any, Any] | GenerativeObject[Any, Any]],
+    ) -> Hashable:
+        """Build the cache key of a generation.
+
+        Args:
+            collection_name: Full name of the collection
+            application_id: ID of the application the objects belong to
+            tenant: Tenant of the collection, if any
+            generative_kwargs: Prompts, grouped properties and provider
+            objects: Objects sent to the LLM, with their update time
+
+        Returns:
+            A key that changes with the application's version, the options
+            and the objects
+
+        """
+        scope = (collection_name, application_id)
+        options = tuple(
+            sorted((name, repr(value)) for name, value in generative_kwargs.items()),
+        )
+        context = tuple(
+            sorted((str(obj.uuid), obj.metadata.last_update_time) for obj in objects),
+        )
+        version = self._versions.get(scope, self._floor)
+        return (scope, version, tenant, options, context)
+
+    def get(self, key: Hashable) -> str | None:
+        """Get a cached generation, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.text
+
+    def put(self, key: Hashable, text: str) -> None:
+        """Store a generation, evicting the least recently used ones."""
+        self._entries[key] = _CachedGeneration(text=text, stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, collection_name: str, application_id: str) -> None:
+        """Drop the cached generations of an application.
+
+        Bumping the application's version makes its existing keys unreachable,
+        and the stale entries are evicted as the cache fills up.
+        """
+        scope = (collection_name, application_id)
+        self._versions[scope] = next(self._counter)
+        if len(self._versions) > self.max_entries:
+            self._entries.clear()
+            self._versions.clear()
+            self._floor = next(self._counter)
+
+    @contextmanager
+    def invalidating(
+        self,
+        collection_name: str,
+        application_id: str,
+    ) -> Iterator[None]:
+        """Invalidate the generations of an application after a write.
+
+        The generations are dropped once the enclosed write has finished, even
+        if it failed part way, so no generation over the old objects is
+        cached while the write runs.
+        """
+        try:
+            yield
+        finally:
+            self.invalidate(collection_name, application_id)
+
+    def clear(self) -> None:
+        """Drop all cached generations."""
+        self._entries.clear()
+
+
+generation_cache = GenerationCache()
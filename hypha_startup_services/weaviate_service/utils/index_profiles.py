@@ -0,0 +1,176 @@
+"""Named HNSW and vector compression presets for collection settings.
+
+Weaviate keeps every HNSW index in memory, so large uncompressed collections
+need far more RAM than their data size suggests. A performance profile expands
+into `vectorIndexConfig` settings trading recall against memory, and
+`estimate_memory` reports the expected footprint of each profile.
+"""
+
+import copy
+import math
+from typing import Any, cast, get_args
+
+from .models import CollectionConfig, MemoryEstimate, PerformanceProfile
+
+# Vector index settings of each profile, in Weaviate's schema format
+PERFORMANCE_PROFILES: dict[PerformanceProfile, dict[str, Any]] = {
+    # Binary quantization: 32x smaller vectors, rescored from disk
+    "low-memory": {
+        "maxConnections": 16,
+        "efConstruction": 64,
+        "bq": {"enabled": True},
+    },
+    # 8-bit scalar quantization: 4x smaller vectors, rescored from disk
+    "balanced": {
+        "maxConnections": 32,
+        "efConstruction": 128,
+        "sq": {"enabled": True, "rescoreLimit": 100},
+    },
+    # Uncompressed vectors and a denser graph searched with a larger ef
+    "max-recall": {
+        "maxConnections": 64,
+        "efConstruction": 512,
+        "ef": -1,
+        "dynamicEfMin": 200,
+        "dynamicEfMax": 1000,
+        "dynamicEfFactor": 16,
+    },
+}
+
+# Settings keys enabling vector compression
+COMPRESSION_KEYS = ("pq", "bq", "sq", "rq")
+# Approximate bytes per HNSW connection, as given in Weaviate's sizing guide
+BYTES_PER_CONNECTION = 10
+FLOAT32_BYTES = 4
+
+
+def _profile_index_config(
+    profile: PerformanceProfile,
+    index_config: dict[str, Any],
+) -> dict[str, Any]:
+    if profile not in PERFORMANCE_PROFILES:
+        error_msg = (
+            f"Unknown performance profile '{profile}'. "
+            f"Available profiles: {', '.join(get_args(PerformanceProfile))}"
+        )
+        raise ValueError(error_msg)
+
+    profile_config = copy.deepcopy(PERFORMANCE_PROFILES[profile])
+    if any(key in index_config for key in COMPRESSION_KEYS):
+        for key in COMPRESSION_KEYS:
+            profile_config.pop(key, None)
+    return {**profile_config, **index_config}
+
+
+def _apply_to_index(
+    index_settings: dict[str, Any],
+    profile: PerformanceProfile,
+) -> None:
+    index_type = index_settings.setdefault("vectorIndexType", "hnsw")
+    if index_type != "hnsw":
+        error_msg = f"Performance profiles apply to HNSW indexes, not '{index_type}'"
+        raise ValueError(error_msg)
+
+    index_settings["vectorIndexConfig"] = _profile_index_config(
+        profile,
+        index_settings.get("vectorIndexConfig", {}),
+    )
+
+
+def apply_performance_profile(
+    settings: CollectionConfig,
+    profile: PerformanceProfile,
+) -> CollectionConfig:
+    """Expand a performance profile into the vector index settings.
+
+    The profile is applied to every named vector in `vectorConfig`, or to the
+    collection's single vector index otherwise. Index settings given
+    explicitly take precedence over the profile, and explicit compression
+    settings replace the profile's compression.
+
+    Args:
+        settings: Collection settings
+        profile: Name of the performance profile
+
+    Returns:
+        A copy of the settings with the profile applied
+
+    Raises:
+        ValueError: If the profile is unknown or an index is not HNSW
+
+    """
+    profiled = copy.deepcopy(settings)
+    named_vectors = profiled.get("vectorConfig")
+    if named_vectors:
+        for vector_settings in named_vectors.values():
+            _apply_to_index(vector_settings, profile)
+    else:
+        _apply_to_index(cast("dict[str, Any]", profiled), profile)
+    return profiled
+
+
+def _compressed_vector_bytes(dimensions: int, index_config: dict[str, Any]) -> int:
+    if index_config.get("bq", {}).get("enabled"):
+        # One bit per dimension, stored in 64-bit words
+        return math.ceil(dimensions / 64) * 8
+    if index_config.get("sq", {}).get("enabled"):
+        return dimensions
+    return dimensions * FLOAT32_BYTES
+
+
+def hnsw_links_per_node(max_connections: int) -> float:
+    """Get the expected number of HNSW links per node.
+
+    Layer 0 holds every node with up to `2 * maxConnections` links. A node
+    reaches each higher layer with probability `1 / maxConnections`, so it
+    lives on `1 / (maxConnections - 1)` higher layers on average, each with up
+    to `maxConnections` links.
+    """
+    upper_layers = 1 / (max_connections - 1) if max_connections > 1 else 0
+    return max_connections * (2 + upper_layers)
+
+
+def estimate_memory(
+    object_count: int,
+    dimensions: int,
+    profile: PerformanceProfile,
+) -> MemoryEstimate:
+    """Estimate the memory an HNSW index needs with a performance profile.
+
+    The estimate covers the vectors held in memory and the graph connections
+    of all layers, following Weaviate's sizing guide. Compressed profiles keep
+    the original vectors on disk for rescoring. Actual usage is higher by the
+    runtime's garbage collection overhead, often up to twice the estimate.
+
+    Args:
+        object_count: Number of objects (vectors) in the index
+        dimensions: Number of vector dimensions
+        profile: Name of the performance profile
+
+    Returns:
+        Estimated memory and disk usage in bytes
+
+    """
+    if object_count < 0 or dimensions < 1:
+        error_msg = "object_count must be non-negative and dimensions positive"
+        raise ValueError(error_msg)
+
+    index_config = _profile_index_config(profile, {})
+    compression = next(
+        (key for key in COMPRESSION_KEYS if key in index_config),
+        "none",
+    )
+    vector_bytes = object_count * _compressed_vector_bytes(dimensions, index_config)
+    graph_bytes = round(
+        object_count
+        * hnsw_links_per_node(index_config["maxConnections"])
+        * BYTES_PER_CONNECTION,
+    )
+    return MemoryEstimate(
+        profile=profile,
+        compression=compression,
+        vector_bytes=vector_bytes,
+        graph_bytes=graph_bytes,
+        total_bytes=vector_bytes + graph_bytes,
+        disk_bytes=object_count * dimensions * FLOAT32_BYTES,
+    )
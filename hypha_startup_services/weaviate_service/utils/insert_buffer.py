@@ -0,0 +1,180 @@
+"""Write-behind buffer coalescing single inserts into batch inserts.
+
+Producers that call `data.insert` once per event pay for a tenant collection
+preparation and a Weaviate round trip per object. An `InsertCoalescer` collects
+such inserts for one (collection, application, tenant, caller) combination and
+writes them with a single `insert_many` once the batch is full or the oldest
+pending insert has waited long enough.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from weaviate.classes.data import DataObject
+    from weaviate.collections import CollectionAsync
+
+logger = logging.getLogger(__name__)
+
+# Number of pending inserts that triggers an immediate flush
+INSERT_BUFFER_MAX_BATCH_SIZE = 100
+# Maximum time in seconds an insert waits in the buffer before being flushed
+INSERT_BUFFER_MAX_DELAY = 0.05
+
+# Collection name, application ID, tenant workspace and caller workspace
+CoalescerKey = tuple[str, str, str, str]
+
+_coalescers: dict[CoalescerKey, InsertCoalescer] = {}
+
+
+@dataclass
+class _PendingInsert:
+    data_object: DataObject[Any, Any]
+    future: asyncio.Future[UUID]
+
+
+class InsertCoalescer:
+    """Buffer single inserts and write them to Weaviate in batches.
+
+    Each flush prepares the tenant collection once, so application and
+    permission checks still run for every batch. Errors reported by Weaviate
+    for an object are raised to the caller that inserted it, while a failing
+    preparation or request fails every caller of the batch.
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[], Awaitable[CollectionAsync]],
+        max_batch_size: int = INSERT_BUFFER_MAX_BATCH_SIZE,
+        max_delay: float = INSERT_BUFFER_MAX_DELAY,
+        on_idle: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            prepare: Coroutine factory returning the tenant collection to write to
+            max_batch_size: Number of pending inserts that triggers a flush
+            max_delay: Maximum seconds an insert waits before being flushed
+            on_idle: Called when the last pending batch has been written
+
+        """
+        self._prepare = prepare
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._on_idle = on_idle
+        self._pending: list[_PendingInsert] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def idle(self) -> bool:
+        """Whether no insert is pending or being written."""
+        return not self._pending and not self._flush_tasks
+
+    async def insert(self, data_object: DataObject[Any, Any]) -> UUID:
+        """Queue an object and wait until its batch has been written.
+
+        Returns:
+            UUID of the inserted object
+
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[UUID] = loop.create_future()
+        self._pending.append(_PendingInsert(data_object, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Start writing all pending inserts in the background."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._write(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        self._flush_tasks.discard(task)
+        if self.idle and self._on_idle is not None:
+            self._on_idle()
+
+    async def _write(self, batch: list[_PendingInsert]) -> None:
+        # Skip inserts whose callers stopped waiting, e.g. past their deadline
+        batch = [pending for pending in batch if not pending.future.done()]
+        if not batch:
+            return
+        try:
+            tenant_collection = await self._prepare()
+            response = await tenant_collection.data.insert_many(
+                objects=[pending.data_object for pending in batch],
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Buffered insert of %d objects failed: %s", len(batch), e)
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        for index, pending in enumerate(batch):
+            if pending.future.done():
+                continue
+            error = response.errors.get(index)
+            if error is not None:
+                error_msg = f"Buffered insert failed: {error.message}"
+                pending.future.set_exception(RuntimeError(error_msg))
+            else:
+                pending.future.set_result(response.uuids[index])
+
+
+async def buffered_insert(
+    key: CoalescerKey,
+    prepare: Callable[[], Awaitable[CollectionAsync]],
+    data_object: DataObject[Any, Any],
+) -> UUID:
+    """Insert an object through the shared coalescer of `key`.
+
+    The coalescer is created on first use and dropped again once it is idle,
+    so no buffer outlives a burst of inserts.
+
+    Args:
+        key: Collection name, application ID, tenant and caller workspace
+        prepare: Coroutine factory returning the tenant collection of `key`
+        data_object: Object to insert
+
+    Returns:
+        UUID of the inserted object
+
+    """
+    coalescer = _coalescers.get(key)
+    if coalescer is None:
+        coalescer = InsertCoalescer(
+            prepare,
+            max_batch_size=INSERT_BUFFER_MAX_BATCH_SIZE,
+            max_delay=INSERT_BUFFER_MAX_DELAY,
+            on_idle=lambda: _release_coalescer(key, coalescer),
+        )
+        _coalescers[key] = coalescer
+
+    return await coalescer.insert(data_object)
+
+
+def _release_coalescer(key: CoalescerKey, coalescer: InsertCoalescer) -> None:
+    if _coalescers.get(key) is coalescer:
+        del _coalescers[key]
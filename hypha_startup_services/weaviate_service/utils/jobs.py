@@ -0,0 +1,416 @@
+"""Background jobs for inserts and deletions too large for a single RPC call.
+
+A job is submitted and returns immediately with a job ID. The objects are
+written or deleted in batches by a background task, while callers poll the job
+for progress and fetch the inserted UUIDs once it has finished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid as uuid_class
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from hypha_startup_services.common.utils import batched
+
+from .collection_utils import delete_application_objects
+from .models import JobInfo, JobOperation, JobResult
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
+
+    from weaviate.classes.data import DataObject
+    from weaviate.collections import CollectionAsync
+    from weaviate.collections.classes.batch import BatchObjectReturn
+
+    # Returns the UUIDs of the given objects that already exist
+    ExistingLookup = Callable[[list[DataObject[Any, Any]]], Awaitable[set[str]]]
+    # Returns the given objects as they should be inserted
+    BatchPreparation = Callable[
+        [list[DataObject[Any, Any]]],
+        Awaitable[list[DataObject[Any, Any]]],
+    ]
+
+logger = logging.getLogger(__name__)
+
+# Seconds a finished job is kept before its status and result are discarded
+DEFAULT_JOB_RETENTION_SECONDS = 3600
+# Number of objects written by a single insert_many of a job
+JOB_BATCH_SIZE = 100
+# Maximum number of concurrent insert_many requests of one job
+JOB_MAX_CONCURRENCY = 4
+# Maximum number of jobs inserting at the same time; later jobs stay pending
+MAX_RUNNING_JOBS = 4
+# Maximum number of error messages recorded per job
+MAX_JOB_ERRORS = 100
+
+FINISHED_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+@dataclass
+class _Job:
+    info: JobInfo
+    owner_ws: str
+    uuids: dict[str, uuid_class.UUID] = field(default_factory=dict)
+    task: asyncio.Task[None] | None = None
+
+
+class JobManager:
+    """Run jobs in the background and keep track of their progress.
+
+    Jobs are only visible to the workspace that submitted them. Finished jobs
+    are kept for `retention_seconds` and removed lazily on later calls.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: float = DEFAULT_JOB_RETENTION_SECONDS,
+        max_running_jobs: int = MAX_RUNNING_JOBS,
+        lease: Callable[[], Callable[[], None]] | None = None,
+    ) -> None:
+        """Initialize the job manager.
+
+        Args:
+            retention_seconds: Seconds a finished job is kept
+            max_running_jobs: Maximum number of jobs running at the same time
+            lease: Function taking a lease on the Weaviate clients a job uses,
+                returning the function that ends it, such as
+                `WeaviateClientPool.lease`
+
+        """
+        self.retention_seconds = retention_seconds
+        self._lease = lease
+        self._jobs: dict[str, _Job] = {}
+        self._running = asyncio.Semaphore(max_running_jobs)
+
+    def submit_insert(
+        self,
+        tenant_collection: CollectionAsync,
+        data_objects: Sequence[tuple[int, DataObject[Any, Any]]],
+        *,
+        owner_ws: str,
+        collection_name: str,
+        application_id: str,
+        batch_size: int = JOB_BATCH_SIZE,
+        find_existing: ExistingLookup | None = None,
+        prepare_batch: BatchPreparation | None = None,
+        invalid: Mapping[int, str] | None = None,
+        on_written: Callable[[], None] | None = None,
+    ) -> JobInfo:
+        """Start inserting objects into a prepared tenant collection.
+
+        Args:
+            tenant_collection: Tenant collection the caller may write to
+            data_objects: Objects to insert, each with its position among all
+                submitted objects
+            owner_ws: Workspace of the caller submitting the job
+            collection_name: Name of the collection, for reporting
+            application_id: ID of the application, for reporting
+            batch_size: Number of objects per insert_many request
+            find_existing: Optional lookup of existing UUIDs; objects it
+                returns are skipped instead of inserted
+            prepare_batch: Optional coroutine returning the objects of a batch
+                as they should be inserted, e.g. with stored vectors
+            invalid: Error messages of submitted objects that cannot be
+                inserted, by position; they are reported as failed
+            on_written: Called after every insert_many request, even a failed one
+
+        Returns:
+            Information about the submitted job, including its ID
+
+        """
+        if batch_size < 1:
+            error_msg = "batch_size must be at least 1"
+            raise ValueError(error_msg)
+
+        job = self._create(
+            "insert",
+            owner_ws=owner_ws,
+            collection_name=collection_name,
+            application_id=application_id,
+            total_objects=len(data_objects) + len(invalid or {}),
+        )
+        for position, message in (invalid or {}).items():
+            _record_error(job.info, f"Object {position}: {message}")
+        job.info["failed_objects"] = job.info["processed_objects"] = len(
+            invalid or {},
+        )
+        return self._start(
+            job,
+            _run_insert(
+                job,
+                tenant_collection,
+                data_objects,
+                batch_size=batch_size,
+                find_existing=find_existing,
+                prepare_batch=prepare_batch,
+                on_written=on_written,
+            ),
+        )
+
+    def submit_delete(
+        self,
+        tenant_collection: CollectionAsync,
+        *,
+        owner_ws: str,
+        collection_name: str,
+        application_id: str,
+        total_objects: int,
+        on_deleted: Callable[[], Awaitable[None]],
+        on_written: Callable[[], None] | None = None,
+    ) -> JobInfo:
+        """Start deleting all objects of an application.
+
+        Args:
+            tenant_collection: Tenant collection the caller may delete from
+            owner_ws: Workspace of the caller submitting the job
+            collection_name: Name of the collection, for reporting
+            application_id: ID of the application whose objects are deleted
+            total_objects: Number of objects to delete, for reporting
+            on_deleted: Called once all objects have been deleted
+            on_written: Called after every page of deleted objects
+
+        Returns:
+            Information about the submitted job, including its ID
+
+        """
+        job = self._create(
+            "delete",
+            owner_ws=owner_ws,
+            collection_name=collection_name,
+            application_id=application_id,
+            total_objects=total_objects,
+        )
+        return self._start(
+            job,
+            _run_delete(job, tenant_collection, on_deleted, on_written),
+        )
+
+    def status(self, job_id: str, caller_ws: str) -> JobInfo:
+        """Get the progress of a job."""
+        return self._snapshot(self._get(job_id, caller_ws))
+
+    def cancel(self, job_id: str, caller_ws: str) -> JobInfo:
+        """Cancel a pending or running job.
+
+        Objects inserted before the cancellation are kept.
+        """
+        job = self._get(job_id, caller_ws)
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+        return self._snapshot(job)
+
+    def result(self, job_id: str, caller_ws: str) -> JobResult:
+        """Get the inserted UUIDs of a finished job.
+
+        Raises:
+            ValueError: If the job has not finished yet
+
+        """
+        job = self._get(job_id, caller_ws)
+        if job.info["status"] not in FINISHED_STATUSES:
+            error_msg = f"Job {job_id} has not finished yet"
+            raise ValueError(error_msg)
+
+        return JobResult(
+            job=self._snapshot(job),
+            uuids=dict(job.uuids),
+            has_errors=job.info["failed_objects"] > 0 or bool(job.info["errors"]),
+        )
+
+    def _create(
+        self,
+        operation: JobOperation,
+        *,
+        owner_ws: str,
+        collection_name: str,
+        application_id: str,
+        total_objects: int,
+    ) -> _Job:
+        self._discard_expired()
+        return _Job(
+            info=JobInfo(
+                job_id=str(uuid_class.uuid4()),
+                operation=operation,
+                status="pending",
+                collection_name=collection_name,
+                application_id=application_id,
+                total_objects=total_objects,
+                processed_objects=0,
+                failed_objects=0,
+                skipped_objects=0,
+                created_at=time.time(),
+                started_at=None,
+                finished_at=None,
+                objects_per_second=None,
+                errors=[],
+            ),
+            owner_ws=owner_ws,
+        )
+
+    def _start(self, job: _Job, work: Coroutine[Any, Any, None]) -> JobInfo:
+        release = self._lease() if self._lease is not None else None
+        job.task = asyncio.create_task(self._run(job, work, release))
+        self._jobs[job.info["job_id"]] = job
+        return self._snapshot(job)
+
+    def _get(self, job_id: str, caller_ws: str) -> _Job:
+        self._discard_expired()
+        job = self._jobs.get(job_id)
+        if job is None or job.owner_ws != caller_ws:
+            error_msg = f"Job {job_id} does not exist"
+            raise ValueError(error_msg)
+        return job
+
+    def _discard_expired(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.info["finished_at"] is not None and job.info["finished_at"] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _snapshot(job: _Job) -> JobInfo:
+        info = JobInfo(**job.info)
+        info["errors"] = list(job.info["errors"])
+        started_at = info["started_at"]
+        if started_at is not None:
+            elapsed = (info["finished_at"] or time.time()) - started_at
+            info["objects_per_second"] = (
+                info["processed_objects"] / elapsed if elapsed > 0 else None
+            )
+        return info
+
+    async def _run(
+        self,
+        job: _Job,
+        work: Coroutine[Any, Any, None],
+        release: Callable[[], None] | None,
+    ) -> None:
+        info = job.info
+        try:
+            async with self._running:
+                info["status"] = "running"
+                info["started_at"] = time.time()
+                await work
+        except asyncio.CancelledError:
+            info["status"] = "cancelled"
+            raise
+        except Exception as e:
+            logger.exception("%s job %s failed", info["operation"], info["job_id"])
+            info["status"] = "failed"
+            _record_error(info, str(e))
+        else:
+            info["status"] = "completed"
+        finally:
+            work.close()
+            info["finished_at"] = time.time()
+            if release is not None:
+                release()
+
+
+async def _run_insert(
+    job: _Job,
+    tenant_collection: CollectionAsync,
+    data_objects: Sequence[tuple[int, DataObject[Any, Any]]],
+    *,
+    batch_size: int,
+    find_existing: ExistingLookup | None,
+    prepare_batch: BatchPreparation | None,
+    on_written: Callable[[], None] | None,
+) -> None:
+    info = job.info
+    semaphore = asyncio.Semaphore(JOB_MAX_CONCURRENCY)
+
+    async def _insert_batch(batch: list[tuple[int, DataObject[Any, Any]]]) -> None:
+        pending = batch
+        async with semaphore:
+            try:
+                if find_existing is not None:
+                    existing = await find_existing([obj for _, obj in pending])
+                    pending = _skip_existing(job, pending, existing)
+                if pending and prepare_batch is not None:
+                    prepared = await prepare_batch([obj for _, obj in pending])
+                    pending = [
+                        (position, obj)
+                        for (position, _), obj in zip(pending, prepared, strict=True)
+                    ]
+                if pending:
+                    try:
+                        response = await tenant_collection.data.insert_many(
+                            objects=[obj for _, obj in pending],
+                        )
+                    finally:
+                        if on_written is not None:
+                            on_written()
+            except Exception as e:  # noqa: BLE001
+                info["failed_objects"] += len(pending)
+                _record_error(info, f"Objects {batch[0][0]}-{batch[-1][0]}: {e}")
+            else:
+                if pending:
+                    _record_batch(job, pending, response)
+            info["processed_objects"] += len(batch)
+
+    await asyncio.gather(
+        *(_insert_batch(list(batch)) for batch in batched(data_objects, batch_size)),
+    )
+
+
+async def _run_delete(
+    job: _Job,
+    tenant_collection: CollectionAsync,
+    on_deleted: Callable[[], Awaitable[None]],
+    on_written: Callable[[], None] | None,
+) -> None:
+    info = job.info
+
+    def _on_page(deleted: int) -> None:
+        info["processed_objects"] += deleted
+        if on_written is not None:
+            on_written()
+
+    result = await delete_application_objects(
+        tenant_collection,
+        info["application_id"],
+        on_page=_on_page,
+    )
+    info["failed_objects"] = result["failed"]
+    await on_deleted()
+
+
+def _skip_existing(
+    job: _Job,
+    pending: list[tuple[int, DataObject[Any, Any]]],
+    existing: set[str],
+) -> list[tuple[int, DataObject[Any, Any]]]:
+    remaining: list[tuple[int, DataObject[Any, Any]]] = []
+    for position, obj in pending:
+        if str(obj.uuid) in existing:
+            job.uuids[str(position)] = cast("uuid_class.UUID", obj.uuid)
+            job.info["skipped_objects"] += 1
+        else:
+            remaining.append((position, obj))
+    return remaining
+
+
+def _record_batch(
+    job: _Job,
+    pending: list[tuple[int, DataObject[Any, Any]]],
+    response: BatchObjectReturn,
+) -> None:
+    for index, object_uuid in response.uuids.items():
+        job.uuids[str(pending[index][0])] = object_uuid
+    for index, error in response.errors.items():
+        _record_error(job.info, f"Object {pending[index][0]}: {error.message}")
+    job.info["failed_objects"] += len(response.errors)
+
+
+def _record_error(info: JobInfo, message: str) -> None:
+    if len(info["errors"]) < MAX_JOB_ERRORS:
+        info["errors"].append(message)
@@ -1,7 +1,8 @@
 """Models for Weaviate artifact parameters."""
 
 from collections.abc import Sequence
-from typing import Any, Literal, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -34,6 +35,10 @@ PermissionOperation = Literal[
 PermissionMap = dict[str, PermissionOperation]
 
 
+# How applications map to tenants: one tenant per workspace shared by its
+# applications, or one tenant per (workspace, application) pair
+CollectionPartitioning = Literal["workspace", "application"]
+
 # Define CollectionConfig using functional syntax to support "class" key
 CollectionConfig = TypedDict(
     "CollectionConfig",
@@ -50,11 +55,41 @@ CollectionConfig = TypedDict(
         "replicationConfig": dict[str, Any],
         "shardingConfig": dict[str, Any],
         "vectorIndexType": str,
+        "partitioning": CollectionPartitioning,
     },
     total=False,
 )
 
 
+class CollectionSummary(TypedDict):
+    """Key settings of a collection, as returned by the simple listing."""
+
+    name: str
+    description: str | None
+    multi_tenancy: bool
+    properties: list[str]
+    vectors: dict[str, str]
+    version: str
+
+
+class SnippetInfo(TypedDict):
+    """Position of a snippet within the full text of a property."""
+
+    property: str
+    start: int
+    end: int
+    length: int
+
+
+class QueryDefaults(TypedDict, total=False):
+    """Query options an application applies unless a query sets them."""
+
+    return_properties: list[str]
+    include_vector: bool | str | list[str]
+    max_text_chars: int | None
+    max_text_tokens: int | None
+
+
 class ApplicationReturn(TypedDict):
     """Return type for application creation."""
 
@@ -83,13 +118,157 @@ class DataDeleteManyReturn(TypedDict):
     successful: int
 
 
+class BulkItemResult(TypedDict):
+    """Outcome of a bulk operation for a single object."""
+
+    successful: bool
+    error: str | None
+
+
+ResultFormat = Literal["objects", "columnar"]
+
+
+class PackedVectors(TypedDict):
+    """Vectors of equal length packed into one little-endian binary buffer."""
+
+    dtype: str
+    shape: list[int]
+    data: bytes
+
+
+class ColumnarObjects(TypedDict):
+    """Query results with one array per field instead of one dict per object."""
+
+    format: Literal["columnar"]
+    count: int
+    uuids: list[str]
+    collections: list[str]
+    collection_index: list[int]
+    properties: dict[str, list[Any]]
+    metadata: dict[str, list[Any]]
+    vectors: dict[str, PackedVectors | list[Any]]
+
+
 class ServiceQueryReturn(TypedDict, total=False):
     """Return type for query operations."""
 
-    objects: Sequence[Any]
+    objects: Sequence[Any] | ColumnarObjects
     generated: str | None
 
 
+QueryType = Literal["near_vector", "fetch_objects", "hybrid"]
+
+# LLM generations run by generate_near_text: one per object ("single"), one
+# over all objects ("grouped"), both, or none
+GenerationMode = Literal["single", "grouped", "both", "none"]
+
+
+class GenerationEvent(TypedDict, total=False):
+    """One event streamed by the generate.near_text_stream operation."""
+
+    type: Literal["objects", "single", "grouped"]
+    objects: Sequence[Any]
+    uuid: UUID
+    text: str | None
+
+
+# A query specification: "type", "collection_name", "application_id", optional
+# "user_ws", plus the keyword arguments of the corresponding query method.
+QuerySpec = dict[str, Any]
+
+
+class QueryBatchResult(TypedDict, total=False):
+    """Result of a single query in a batch: either objects or an error."""
+
+    objects: Sequence[Any] | ColumnarObjects
+    error: str
+
+
+class FederatedTarget(TypedDict):
+    """An application searched by a federated query."""
+
+    collection_name: str
+    application_id: str
+    user_ws: NotRequired[str | None]
+
+
+class FederatedQueryReturn(TypedDict):
+    """Return type for federated queries."""
+
+    objects: Sequence[Any]
+    scores: list[float]
+    targets: list[int]
+    errors: dict[str, str]
+
+
+class IterateBatch(TypedDict):
+    """One batch of objects streamed by the iterate operation."""
+
+    objects: Sequence[Any]
+    cursor: str | None
+    done: bool
+
+
+ExistingObjectPolicy = Literal["skip", "update"]
+
+PerformanceProfile = Literal["low-memory", "balanced", "max-recall"]
+
+
+class MemoryEstimate(TypedDict):
+    """Estimated resource usage of a vector index with a performance profile."""
+
+    profile: PerformanceProfile
+    compression: str
+    vector_bytes: int
+    graph_bytes: int
+    total_bytes: int
+    disk_bytes: int
+
+
+class AdmissionClassStats(TypedDict):
+    """Admission counts and queue times of one endpoint class."""
+
+    running: int
+    queued: int
+    admitted: int
+    rejected: int
+    queue_seconds_total: float
+    queue_seconds_mean: float
+    queue_seconds_max: float
+
+
+JobStatus = Literal["pending", "running", "completed", "failed", "cancelled"]
+
+JobOperation = Literal["insert", "delete"]
+
+
+class JobInfo(TypedDict):
+    """Progress and timing of a background job."""
+
+    job_id: str
+    operation: JobOperation
+    status: JobStatus
+    collection_name: str
+    application_id: str
+    total_objects: int
+    processed_objects: int
+    failed_objects: int
+    skipped_objects: int
+    created_at: float
+    started_at: float | None
+    finished_at: float | None
+    objects_per_second: float | None
+    errors: list[str]
+
+
+class JobResult(TypedDict):
+    """Final outcome of a background job."""
+
+    job: JobInfo
+    uuids: dict[str, Any]
+    has_errors: bool
+
+
 HyphaContext = dict[str, Any]
 
 
@@ -0,0 +1,266 @@
+"""Utilities for shaping Weaviate query requests and their results."""
+
+import json
+from collections.abc import Sequence
+from typing import Any, Literal, TypeVar
+
+from weaviate.collections.classes.internal import GenerativeObject, Object
+
+from hypha_startup_services.common.chunking import count_tokens, truncate_tokens
+
+P = TypeVar("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+FusionMethod = Literal["rrf", "score"]
+
+# Weaviate's default page size when a query is sent without a limit
+DEFAULT_QUERY_LIMIT = 10
+# How many candidates to fetch per requested group member when grouping
+GROUP_OVERFETCH_FACTOR = 4
+# Upper bound on candidates fetched for a single grouped query
+MAX_GROUP_CANDIDATES = 1000
+# Default number of objects per batch when iterating over an application
+ITERATE_DEFAULT_BATCH_SIZE = 100
+# Rank offset of reciprocal rank fusion, as commonly used in the literature
+DEFAULT_RRF_K = 60
+
+
+def grouped_fetch_limit(limit: int | None, group_size: int) -> int:
+    """Return how many candidates to fetch to fill `limit` groups.
+
+    Args:
+        limit: Number of distinct groups requested (Weaviate default if None)
+        group_size: Number of objects kept per group
+
+    Returns:
+        Candidate count to request from Weaviate
+
+    """
+    if group_size < 1:
+        error_msg = "group_size must be at least 1"
+        raise ValueError(error_msg)
+
+    groups = limit or DEFAULT_QUERY_LIMIT
+    return min(groups * group_size * GROUP_OVERFETCH_FACTOR, MAX_GROUP_CANDIDATES)
+
+
+def with_return_property(
+    return_properties: str | Sequence[str] | None,
+    property_name: str,
+) -> str | list[str] | None:
+    """Ensure `property_name` is part of an explicit property projection.
+
+    A projection of None means "all properties", so it is returned unchanged.
+    """
+    if return_properties is None:
+        return None
+
+    properties = (
+        [return_properties]
+        if isinstance(return_properties, str)
+        else list(return_properties)
+    )
+    if property_name not in properties:
+        properties.append(property_name)
+    return properties
+
+
+def truncate_text_properties(
+    objects: Sequence[Object[P, R] | GenerativeObject[P, R]],
+    *,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+) -> Sequence[Object[P, R] | GenerativeObject[P, R]]:
+    """Shorten long string properties of query results in place.
+
+    Args:
+        objects: Objects returned by a query
+        max_chars: Maximum number of characters kept per string property
+        max_tokens: Maximum number of tokens kept per string property
+
+    Returns:
+        The same objects
+
+    """
+    for limit in (max_chars, max_tokens):
+        if limit is not None and limit < 1:
+            error_msg = "max_text_chars and max_text_tokens must be at least 1"
+            raise ValueError(error_msg)
+
+    if max_chars is None and max_tokens is None:
+        return objects
+
+    for obj in objects:
+        if not isinstance(obj.properties, dict):
+            continue
+        properties: dict[str, Any] = obj.properties
+        for name, value in properties.items():
+            if isinstance(value, str):
+                text = value if max_chars is None else value[:max_chars]
+                if max_tokens is not None:
+                    text = truncate_tokens(text, max_tokens)
+                properties[name] = text
+    return objects
+
+
+def _sent_properties(
+    obj: Object[Any, Any] | GenerativeObject[Any, Any],
+    property_names: Sequence[str] | None,
+) -> dict[str, Any]:
+    """Get the properties of an object sent to a grouped task."""
+    properties = obj.properties if isinstance(obj.properties, dict) else {}
+    if property_names is None:
+        return properties
+    return {name: properties[name] for name in property_names if name in properties}
+
+
+def select_within_token_budget(
+    objects: Sequence[Object[P, R] | GenerativeObject[P, R]],
+    property_names: Sequence[str] | None,
+    max_tokens: int,
+) -> list[Object[P, R] | GenerativeObject[P, R]]:
+    """Keep the best-ranked objects whose properties fit in a token budget.
+
+    Objects are taken in rank order until the next one would exceed the
+    budget. The first object is always kept so that a task has some context,
+    even if it exceeds the budget on its own.
+
+    Args:
+        objects: Objects returned by a query, best first
+        property_names: Properties sent to the generative module, or None for
+            all properties
+        max_tokens: Maximum number of tokens of the selected properties
+
+    Returns:
+        The leading objects that fit in the budget
+
+    """
+    if max_tokens < 1:
+        error_msg = "grouped_token_budget must be at least 1"
+        raise ValueError(error_msg)
+
+    selected: list[Object[P, R] | GenerativeObject[P, R]] = []
+    used = 0
+    for obj in objects:
+        properties = _sent_properties(obj, property_names)
+        used += count_tokens(json.dumps(properties, default=str))
+        if selected and used > max_tokens:
+            break
+        selected.append(obj)
+    return selected
+
+
+def belongs_to_application(
+    obj: Object[Any, Any] | GenerativeObject[Any, Any],
+    application_id: str,
+) -> bool:
+    """Check whether an object is tagged with the given application ID."""
+    properties = obj.properties if isinstance(obj.properties, dict) else {}
+    return properties.get("application_id") == application_id
+
+
+def group_key(obj: Object[Any, Any] | GenerativeObject[Any, Any], prop: str) -> str:
+    """Get the grouping key of an object.
+
+    Objects without the property form their own group, keyed by UUID. The
+    value's type is part of the key, so e.g. 1 and "1" form separate groups.
+    """
+    properties = obj.properties if isinstance(obj.properties, dict) else {}
+    value = properties.get(prop)
+    if value is None:
+        return f"uuid:{obj.uuid}"
+    return f"value:{type(value).__name__}:{value!r}"
+
+
+def collapse_by_property(
+    objects: Sequence[Object[P, R] | GenerativeObject[P, R]],
+    prop: str,
+    limit: int | None,
+    group_size: int = 1,
+) -> list[Object[P, R] | GenerativeObject[P, R]]:
+    """Collapse ranked objects into at most `limit` groups sharing `prop`.
+
+    Objects are expected in rank order, as returned by Weaviate. Each group keeps
+    its `group_size` best-ranked objects, and groups are ordered by their best
+    member, so the result lists groups one after another.
+
+    Args:
+        objects: Ranked query results
+        prop: Property holding the parent key (e.g. a document ID)
+        limit: Maximum number of distinct groups (Weaviate default if None)
+        group_size: Maximum number of objects kept per group
+
+    Returns:
+        The kept objects, grouped and ordered by group rank
+
+    """
+    max_groups = limit or DEFAULT_QUERY_LIMIT
+    groups: dict[str, list[Object[P, R] | GenerativeObject[P, R]]] = {}
+
+    for obj in objects:
+        key = group_key(obj, prop)
+        members = groups.get(key)
+        if members is None:
+            if len(groups) >= max_groups:
+                continue
+            members = groups[key] = []
+        if len(members) < group_size:
+            members.append(obj)
+
+    return [obj for members in groups.values() for obj in members]
+
+
+def _normalized_scores(scores: Sequence[float | None]) -> list[float]:
+    """Min-max normalise scores of one ranked list to [0, 1].
+
+    Missing scores are treated as the lowest score of the list. A list whose
+    scores are all equal is normalised to 1.0 for every entry.
+    """
+    known = [score for score in scores if score is not None]
+    if not known:
+        return [1.0] * len(scores)
+
+    low, high = min(known), max(known)
+    span = high - low
+    return [
+        1.0 if span == 0 else ((low if score is None else score) - low) / span
+        for score in scores
+    ]
+
+
+def fuse_ranked_lists(
+    ranked_lists: Sequence[Sequence[tuple[T, float | None]]],
+    limit: int,
+    method: FusionMethod = "rrf",
+    rrf_k: int = DEFAULT_RRF_K,
+) -> list[tuple[int, T, float]]:
+    """Merge independently ranked result lists into a single top-k.
+
+    With "rrf" each item scores 1 / (rrf_k + rank), which only relies on the
+    order of each list. With "score" the scores of each list are min-max
+    normalised first, so lists with different score scales can be compared.
+
+    Args:
+        ranked_lists: One list of (item, score) pairs per source, best first
+        limit: Number of items to return
+        method: Fusion method, "rrf" or "score"
+        rrf_k: Rank offset used by reciprocal rank fusion
+
+    Returns:
+        Up to `limit` (source index, item, fused score) triples, best first
+
+    """
+    fused: list[tuple[int, T, float]] = []
+    for source, ranked in enumerate(ranked_lists):
+        if method == "rrf":
+            scores = [1.0 / (rrf_k + rank) for rank in range(1, len(ranked) + 1)]
+        else:
+            scores = _normalized_scores([score for _, score in ranked])
+        fused.extend(
+            (source, item, score)
+            for (item, _), score in zip(ranked, scores, strict=True)
+        )
+
+    fused.sort(key=lambda entry: entry[2], reverse=True)
+    return fused[:limit]
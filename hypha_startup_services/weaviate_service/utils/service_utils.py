@@ -4,6 +4,8 @@ This module contains helper functions for Weaviate service operations
 that need to be shared across different parts of the service.
 """
 
+import logging
+
 from weaviate import WeaviateAsyncClient
 from weaviate.collections import CollectionAsync
 
@@ -18,13 +20,26 @@ from hypha_startup_services.common.utils import (
     get_full_collection_name,
 )
 from hypha_startup_services.common.workspace_utils import ws_from_context
-from hypha_startup_services.weaviate_service.utils.models import HyphaContext
+from hypha_startup_services.weaviate_service.utils.models import (
+    CollectionConfig,
+    CollectionPartitioning,
+    HyphaContext,
+)
 
+from .artifact_utils import (
+    application_query_defaults,
+    create_collection_artifact,
+    get_application_artifact,
+)
 from .collection_utils import (
     add_tenant_if_not_exists,
+    attach_query_defaults,
     get_tenant_collection,
     is_multitenancy_enabled,
 )
+from .format_utils import collection_to_config_dict
+
+logger = logging.getLogger(__name__)
 
 
 class MissingContextError(ValueError):
@@ -35,23 +50,52 @@ class MissingContextError(ValueError):
         super().__init__("Context must be provided to determine the tenant workspace")
 
 
+async def restore_collection_artifact(
+    client: WeaviateAsyncClient,
+    collection_name: str,
+    partitioning: CollectionPartitioning,
+) -> CollectionConfig:
+    """Create the artifact of a collection from its Weaviate configuration.
+
+    Args:
+        client: WeaviateAsyncClient instance
+        collection_name: Short collection name
+        partitioning: How applications of the collection map to tenants
+
+    Returns:
+        The settings stored in the artifact
+
+    """
+    collection_obj = client.collections.get(get_full_collection_name(collection_name))
+    collection_config = await collection_to_config_dict(collection_obj)
+    collection_config["partitioning"] = partitioning
+    await create_collection_artifact(collection_config)
+    return collection_config
+
+
 async def prepare_application_creation(
     client: WeaviateAsyncClient,
     collection_name: str,
     user_ws: str,
+    application_id: str | None = None,
 ) -> None:
     """Prepare application creation by checking collection existence and adding tenant.
 
+    Creates the collection artifact if it is missing. In collections
+    partitioned by application, the tenant of the application is added.
+
     Args:
         client: WeaviateAsyncClient instance
         collection_name: Name of the collection for the application
         user_ws: User workspace
+        application_id: ID of the application being created
 
     Returns:
         Error dict if preparation fails, None if successful
 
     Raises:
-        ValueError: If the collection does not exist
+        ValueError: If the collection does not exist, or is multi-tenant and
+            has lost its artifact
 
     """
     # Make sure the collection exists and the user has the tenant
@@ -59,11 +103,28 @@ async def prepare_application_creation(
         error_msg = f"Collection '{collection_name}' does not exist."
         raise ValueError(error_msg)
 
+    full_collection_name = get_full_collection_name(collection_name)
+    if not await artifact_exists(full_collection_name):
+        # Only multi-tenant collections can be partitioned by application
+        if await is_multitenancy_enabled(client, collection_name):
+            error_msg = (
+                f"The artifact of collection '{collection_name}' is missing. "
+                "An admin must restore it with collections.restore_artifact, "
+                "stating the collection's partitioning."
+            )
+            raise ValueError(error_msg)
+        logger.info(
+            "Collection artifact for '%s' missing, creating it.",
+            collection_name,
+        )
+        await restore_collection_artifact(client, collection_name, "workspace")
+
     if await is_multitenancy_enabled(client, collection_name):
         await add_tenant_if_not_exists(
             client,
             collection_name,
             user_ws,
+            application_id,
         )
 
 
@@ -98,9 +159,19 @@ async def get_permitted_collection(
             caller_ws,
             user_ws,
         )
-        return await get_tenant_collection(client, collection_name, user_ws)
+        return await get_tenant_collection(
+            client,
+            collection_name,
+            user_ws,
+            application_id,
+        )
 
-    return await get_tenant_collection(client, collection_name, caller_ws)
+    return await get_tenant_collection(
+        client,
+        collection_name,
+        caller_ws,
+        application_id,
+    )
 
 
 async def collection_exists(
@@ -168,21 +239,20 @@ async def prepare_tenant_collection(
     if user_ws is None:
         user_ws = caller_ws
 
-    if not await ws_app_exists(
-        collection_name,
-        application_id,
-        workspace=user_ws,
-    ):
+    artifact = await get_application_artifact(collection_name, application_id, user_ws)
+    if artifact is None:
         error_msg = (
             f"Application {application_id}"
             f" does not exist in collection {collection_name}"
         )
         raise ValueError(error_msg)
 
-    return await get_permitted_collection(
+    tenant_collection = await get_permitted_collection(
         client,
         collection_name,
         application_id,
         user_ws=user_ws,
         caller_ws=caller_ws,
     )
+    attach_query_defaults(tenant_collection, application_query_defaults(artifact))
+    return tenant_collection
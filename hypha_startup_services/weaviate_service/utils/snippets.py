@@ -0,0 +1,133 @@
+"""Query-aware snippets of long text properties.
+
+Instead of returning a whole text property, a query can return the passage
+that best matches its terms. Text is split into words the way Weaviate's
+default "word" tokenization does for BM25 (lowercased alphanumeric runs), and
+a single scan over the positions of query terms finds the window of at most
+`max_chars` characters that covers the most distinct terms.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from weaviate.collections.classes.internal import GenerativeObject, Object
+
+from .models import SnippetInfo
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+# Default maximum length of a snippet in characters
+DEFAULT_SNIPPET_CHARS = 300
+# Property holding the offsets of the snippet within the original text
+SNIPPET_INFO_PROPERTY = "_snippet"
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def query_terms(query: str) -> set[str]:
+    """Split a query into lowercased words."""
+    return {match.group().lower() for match in _WORD_PATTERN.finditer(query)}
+
+
+def best_window(text: str, terms: set[str], max_chars: int) -> tuple[int, int]:
+    """Find the span of at most `max_chars` characters that best matches terms.
+
+    Spans are ranked by the number of distinct terms they contain, then by
+    the number of term occurrences. Without any match the span starts at the
+    beginning of the text.
+
+    Returns:
+        Start and end offsets of the span
+
+    """
+    hits = [
+        (match.start(), match.end(), match.group().lower())
+        for match in _WORD_PATTERN.finditer(text)
+        if match.group().lower() in terms
+    ]
+
+    best: tuple[int, int] = (0, 0)
+    best_span = (0, 0)
+    counts: Counter[str] = Counter()
+    first = 0
+    for index, (_, end, term) in enumerate(hits):
+        counts[term] += 1
+        while first < index and end - hits[first][0] > max_chars:
+            first_term = hits[first][2]
+            counts[first_term] -= 1
+            if not counts[first_term]:
+                del counts[first_term]
+            first += 1
+        score = (len(counts), counts.total())
+        if score > best:
+            best = score
+            best_span = (hits[first][0], end)
+
+    return _widen(text, best_span, max_chars)
+
+
+def _widen(text: str, span: tuple[int, int], max_chars: int) -> tuple[int, int]:
+    """Center a span in a window of `max_chars` characters on word boundaries."""
+    start, end = span
+    padding = max_chars - (end - start)
+    start = max(0, start - padding // 2)
+    end = min(len(text), start + max_chars)
+    start = max(0, end - max_chars)
+
+    if 0 < start < len(text) and text[start - 1].isalnum() and text[start].isalnum():
+        boundary = text.find(" ", start, span[0])
+        if boundary != -1:
+            start = boundary + 1
+    if 0 < end < len(text) and text[end - 1].isalnum() and text[end].isalnum():
+        boundary = text.rfind(" ", span[1], end)
+        if boundary != -1:
+            end = boundary
+    return start, end
+
+
+def extract_snippets(
+    objects: Sequence[Object[P, R] | GenerativeObject[P, R]],
+    query: str,
+    property_name: str,
+    max_chars: int = DEFAULT_SNIPPET_CHARS,
+) -> Sequence[Object[P, R] | GenerativeObject[P, R]]:
+    """Replace a text property of query results by its best-matching snippet.
+
+    The offsets of the snippet within the original text are added to the
+    properties of every object under `SNIPPET_INFO_PROPERTY`.
+
+    Args:
+        objects: Objects returned by a query
+        query: Query whose terms the snippets should contain
+        property_name: Text property to shorten
+        max_chars: Maximum length of a snippet in characters
+
+    Returns:
+        The same objects
+
+    """
+    if max_chars < 1:
+        error_msg = "snippet_chars must be at least 1"
+        raise ValueError(error_msg)
+
+    terms = query_terms(query)
+    for obj in objects:
+        if not isinstance(obj.properties, dict):
+            continue
+        properties: dict[str, Any] = obj.properties
+        text = properties.get(property_name)
+        if not isinstance(text, str):
+            continue
+
+        start, end = best_window(text, terms, max_chars)
+        properties[property_name] = text[start:end]
+        properties[SNIPPET_INFO_PROPERTY] = SnippetInfo(
+            property=property_name,
+            start=start,
+            end=end,
+            length=len(text),
+        )
+    return objects
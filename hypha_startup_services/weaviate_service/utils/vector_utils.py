@@ -0,0 +1,115 @@
+"""Binary vector encodings shared by inserts, queries and query results.
+
+Vectors sent as lists of floats are encoded number by number over Hypha RPC.
+Float NumPy arrays travel as one binary buffer instead, and `PackedVectors`
+dictionaries (dtype, shape and raw bytes) do the same for clients without
+NumPy. Both are read as arrays viewing the received buffer, so no list of
+Python floats is built before the Weaviate client packs the vectors.
+"""
+
+from typing import Any, TypeGuard
+
+import numpy as np
+
+from .models import PackedVectors
+
+# Vectors are packed as little-endian float32, the precision Weaviate stores
+PACKED_VECTOR_DTYPE = "<f4"
+
+# Vectors of a whole batch: one row per object, optionally by vector name
+BatchVectors = PackedVectors | np.ndarray | dict[str, PackedVectors | np.ndarray]
+
+
+def is_packed_vectors(value: object) -> TypeGuard[PackedVectors]:
+    """Check whether a value is a PackedVectors dictionary."""
+    return isinstance(value, dict) and {"dtype", "shape", "data"} <= value.keys()
+
+
+def pack_vectors(vectors: list[Any]) -> PackedVectors | list[Any]:
+    """Pack single vectors of equal length, or keep them as a list otherwise."""
+    if not vectors or any(
+        not vector or not isinstance(vector[0], int | float) for vector in vectors
+    ):
+        return vectors
+    if len({len(vector) for vector in vectors}) != 1:
+        return vectors
+
+    array = np.asarray(vectors, dtype=PACKED_VECTOR_DTYPE)
+    return PackedVectors(
+        dtype=PACKED_VECTOR_DTYPE,
+        shape=list(array.shape),
+        data=array.tobytes(),
+    )
+
+
+def as_vector_array(value: PackedVectors | np.ndarray) -> np.ndarray:
+    """Read packed vectors or a NumPy array as a float32 array.
+
+    Packed vectors are viewed in place, and float32 arrays are returned as is.
+
+    Raises:
+        ValueError: If the data is not floating point or does not match its shape
+
+    """
+    if is_packed_vectors(value):
+        try:
+            array = np.frombuffer(value["data"], dtype=value["dtype"]).reshape(
+                value["shape"],
+            )
+        except (TypeError, ValueError) as e:
+            error_msg = f"Invalid packed vectors: {e}"
+            raise ValueError(error_msg) from e
+    else:
+        array = value
+
+    if array.dtype.kind != "f":
+        error_msg = f"Vectors must be floating point, got dtype {array.dtype}"
+        raise ValueError(error_msg)
+    return array.astype(np.float32, copy=False)
+
+
+def decode_vector(value: Any) -> Any:
+    """Decode a vector, or named vectors, given in a binary encoding.
+
+    Lists and other values are returned unchanged.
+    """
+    if is_packed_vectors(value) or isinstance(value, np.ndarray):
+        return as_vector_array(value)
+    if isinstance(value, dict):
+        return {name: decode_vector(vector) for name, vector in value.items()}
+    return value
+
+
+def split_batch_vectors(vectors: BatchVectors, count: int) -> list[Any]:
+    """Split a batch of vectors into one vector per object.
+
+    Args:
+        vectors: An array with one row per object, or a dictionary of such
+            arrays by vector name for named vectors
+        count: Number of objects in the batch
+
+    Returns:
+        The vector, or dictionary of named vectors, of every object. Rows are
+        views of the batch, not copies.
+
+    Raises:
+        ValueError: If the number of rows does not match the number of objects
+
+    """
+    if isinstance(vectors, dict) and not is_packed_vectors(vectors):
+        columns = {
+            name: split_batch_vectors(column, count) for name, column in vectors.items()
+        }
+        return [
+            {name: rows[index] for name, rows in columns.items()}
+            for index in range(count)
+        ]
+
+    array = as_vector_array(vectors)
+    if array.ndim < 2 or len(array) != count:  # noqa: PLR2004
+        error_msg = (
+            f"Expected one vector per object ({count}), got an array of "
+            f"shape {array.shape}"
+        )
+        raise ValueError(error_msg)
+    return list(array)
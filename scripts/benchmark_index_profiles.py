@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark recall and latency of the vector index performance profiles.
+
+For every profile, this script creates a temporary collection on a Weaviate
+instance, inserts random unit vectors and runs near_vector queries. Recall is
+measured against exact nearest neighbours computed with numpy, and latency
+against the wall clock. The temporary collections are deleted afterwards.
+
+Compression starts once a collection reaches its training limit (100000
+objects for scalar quantization), so use at least that many objects to
+benchmark the "balanced" profile realistically.
+
+Usage:
+    python scripts/benchmark_index_profiles.py --objects 100000 --dimensions 768
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any
+
+import numpy as np
+import weaviate
+from weaviate import WeaviateAsyncClient
+from weaviate.classes.data import DataObject
+
+from hypha_startup_services.weaviate_service.utils.index_profiles import (
+    PERFORMANCE_PROFILES,
+    apply_performance_profile,
+    estimate_memory,
+)
+from hypha_startup_services.weaviate_service.utils.models import (
+    CollectionConfig,
+    PerformanceProfile,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INSERT_BATCH_SIZE = 1000
+BYTES_PER_MIB = 1024 * 1024
+
+
+def random_unit_vectors(count: int, dimensions: int, seed: int) -> np.ndarray:
+    """Generate random vectors normalised to unit length."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, dimensions), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_neighbours(data: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Get the indices of the k nearest neighbours by cosine similarity."""
+    similarities = queries @ data.T
+    return np.argsort(-similarities, axis=1)[:, :k]
+
+
+def profile_collection_name(profile: PerformanceProfile) -> str:
+    """Get the name of the temporary collection of a profile."""
+    words = profile.replace("-", " ").title().replace(" ", "")
+    return f"ProfileBenchmark{words}"
+
+
+async def benchmark_profile(
+    client: WeaviateAsyncClient,
+    profile: PerformanceProfile,
+    *,
+    data: np.ndarray,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    k: int,
+) -> dict[str, Any]:
+    """Measure recall@k and query latency of one profile."""
+    name = profile_collection_name(profile)
+    settings: CollectionConfig = {
+        "class": name,
+        "vectorizer": "none",
+        "vectorIndexConfig": {"distance": "cosine"},
+        "properties": [{"name": "index", "dataType": ["int"]}],
+    }
+    if await client.collections.exists(name):
+        await client.collections.delete(name)
+    collection = await client.collections.create_from_dict(  # type: ignore[reportUnknownMemberType]
+        dict(apply_performance_profile(settings, profile)),
+    )
+
+    try:
+        started = time.perf_counter()
+        for offset in range(0, len(data), INSERT_BATCH_SIZE):
+            batch = data[offset : offset + INSERT_BATCH_SIZE]
+            response = await collection.data.insert_many(
+                [
+                    DataObject(
+                        properties={"index": offset + row},
+                        vector=vector.tolist(),
+                    )
+                    for row, vector in enumerate(batch)
+                ],
+            )
+            if response.has_errors:
+                logger.warning("%d objects failed to insert", len(response.errors))
+        insert_seconds = time.perf_counter() - started
+
+        latencies: list[float] = []
+        recalls: list[float] = []
+        for query, expected in zip(queries, truth, strict=True):
+            started = time.perf_counter()
+            result = await collection.query.near_vector(
+                near_vector=query.tolist(),
+                limit=k,
+                return_properties=["index"],
+            )
+            latencies.append(time.perf_counter() - started)
+            found = {obj.properties["index"] for obj in result.objects}
+            recalls.append(len(found & set(expected.tolist())) / k)
+    finally:
+        await client.collections.delete(name)
+
+    estimate = estimate_memory(len(data), data.shape[1], profile)
+    return {
+        "profile": profile,
+        "recall": statistics.mean(recalls),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+        "insert_per_second": len(data) / insert_seconds,
+        "estimated_mib": estimate["total_bytes"] / BYTES_PER_MIB,
+    }
+
+
+async def main() -> None:
+    """Run the benchmark for every profile and log a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--grpc-port", type=int, default=50051)
+    parser.add_argument("--objects", type=int, default=20_000)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=list(PERFORMANCE_PROFILES),
+        help="Profile to benchmark (repeatable, all profiles by default)",
+    )
+    args = parser.parse_args()
+
+    data = random_unit_vectors(args.objects, args.dimensions, seed=0)
+    queries = random_unit_vectors(args.queries, args.dimensions, seed=1)
+    truth = exact_neighbours(data, queries, args.k)
+
+    async with weaviate.use_async_with_local(
+        host=args.host,
+        port=args.port,
+        grpc_port=args.grpc_port,
+    ) as client:
+        results = [
+            await benchmark_profile(
+                client,
+                profile,
+                data=data,
+                queries=queries,
+                truth=truth,
+                k=args.k,
+            )
+            for profile in args.profile or PERFORMANCE_PROFILES
+        ]
+
+    logger.info(
+        "%-12s %9s %9s %9s %12s %14s",
+        "profile",
+        f"recall@{args.k}",
+        "p50 ms",
+        "p95 ms",
+        "inserts/s",
+        "estimated MiB",
+    )
+    for result in results:
+        logger.info(
+            "%-12s %9.3f %9.2f %9.2f %12.0f %14.1f",
+            result["profile"],
+            result["recall"],
+            result["p50_ms"],
+            result["p95_ms"],
+            result["insert_per_second"],
+            result["estimated_mib"],
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""Tests for the embedding cache module."""
+
+from pathlib import Path
+
+import pytest
+
+from hypha_startup_services.common.embedding_cache import (
+    DiskEmbeddingStore,
+    EmbeddingCache,
+    embedding_key,
+)
+
+MODEL = "mxbai-embed-large:latest"
+
+
+class _CountingEmbedder:
+    """Embedder returning a fixed vector and counting its calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, text: str) -> list[float]:
+        self.calls += 1
+        return [float(len(text)), 0.5, -1.0]
+
+
+class TestEmbeddingKey:
+    """Test the embedding_key function."""
+
+    def test_whitespace_is_normalised(self) -> None:
+        """Texts differing only in whitespace share a key."""
+        assert embedding_key(MODEL, "hello   world\n") == embedding_key(
+            MODEL,
+            "hello world",
+        )
+
+    def test_model_is_part_of_key(self) -> None:
+        """The same text embedded by different models has different keys."""
+        assert embedding_key(MODEL, "hello") != embedding_key("other-model", "hello")
+
+
+class TestEmbeddingCache:
+    """Test the EmbeddingCache class."""
+
+    def test_repeated_text_embeds_once(self) -> None:
+        """A repeated text is served from the cache."""
+        cache = EmbeddingCache()
+        embed = _CountingEmbedder()
+
+        first = cache.get_or_embed(MODEL, "some text", embed)
+        second = cache.get_or_embed(MODEL, "some  text", embed)
+
+        assert first == second
+        assert embed.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_evicts_oldest(self) -> None:
+        """The least recently used entry is evicted first."""
+        cache = EmbeddingCache(max_entries=2)
+        cache.put(MODEL, "a", [1.0])
+        cache.put(MODEL, "b", [2.0])
+        cache.get(MODEL, "a")
+        cache.put(MODEL, "c", [3.0])
+
+        assert cache.get(MODEL, "a") == [1.0]
+        assert cache.get(MODEL, "b") is None
+
+    def test_disk_tier_survives_restart(self, tmp_path: Path) -> None:
+        """Embeddings stored on disk are found by a new cache instance."""
+        cache = EmbeddingCache(directory=tmp_path)
+        cache.put(MODEL, "persisted", [0.25, 0.5, 0.75])
+        cache.flush()
+
+        reopened = EmbeddingCache(directory=tmp_path)
+
+        assert reopened.get(MODEL, "persisted") == [0.25, 0.5, 0.75]
+
+
+class TestDiskEmbeddingStore:
+    """Test the DiskEmbeddingStore class."""
+
+    def test_grows_beyond_initial_capacity(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The vector file grows when more rows are stored than it holds."""
+        monkeypatch.setattr(
+            "hypha_startup_services.common.embedding_cache.INITIAL_DISK_ROWS",
+            2,
+        )
+        count = 5
+        store = DiskEmbeddingStore(tmp_path)
+        for index in range(count):
+            store.put(f"key-{index}", [float(index), 1.0])
+
+        assert len(store) == count
+        assert store.get(f"key-{count - 1}") == [float(count - 1), 1.0]
+        assert store.get("key-0") == [0.0, 1.0]
+
+    def test_mixed_dimensions(self, tmp_path: Path) -> None:
+        """Vectors of different dimensions are stored side by side."""
+        store = DiskEmbeddingStore(tmp_path)
+        store.put("small", [1.0, 2.0])
+        store.put("large", [1.0, 2.0, 3.0, 4.0])
+
+        reopened = DiskEmbeddingStore(tmp_path)
+
+        assert reopened.get("small") == [1.0, 2.0]
+        assert reopened.get("large") == [1.0, 2.0, 3.0, 4.0]
+
+    def test_stores_sharing_a_directory(self, tmp_path: Path) -> None:
+        """Stores of several processes see and never overwrite each other's rows."""
+        first = DiskEmbeddingStore(tmp_path)
+        second = DiskEmbeddingStore(tmp_path)
+        first.put("a", [1.0, 2.0])
+        second.put("b", [3.0, 4.0])
+
+        assert first.get("b") == [3.0, 4.0]
+        assert second.get("a") == [1.0, 2.0]
+        assert DiskEmbeddingStore(tmp_path).get("a") == [1.0, 2.0]
+
+    def test_empty_vector_is_rejected(self, tmp_path: Path) -> None:
+        """An embedding without dimensions is not stored."""
+        store = DiskEmbeddingStore(tmp_path)
+
+        with pytest.raises(ValueError, match="dimensions"):
+            store.put("empty", [])
+        assert len(store) == 0
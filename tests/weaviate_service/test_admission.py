@@ -0,0 +1,186 @@
+"""Unit tests for admission control."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from hypha_startup_services.weaviate_service.utils import admission as admission_module
+from hypha_startup_services.weaviate_service.utils.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    ClassLimits,
+)
+
+
+def _context(workspace: str) -> dict[str, Any]:
+    return {"user": {"scope": {"current_workspace": workspace}}}
+
+
+async def _queue(
+    admission: AdmissionController,
+    workspace: str,
+    endpoint_class: Any,
+    admitted: list[str],
+) -> None:
+    await admission.acquire(workspace, endpoint_class)
+    admitted.append(f"{workspace}:{endpoint_class}")
+
+
+@pytest.mark.asyncio
+async def test_interactive_calls_go_first() -> None:
+    """Waiting interactive calls are admitted before earlier bulk calls."""
+    admission = AdmissionController(max_running=1)
+    admitted: list[str] = []
+    await admission.acquire("ws-1", "bulk")
+
+    bulk = asyncio.create_task(_queue(admission, "ws-1", "bulk", admitted))
+    await asyncio.sleep(0)
+    query = asyncio.create_task(_queue(admission, "ws-2", "interactive", admitted))
+    await asyncio.sleep(0)
+    assert not admitted
+
+    admission.release("ws-1", "bulk")
+    await query
+    assert admitted == ["ws-2:interactive"]
+
+    admission.release("ws-2", "interactive")
+    await bulk
+    assert admitted == ["ws-2:interactive", "ws-1:bulk"]
+
+
+@pytest.mark.asyncio
+async def test_busy_workspace_does_not_block_others() -> None:
+    """Calls of a workspace at its limit let other workspaces pass."""
+    admission = AdmissionController(workspace_max_running=1)
+    admitted: list[str] = []
+    await admission.acquire("loader", "bulk")
+
+    waiting = asyncio.create_task(_queue(admission, "loader", "bulk", admitted))
+    await asyncio.sleep(0)
+    await _queue(admission, "other", "bulk", admitted)
+    assert admitted == ["other:bulk"]
+    assert admission.stats()["bulk"]["queued"] == 1
+
+    admission.release("loader", "bulk")
+    await waiting
+    assert admitted == ["other:bulk", "loader:bulk"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_and_full_queue_reject() -> None:
+    """Calls above the rate or beyond the queue size are rejected."""
+    admission = AdmissionController(
+        class_limits={
+            "generative": ClassLimits(max_running=1, max_queued=1, rate=1, burst=2),
+        },
+    )
+    await admission.acquire("ws-1", "generative")
+    waiting = asyncio.create_task(admission.acquire("ws-1", "generative"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError, match="Too many queued"):
+        await admission.acquire("ws-2", "generative")
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert admission.stats()["generative"]["queued"] == 0
+    with pytest.raises(AdmissionRejectedError, match="Rate limit"):
+        await admission.acquire("ws-1", "generative")
+    assert admission.stats()["generative"]["rejected"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_full_queue_does_not_use_rate() -> None:
+    """Calls rejected at a full queue leave the workspace's tokens."""
+    admission = AdmissionController(
+        class_limits={
+            "bulk": ClassLimits(max_running=1, max_queued=1, rate=1e-6, burst=3),
+        },
+    )
+    await admission.acquire("ws-1", "bulk")
+    waiting = asyncio.create_task(admission.acquire("ws-1", "bulk"))
+    await asyncio.sleep(0)
+
+    for _ in range(3):
+        with pytest.raises(AdmissionRejectedError, match="Too many queued"):
+            await admission.acquire("ws-1", "bulk")
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    admission.release("ws-1", "bulk")
+    await admission.acquire("ws-1", "bulk")
+
+
+@pytest.mark.asyncio
+async def test_wrapped_endpoints_report_queue_time() -> None:
+    """Wrapped functions and generators hold a slot while they run."""
+    admission = AdmissionController(max_running=1)
+
+    async def _query(value: int, context: dict[str, Any] | None = None) -> int:
+        assert context is not None
+        await asyncio.sleep(0.02)
+        return value
+
+    async def _iterate(context: dict[str, Any] | None = None) -> Any:
+        assert context is not None
+        for value in range(2):
+            yield value
+
+    query = admission.wrap(_query, "interactive")
+    iterate = admission.wrap(_iterate, "bulk")
+
+    results = await asyncio.gather(
+        query(1, context=_context("ws-1")),
+        query(2, context=_context("ws-1")),
+    )
+    values = [value async for value in iterate(context=_context("ws-1"))]
+
+    stats = admission.stats()
+    assert results == [1, 2]
+    assert values == [0, 1]
+    assert stats["interactive"]["admitted"] == 2  # noqa: PLR2004
+    assert stats["interactive"]["queue_seconds_max"] >= 0.01  # noqa: PLR2004
+    assert stats["bulk"]["admitted"] == 1
+    assert stats["bulk"]["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stalled_stream_loses_its_slot() -> None:
+    """A stream is released after its hold time and fails when resumed."""
+    admission = AdmissionController(max_running=1, stream_max_slot_seconds=0.01)
+
+    async def _iterate(context: dict[str, Any] | None = None) -> Any:
+        assert context is not None
+        for value in range(2):
+            yield value
+
+    stream = admission.wrap(_iterate, "bulk")(context=_context("ws-1"))
+    assert await anext(stream) == 0
+    await asyncio.sleep(0.02)
+
+    assert admission.stats()["bulk"]["running"] == 0
+    await admission.acquire("ws-2", "interactive")
+    with pytest.raises(AdmissionRejectedError, match=r"more than 0\.01 seconds"):
+        await anext(stream)
+    assert admission.stats()["interactive"]["running"] == 1
+
+
+def test_idle_buckets_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Refilled token buckets are dropped once there are many of them."""
+    monkeypatch.setattr(admission_module, "BUCKET_EVICTION_THRESHOLD", 2)
+    admission = AdmissionController(
+        class_limits={"bulk": ClassLimits(max_running=8, max_queued=8, rate=1e6)},
+    )
+    limits = admission.class_limits["bulk"]
+    busy = admission._bucket("busy", "bulk", limits)  # noqa: SLF001
+    assert busy is not None
+    busy.rate = 0
+    busy.tokens = 0
+    admission._bucket("idle", "bulk", limits)  # noqa: SLF001
+
+    admission._bucket("new", "bulk", limits)  # noqa: SLF001
+
+    assert set(admission._buckets) == {("busy", "bulk"), ("new", "bulk")}  # noqa: SLF001
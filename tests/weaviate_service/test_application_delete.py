@@ -0,0 +1,188 @@
+"""Unit tests for paginated application deletion."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.collection_utils import (
+    delete_application_objects,
+)
+from hypha_startup_services.weaviate_service.utils.jobs import JobManager
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+CONTEXT = {"user": {"scope": {"current_workspace": "ws-user-owner"}}}
+
+
+@dataclass
+class _FakeObject:
+    uuid: UUID
+
+
+@dataclass
+class _FakeDeleteReturn:
+    failed: int
+    matches: int
+    successful: int
+    objects: None = None
+
+
+class _FakeTenantCollection:
+    """Tenant collection deleting the last fetched page on delete_many."""
+
+    def __init__(self, count: int, undeletable: int = 0) -> None:
+        self.stored = [uuid4() for _ in range(count)]
+        self.undeletable = set(self.stored[:undeletable])
+        self.deleted_pages: list[int] = []
+        self._page: list[UUID] = []
+        self.data = self
+        self.query = self
+        self.aggregate = self
+
+    async def fetch_objects(self, limit: int, **_kwargs: Any) -> Any:  # NOSONAR S7503
+        self._page = self.stored[:limit]
+        page = self._page
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.objects = [_FakeObject(uuid) for uuid in page]
+
+        return _Resp()
+
+    async def delete_many(self, **_kwargs: Any) -> _FakeDeleteReturn:  # NOSONAR S7503
+        deleted = [uuid for uuid in self._page if uuid not in self.undeletable]
+        self.stored = [uuid for uuid in self.stored if uuid not in deleted]
+        self.deleted_pages.append(len(deleted))
+        return _FakeDeleteReturn(
+            failed=len(self._page) - len(deleted),
+            matches=len(self._page),
+            successful=len(deleted),
+        )
+
+    async def over_all(self, **_kwargs: Any) -> Any:  # NOSONAR S7503
+        class _Resp:
+            total_count = len(self.stored)
+
+        return _Resp()
+
+
+def _patch_service(
+    monkeypatch: Any,
+    fake_tenant: _FakeTenantCollection,
+) -> list[str]:
+    deleted_artifacts: list[str] = []
+
+    async def _fake_is_multitenancy_enabled(*_args: Any) -> bool:  # NOSONAR S7503
+        return False
+
+    async def _fake_delete_application_artifact(  # NOSONAR S7503
+        _collection_name: str,
+        application_id: str,
+        _caller_ws: str,
+    ) -> None:
+        assert not fake_tenant.stored
+        deleted_artifacts.append(application_id)
+
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    monkeypatch.setattr(
+        w_methods,
+        "is_multitenancy_enabled",
+        _fake_is_multitenancy_enabled,
+    )
+    monkeypatch.setattr(
+        w_methods,
+        "delete_application_artifact",
+        _fake_delete_application_artifact,
+    )
+    return deleted_artifacts
+
+
+@pytest.mark.asyncio
+async def test_delete_application_objects_pages_until_empty() -> None:
+    """All objects are deleted in bounded pages."""
+    fake_tenant = _FakeTenantCollection(count=25)
+    progress: list[int] = []
+
+    result = await delete_application_objects(
+        fake_tenant,  # type: ignore[arg-type]
+        APP_ID,
+        page_size=10,
+        on_page=progress.append,
+    )
+
+    assert fake_tenant.deleted_pages == [10, 10, 5]
+    assert progress == [10, 10, 5]
+    assert result["successful"] == 25  # noqa: PLR2004
+    assert not fake_tenant.stored
+
+
+@pytest.mark.asyncio
+async def test_delete_application_objects_stops_without_progress() -> None:
+    """Objects that cannot be deleted raise instead of looping forever."""
+    fake_tenant = _FakeTenantCollection(count=5, undeletable=2)
+
+    with pytest.raises(RuntimeError, match="no progress"):
+        await delete_application_objects(
+            fake_tenant,  # type: ignore[arg-type]
+            APP_ID,
+            page_size=10,
+        )
+
+    assert len(fake_tenant.stored) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_applications_delete_keeps_artifact_on_failure(monkeypatch: Any) -> None:
+    """The artifact is only deleted once all objects are gone."""
+    fake_tenant = _FakeTenantCollection(count=3, undeletable=1)
+    deleted_artifacts = _patch_service(monkeypatch, fake_tenant)
+
+    with pytest.raises(RuntimeError):
+        await w_methods.applications_delete(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            context=CONTEXT,
+        )
+    assert deleted_artifacts == []
+
+    fake_tenant.undeletable.clear()
+    result = await w_methods.applications_delete(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        context=CONTEXT,
+    )
+
+    assert result["successful"] == 1
+    assert deleted_artifacts == [APP_ID]
+
+
+@pytest.mark.asyncio
+async def test_delete_job_reports_progress(monkeypatch: Any) -> None:
+    """A delete job deletes all objects, then the artifact."""
+    fake_tenant = _FakeTenantCollection(count=7)
+    deleted_artifacts = _patch_service(monkeypatch, fake_tenant)
+    job_manager = JobManager()
+
+    job = await w_methods.applications_submit_delete_job(
+        client=None,  # type: ignore[arg-type]
+        job_manager=job_manager,
+        collection_name="Movie",
+        application_id=APP_ID,
+        context=CONTEXT,
+    )
+    current = asyncio.current_task()
+    await asyncio.gather(
+        *(task for task in asyncio.all_tasks() if task is not current),
+    )
+    status = await w_methods.jobs_status(job_manager, job["job_id"], CONTEXT)
+
+    assert job["operation"] == "delete"
+    assert job["total_objects"] == 7  # noqa: PLR2004
+    assert status["status"] == "completed"
+    assert status["processed_objects"] == 7  # noqa: PLR2004
+    assert deleted_artifacts == [APP_ID]
@@ -0,0 +1,298 @@
+"""Unit tests for collections partitioned by application."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from hypha_rpc.rpc import RemoteException
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils import (
+    artifact_utils,
+    collection_utils,
+    service_utils,
+)
+from hypha_startup_services.weaviate_service.utils.collection_utils import (
+    MAX_TENANT_NAME_LENGTH,
+    format_tenant_name,
+    get_tenant_collection,
+    is_application_tenant,
+    scope_to_application,
+)
+from tests.weaviate_service.utils import APP_ID
+
+USER_WS = "ws-user-github|1234"
+
+
+@dataclass
+class _FakeMultiTenancyConfig:
+    enabled: bool
+
+
+@dataclass
+class _FakeCollectionConfig:
+    multi_tenancy_config: _FakeMultiTenancyConfig
+
+
+class _FakeTenantCollection:
+    def __init__(self, tenant: str) -> None:
+        self.tenant = tenant
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.config = self
+
+    async def get(self) -> _FakeCollectionConfig:  # NOSONAR S7503
+        return _FakeCollectionConfig(_FakeMultiTenancyConfig(enabled=True))
+
+    def with_tenant(self, tenant: str) -> _FakeTenantCollection:
+        return _FakeTenantCollection(tenant)
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.collections = self
+        self.created: list[dict[str, Any]] = []
+
+    def get(self, _name: str) -> _FakeCollection:
+        return _FakeCollection()
+
+    async def create_from_dict(  # NOSONAR S7503
+        self,
+        settings: dict[str, Any],
+    ) -> _FakeCollection:
+        self.created.append(settings)
+        return _FakeCollection()
+
+
+def _patch_partitioning(monkeypatch: Any, partitioning: str) -> None:
+    async def _fake_get_collection_partitioning(  # NOSONAR S7503
+        _collection_name: str,
+    ) -> str:
+        return partitioning
+
+    monkeypatch.setattr(
+        collection_utils,
+        "get_collection_partitioning",
+        _fake_get_collection_partitioning,
+    )
+
+
+def test_format_tenant_name_per_application() -> None:
+    """Application tenants are named after workspace and application."""
+    assert format_tenant_name(USER_WS) == "ws-user-github_1234"
+    assert format_tenant_name(USER_WS, APP_ID) == f"ws-user-github_1234__{APP_ID}"
+
+
+def test_format_tenant_name_hashes_invalid_names() -> None:
+    """Invalid or long application tenant names are shortened with a hash."""
+    dotted = format_tenant_name(USER_WS, "my.app")
+    underscored = format_tenant_name(USER_WS, "my_app")
+    long_name = format_tenant_name(USER_WS, "a" * 100)
+
+    assert dotted != underscored
+    assert "." not in dotted
+    assert len(long_name) == MAX_TENANT_NAME_LENGTH
+    assert long_name != format_tenant_name(USER_WS, "a" * 101)
+
+
+@pytest.mark.asyncio
+async def test_partitioned_collection_routes_to_application_tenant(
+    monkeypatch: Any,
+) -> None:
+    """Partitioned collections use the application's tenant without filtering."""
+    _patch_partitioning(monkeypatch, "application")
+
+    tenant_collection = await get_tenant_collection(
+        _FakeClient(),  # type: ignore[arg-type]
+        "Movie",
+        USER_WS,
+        APP_ID,
+    )
+
+    assert tenant_collection.tenant == format_tenant_name(USER_WS, APP_ID)
+    assert is_application_tenant(tenant_collection)
+    assert scope_to_application(tenant_collection, APP_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_workspace_collection_routes_to_workspace_tenant(
+    monkeypatch: Any,
+) -> None:
+    """Collections partitioned by workspace keep the application filter."""
+    _patch_partitioning(monkeypatch, "workspace")
+
+    tenant_collection = await get_tenant_collection(
+        _FakeClient(),  # type: ignore[arg-type]
+        "Movie",
+        USER_WS,
+        APP_ID,
+    )
+
+    assert tenant_collection.tenant == format_tenant_name(USER_WS)
+    assert not is_application_tenant(tenant_collection)
+    assert scope_to_application(tenant_collection, APP_ID) is not None
+
+
+@pytest.mark.asyncio
+async def test_collections_create_enables_multi_tenancy(monkeypatch: Any) -> None:
+    """Partitioning is kept out of the Weaviate schema and enables tenants."""
+    stored_settings: list[dict[str, Any]] = []
+
+    async def _fake_create_collection_artifact(  # NOSONAR S7503
+        settings: dict[str, Any],
+    ) -> None:
+        stored_settings.append(settings)
+
+    async def _fake_collection_to_config_dict(  # NOSONAR S7503
+        _collection: Any,
+    ) -> dict[str, Any]:
+        return {}
+
+    monkeypatch.setattr(w_methods, "assert_is_admin_ws", lambda _ws: None)
+    monkeypatch.setattr(
+        w_methods,
+        "create_collection_artifact",
+        _fake_create_collection_artifact,
+    )
+    monkeypatch.setattr(
+        w_methods,
+        "collection_to_config_dict",
+        _fake_collection_to_config_dict,
+    )
+    client = _FakeClient()
+    context = {"user": {"scope": {"current_workspace": USER_WS}}}
+
+    await w_methods.collections_create(
+        client,  # type: ignore[arg-type]
+        {"class": "Movie", "partitioning": "application"},
+        context=context,
+    )
+
+    assert "partitioning" not in client.created[0]
+    assert client.created[0]["multiTenancyConfig"] == {"enabled": True}
+    assert stored_settings[0]["partitioning"] == "application"
+
+    with pytest.raises(ValueError, match="requires multi-tenancy"):
+        await w_methods.collections_create(
+            client,  # type: ignore[arg-type]
+            {
+                "class": "Movie",
+                "partitioning": "application",
+                "multiTenancyConfig": {"enabled": False},
+            },
+            context=context,
+        )
+
+
+@pytest.mark.asyncio
+async def test_partitioning_defaults_to_workspace_without_artifact(
+    monkeypatch: Any,
+) -> None:
+    """A missing artifact counts as workspace partitioning and is retried."""
+    calls: list[str] = []
+
+    async def _fake_get_artifact(artifact_id: str) -> dict[str, Any]:  # NOSONAR S7503
+        calls.append(artifact_id)
+        if len(calls) == 1:
+            error_msg = f"Artifact '{artifact_id}' does not exist"
+            raise RemoteException(error_msg)
+        return {"manifest": {"metadata": {"settings": {"partitioning": "application"}}}}
+
+    monkeypatch.setattr(artifact_utils, "get_artifact", _fake_get_artifact)
+    monkeypatch.setattr(artifact_utils, "_collection_partitioning", {})
+
+    assert await artifact_utils.get_collection_partitioning("Movie") == "workspace"
+    assert await artifact_utils.get_collection_partitioning("Movie") == "application"
+    assert await artifact_utils.get_collection_partitioning("Movie") == "application"
+    assert len(calls) == 2  # noqa: PLR2004
+
+    monkeypatch.setattr(artifact_utils, "PARTITIONING_CACHE_SECONDS", 0)
+    monkeypatch.setattr(artifact_utils, "_collection_partitioning", {})
+    await artifact_utils.get_collection_partitioning("Movie")
+    await artifact_utils.get_collection_partitioning("Movie")
+    assert len(calls) == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_partitioning_read_errors_are_raised(monkeypatch: Any) -> None:
+    """Failing artifact reads other than a missing artifact fail the call."""
+    failures = [RemoteException("Connection to the artifact manager lost")]
+
+    async def _fake_get_artifact(_artifact_id: str) -> dict[str, Any]:  # NOSONAR S7503
+        if failures:
+            raise failures.pop()
+        return {"manifest": {"metadata": {"settings": {"partitioning": "application"}}}}
+
+    monkeypatch.setattr(artifact_utils, "get_artifact", _fake_get_artifact)
+    monkeypatch.setattr(artifact_utils, "_collection_partitioning", {})
+
+    with pytest.raises(RemoteException, match="lost"):
+        await artifact_utils.get_collection_partitioning("Movie")
+    assert await artifact_utils.get_collection_partitioning("Movie") == "application"
+
+
+async def _collection_exists(*_args: Any, **_kwargs: Any) -> bool:  # NOSONAR S7503
+    return True
+
+
+async def _artifact_exists(*_args: Any, **_kwargs: Any) -> bool:  # NOSONAR S7503
+    return False
+
+
+@pytest.mark.asyncio
+async def test_lost_artifact_of_multi_tenant_collection_is_not_guessed(
+    monkeypatch: Any,
+) -> None:
+    """Creating an application does not recreate an ambiguous artifact."""
+    monkeypatch.setattr(service_utils, "collection_exists", _collection_exists)
+    monkeypatch.setattr(service_utils, "artifact_exists", _artifact_exists)
+
+    with pytest.raises(ValueError, match="restore_artifact"):
+        await service_utils.prepare_application_creation(
+            _FakeClient(),  # type: ignore[arg-type]
+            "Movie",
+            USER_WS,
+            APP_ID,
+        )
+
+
+@pytest.mark.asyncio
+async def test_restore_artifact_stores_stated_partitioning(monkeypatch: Any) -> None:
+    """Admins restore a lost artifact with the partitioning they state."""
+    stored_settings: list[dict[str, Any]] = []
+
+    async def _fake_create_collection_artifact(  # NOSONAR S7503
+        settings: dict[str, Any],
+    ) -> None:
+        stored_settings.append(settings)
+
+    async def _fake_collection_to_config_dict(  # NOSONAR S7503
+        _collection: Any,
+    ) -> dict[str, Any]:
+        return {"class": "Movie"}
+
+    monkeypatch.setattr(w_methods, "assert_is_admin_ws", lambda _ws: None)
+    monkeypatch.setattr(w_methods, "collection_exists", _collection_exists)
+    monkeypatch.setattr(w_methods, "artifact_exists", _artifact_exists)
+    monkeypatch.setattr(
+        service_utils,
+        "create_collection_artifact",
+        _fake_create_collection_artifact,
+    )
+    monkeypatch.setattr(
+        service_utils,
+        "collection_to_config_dict",
+        _fake_collection_to_config_dict,
+    )
+    context = {"user": {"scope": {"current_workspace": USER_WS}}}
+
+    await w_methods.collections_restore_artifact(
+        _FakeClient(),  # type: ignore[arg-type]
+        "Movie",
+        "application",
+        context=context,
+    )
+
+    assert stored_settings == [{"class": "Movie", "partitioning": "application"}]
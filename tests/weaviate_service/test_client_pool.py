@@ -0,0 +1,226 @@
+"""Unit tests for the shared Weaviate client pool."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from weaviate.exceptions import (
+    WeaviateConnectionError,
+    WeaviateGRPCUnavailableError,
+    WeaviateQueryError,
+)
+
+from hypha_startup_services.weaviate_service import client_pool
+from hypha_startup_services.weaviate_service.client_pool import WeaviateClientPool
+
+
+class _FakeClient:
+    def __init__(self, number: int, *, ready: bool = True) -> None:
+        self.number = number
+        self.ready = ready
+        self.closed = False
+
+    async def is_ready(self) -> bool:  # NOSONAR S7503
+        return self.ready
+
+    async def close(self) -> None:  # NOSONAR S7503
+        self.closed = True
+
+
+class _FakeConnector:
+    def __init__(self) -> None:
+        self.clients: list[_FakeClient] = []
+        self.ready = True
+
+    async def __call__(self, *_args: Any) -> _FakeClient:  # NOSONAR S7503
+        client = _FakeClient(len(self.clients), ready=self.ready)
+        self.clients.append(client)
+        return client
+
+
+async def _started_pool(
+    connector: _FakeConnector,
+    check_interval: float = 60,
+) -> WeaviateClientPool:
+    pool = WeaviateClientPool(
+        connector,  # type: ignore[arg-type]
+        size=2,
+        check_interval=check_interval,
+        close_delay=0,
+    )
+    await pool.start()
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_calls_over_clients() -> None:
+    """The pooled client uses the pool's clients in turn."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+    await pool.start()
+
+    numbers = [pool.client.number for _ in range(4)]  # type: ignore[attr-defined]
+
+    assert numbers == [0, 1, 0, 1]
+    assert len(connector.clients) == 2  # noqa: PLR2004
+    await pool.close()
+    assert all(client.closed for client in connector.clients)
+
+
+@pytest.mark.asyncio
+async def test_unready_client_is_replaced() -> None:
+    """A client failing its readiness check is replaced and later closed."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+    broken = connector.clients[0]
+    broken.ready = False
+
+    assert await pool.check() == 1
+    await asyncio.sleep(0.01)
+
+    assert broken.closed
+    assert {pool.get().number for _ in range(2)} == {1, 2}
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_client_is_kept_while_weaviate_is_down() -> None:
+    """No client is replaced until Weaviate accepts a ready connection."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+    connector.clients[0].ready = False
+    connector.ready = False
+
+    assert await pool.check() == 0
+    assert connector.clients[2].closed
+    assert not connector.clients[0].closed
+
+    connector.ready = True
+    assert await pool.check() == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_calls_use_one_client() -> None:
+    """A watched call resolves the pooled client to the same client throughout."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+
+    async def _query() -> list[int]:  # NOSONAR S7503
+        return [pool.client.number for _ in range(3)]  # type: ignore[attr-defined]
+
+    async def _iterate() -> Any:
+        for _ in range(2):
+            yield pool.client.number  # type: ignore[attr-defined]
+
+    watched = pool.watch(_query)
+    assert await watched() == [0, 0, 0]
+    assert await watched() == [1, 1, 1]
+    assert [number async for number in pool.watch(_iterate)()] == [0, 0]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_replace_the_client() -> None:
+    """A client whose call fails is replaced, even if Weaviate reports ready."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+
+    async def _query(context: dict[str, Any] | None = None) -> None:
+        assert context is None
+        error_msg = "connection reset"
+        raise WeaviateConnectionError(error_msg)
+
+    with pytest.raises(WeaviateConnectionError):
+        await pool.watch(_query)()
+    await asyncio.sleep(0.01)
+
+    assert len(connector.clients) == 3  # noqa: PLR2004
+    assert connector.clients[0].closed
+    assert not connector.clients[1].closed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_services_share_the_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pools are shared per Weaviate endpoint within a process."""
+    connector = _FakeConnector()
+    monkeypatch.setattr(client_pool, "instantiate_and_connect", connector)
+    monkeypatch.setattr(client_pool, "_pools", {})
+
+    first, second = await asyncio.gather(
+        client_pool.get_client_pool(),
+        client_pool.get_client_pool(),
+    )
+    other = await client_pool.get_client_pool("other-http", "other-grpc")
+
+    assert first is second
+    assert other is not first
+    assert len(connector.clients) == 4  # noqa: PLR2004
+    await first.close()
+    await other.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_replaces_its_client() -> None:
+    """A stream failing with a gRPC error marks its client as failed."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+
+    async def _iterate() -> Any:
+        yield 1
+        raise WeaviateGRPCUnavailableError
+
+    with pytest.raises(WeaviateGRPCUnavailableError):
+        _ = [item async for item in pool.watch(_iterate)()]
+
+    assert await pool.check() == 1
+    assert connector.clients[0] not in pool._clients  # noqa: SLF001
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_query_errors_do_not_trigger_a_check() -> None:
+    """Errors of bad queries do not count as connection errors."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+
+    async def _query() -> None:
+        error_msg = "no such property"
+        raise WeaviateQueryError(error_msg, "gRPC")
+
+    with pytest.raises(WeaviateQueryError):
+        await pool.watch(_query)()
+
+    assert not pool._check_requested.is_set()  # noqa: SLF001
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_replaced_client_stays_open_while_leased() -> None:
+    """Calls and the jobs they start keep a replaced client open."""
+    connector = _FakeConnector()
+    pool = await _started_pool(connector)
+    replaced = asyncio.Event()
+    used: list[_FakeClient] = []
+    job_leases: list[Any] = []
+
+    async def _submit_job() -> None:
+        used.extend(pool.get() for _ in range(2))
+        job_leases.append(pool.lease())
+        await replaced.wait()
+
+    call = asyncio.create_task(pool.watch(_submit_job)())
+    await asyncio.sleep(0)
+    for client in used:
+        client.ready = False
+    assert await pool.check() == 2  # noqa: PLR2004
+    replaced.set()
+    await call
+    await asyncio.sleep(0.01)
+
+    assert not any(client.closed for client in used)
+    job_leases[0]()
+    await asyncio.sleep(0.01)
+    assert all(client.closed for client in used)
+    await pool.close()
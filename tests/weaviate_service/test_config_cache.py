@@ -0,0 +1,178 @@
+"""Unit tests for the collection config cache."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from hypha_startup_services.common.utils import get_full_collection_name
+from hypha_startup_services.weaviate_service.utils.config_cache import (
+    CollectionConfigCache,
+    project_fields,
+)
+
+MOVIE = get_full_collection_name("Movie")
+BOOK = get_full_collection_name("Book")
+
+
+@dataclass
+class _FakeProperty:
+    name: str
+
+
+@dataclass
+class _FakeMultiTenancyConfig:
+    enabled: bool = True
+
+
+@dataclass
+class _FakeIndexType:
+    value: str = "hnsw"
+
+
+@dataclass
+class _FakeConfig:
+    name: str
+    description: str | None = None
+    properties: list[_FakeProperty] = field(default_factory=list)
+    multi_tenancy_config: _FakeMultiTenancyConfig = field(
+        default_factory=_FakeMultiTenancyConfig,
+    )
+    vector_config: dict[str, Any] | None = None
+    vector_index_type: _FakeIndexType = field(default_factory=_FakeIndexType)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "class": self.name,
+            "description": self.description,
+            "properties": [{"name": prop.name} for prop in self.properties],
+        }
+
+
+class _FakeCollection:
+    def __init__(self, client: "_FakeClient", name: str) -> None:
+        self._client = client
+        self._name = name
+        self.config = self
+
+    async def get(self) -> _FakeConfig:  # NOSONAR S7503
+        self._client.requests += 1
+        return self._client.configs[self._name]
+
+
+class _FakeClient:
+    def __init__(self, configs: dict[str, _FakeConfig]) -> None:
+        self.configs = configs
+        self.collections = self
+        self.requests = 0
+
+    async def list_all(self, **_kwargs: Any) -> dict[str, _FakeConfig]:  # NOSONAR S7503
+        self.requests += 1
+        return dict(self.configs)
+
+    def get(self, name: str) -> _FakeCollection:
+        return _FakeCollection(self, name)
+
+
+def _client() -> _FakeClient:
+    return _FakeClient(
+        {
+            MOVIE: _FakeConfig(MOVIE, "Movies", [_FakeProperty("title")]),
+            BOOK: _FakeConfig(BOOK, "Books", [_FakeProperty("author")]),
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_listing_is_cached() -> None:
+    """Repeated listings are served without new schema requests."""
+    client = _client()
+    cache = CollectionConfigCache()
+
+    first = await cache.list_all(client)  # type: ignore[arg-type]
+    second = await cache.list_all(client)  # type: ignore[arg-type]
+
+    assert client.requests == 1
+    assert first == second
+    assert first["Movie"]["class"] == "Movie"
+
+
+@pytest.mark.asyncio
+async def test_simple_listing_returns_summaries() -> None:
+    """Simple listings contain key settings and a version stamp."""
+    cache = CollectionConfigCache()
+
+    summaries = await cache.list_all(_client(), simple=True)  # type: ignore[arg-type]
+
+    assert summaries["Book"] == {
+        "name": "Book",
+        "description": "Books",
+        "multi_tenancy": True,
+        "properties": ["author"],
+        "vectors": {"default": "hnsw"},
+        "version": summaries["Book"]["version"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_version_changes_with_schema() -> None:
+    """Versions stay while a schema is unchanged and change when it changes."""
+    client = _client()
+    cache = CollectionConfigCache(ttl=0)
+
+    before = await cache.list_all(client, simple=True)  # type: ignore[arg-type]
+    client.configs[MOVIE] = _FakeConfig(MOVIE, "Films", [_FakeProperty("title")])
+    after = await cache.list_all(client, simple=True)  # type: ignore[arg-type]
+
+    assert after["Book"]["version"] == before["Book"]["version"]
+    assert after["Movie"]["version"] != before["Movie"]["version"]
+    assert after["Movie"]["description"] == "Films"
+
+
+@pytest.mark.asyncio
+async def test_versions_agree_between_processes() -> None:
+    """Caches of different processes stamp the same schema alike."""
+    first = await CollectionConfigCache().list_all(_client(), simple=True)  # type: ignore[arg-type]
+    second = await CollectionConfigCache().list_all(_client(), simple=True)  # type: ignore[arg-type]
+
+    assert first["Movie"]["version"] == second["Movie"]["version"]
+    assert first["Movie"]["version"] != first["Book"]["version"]
+
+
+@pytest.mark.asyncio
+async def test_clients_are_cached_separately() -> None:
+    """Clients of different Weaviate instances do not share entries."""
+    client = _client()
+    other = _FakeClient({MOVIE: _FakeConfig(MOVIE, "Other movies")})
+    cache = CollectionConfigCache()
+
+    movies = await cache.get_dict(client, MOVIE)  # type: ignore[arg-type]
+    other_movies = await cache.get_dict(other, MOVIE)  # type: ignore[arg-type]
+    listing = await cache.list_all(other)  # type: ignore[arg-type]
+
+    assert movies["description"] == "Movies"
+    assert other_movies["description"] == "Other movies"
+    assert list(listing) == ["Movie"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_refetches() -> None:
+    """Invalidated collections are fetched again."""
+    client = _client()
+    cache = CollectionConfigCache()
+
+    await cache.get(client, MOVIE)  # type: ignore[arg-type]
+    await cache.get(client, MOVIE)  # type: ignore[arg-type]
+    cache.invalidate(MOVIE)
+    await cache.get(client, MOVIE)  # type: ignore[arg-type]
+
+    assert client.requests == 2  # noqa: PLR2004
+
+
+def test_project_fields() -> None:
+    """Only the requested fields are kept."""
+    configs: Any = {"Movie": {"class": "Movie", "properties": [], "vectorizer": "x"}}
+
+    assert project_fields(configs, ["class", "missing"]) == {
+        "Movie": {"class": "Movie"},
+    }
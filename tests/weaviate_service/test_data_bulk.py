@@ -0,0 +1,144 @@
+"""Unit tests for bulk update, delete and exists endpoints."""
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+EXISTING = [UUID(int=1), UUID(int=2)]
+MISSING = UUID(int=3)
+
+
+@dataclass
+class _FakeDeleted:
+    uuid: UUID
+    successful: bool
+    error: str | None = None
+
+
+@dataclass
+class _FakeFetched:
+    uuid: UUID
+
+
+class _FakeData:
+    def __init__(self) -> None:
+        self.updated: list[dict[str, Any]] = []
+        self.delete_calls = 0
+
+    async def update(self, **kwargs: Any) -> None:  # NOSONAR S7503
+        if kwargs["uuid"] not in EXISTING:
+            error_msg = "Object not found"
+            raise ValueError(error_msg)
+        self.updated.append(kwargs)
+
+    async def delete_many(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        self.delete_calls += 1
+        assert kwargs["verbose"] is True
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.objects = [
+                    _FakeDeleted(uuid=uuid, successful=True) for uuid in EXISTING
+                ]
+
+        return _Resp()
+
+
+class _FakeQuery:
+    async def fetch_objects(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        assert kwargs["return_properties"] == []
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.objects = [_FakeFetched(uuid=EXISTING[0])]
+
+        return _Resp()
+
+
+class _FakeTenantCollection:
+    def __init__(self) -> None:
+        self.data = _FakeData()
+        self.query = _FakeQuery()
+
+
+@pytest.mark.asyncio
+async def test_update_many_reports_per_object(monkeypatch: Any) -> None:
+    """Updates share one preparation and failures are reported per UUID."""
+    fake_tenant = _FakeTenantCollection()
+    prepared = patch_tenant_collection(monkeypatch, fake_tenant)
+
+    results = await w_methods.data_update_many(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        objects=[
+            {"uuid": EXISTING[0], "properties": {"genre": "Drama"}},
+            {"uuid": MISSING, "properties": {"genre": "Drama"}},
+        ],
+    )
+
+    assert prepared == [("Movie", APP_ID)]
+    assert len(fake_tenant.data.updated) == 1
+    assert results[str(EXISTING[0])] == {"successful": True, "error": None}
+    assert results[str(MISSING)]["successful"] is False
+
+
+@pytest.mark.asyncio
+async def test_update_many_rejects_bad_items_before_writing(monkeypatch: Any) -> None:
+    """Items without a valid or with a repeated UUID fail the call up front."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    with pytest.raises(ValueError, match=r"Object 1: .*Object 2: .*Object 3: "):
+        await w_methods.data_update_many(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            objects=[
+                {"uuid": EXISTING[0], "properties": {"genre": "Drama"}},
+                {"properties": {"genre": "Drama"}},
+                {"uuid": "not-a-uuid", "properties": {"genre": "Drama"}},
+                {"uuid": str(EXISTING[0]), "properties": {"genre": "Action"}},
+            ],
+        )
+
+    assert fake_tenant.data.updated == []
+
+
+@pytest.mark.asyncio
+async def test_delete_by_ids_pages_and_reports_missing(monkeypatch: Any) -> None:
+    """IDs are deleted in pages and unmatched IDs are reported as not found."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    monkeypatch.setattr(w_methods, "BULK_ID_PAGE_SIZE", 2)
+
+    results = await w_methods.data_delete_by_ids(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        uuids=[*EXISTING, MISSING.hex],
+    )
+
+    assert fake_tenant.data.delete_calls == 2
+    assert results[str(EXISTING[1])]["successful"] is True
+    assert results[str(MISSING)] == {"successful": False, "error": "Object not found"}
+
+
+@pytest.mark.asyncio
+async def test_exists_many(monkeypatch: Any) -> None:
+    """Existence is answered for every requested UUID."""
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection())
+
+    results = await w_methods.data_exists_many(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        uuids=[EXISTING[0], MISSING],
+    )
+
+    assert results == {str(EXISTING[0]): True, str(MISSING): False}
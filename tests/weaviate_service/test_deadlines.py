@@ -0,0 +1,143 @@
+"""Unit tests for call deadlines."""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from hypha_startup_services.weaviate_service.register_service import admit_endpoints
+from hypha_startup_services.weaviate_service.utils.admission import (
+    AdmissionController,
+)
+from hypha_startup_services.weaviate_service.utils.deadlines import (
+    DeadlineExceededError,
+    with_deadline,
+)
+
+CONTEXT = {"user": {"scope": {"current_workspace": "ws-user-test"}}}
+
+
+class _SlowEndpoint:
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self, context: dict[str, Any] | None = None) -> str:
+        assert context is not None
+        self.started += 1
+        try:
+            await asyncio.sleep(self.seconds)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return "done"
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_at_deadline() -> None:
+    """Work still running at the deadline is cancelled."""
+    endpoint = _SlowEndpoint(1)
+    call = with_deadline(endpoint, 0.01, "query.hybrid")
+
+    with pytest.raises(DeadlineExceededError, match=r"query\.hybrid"):
+        await call(context=CONTEXT)
+
+    assert endpoint.cancelled == 1
+    assert (
+        await with_deadline(_SlowEndpoint(0), 1, "query.hybrid")(
+            context=CONTEXT,
+        )
+        == "done"
+    )
+
+
+@pytest.mark.asyncio
+async def test_caller_deadline_is_capped_by_default() -> None:
+    """A deadline in the context can shorten a call but not extend it."""
+    endpoint = _SlowEndpoint(0.05)
+    call = with_deadline(endpoint, 1, "data.insert_many")
+
+    assert await call(context={**CONTEXT, "deadline": time.time() + 1e6}) == "done"
+    with pytest.raises(DeadlineExceededError):
+        await call(context={**CONTEXT, "deadline": time.time() + 0.01})
+    with pytest.raises(DeadlineExceededError):
+        await call(context={**CONTEXT, "deadline": time.time() - 1})
+    assert endpoint.started == 2  # noqa: PLR2004
+
+    capped = with_deadline(endpoint, 0.01, "data.insert_many")
+    with pytest.raises(DeadlineExceededError):
+        await capped(context={**CONTEXT, "deadline": time.time() + 1e6})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("deadline", ["soon", True, float("nan"), float("inf")])
+async def test_invalid_caller_deadline_is_rejected(deadline: Any) -> None:
+    """A deadline that is not a finite timestamp fails with a clear error."""
+    endpoint = _SlowEndpoint(0)
+    call = with_deadline(endpoint, 1, "query.hybrid")
+
+    with pytest.raises(ValueError, match="Invalid 'deadline'"):
+        await call(context={**CONTEXT, "deadline": deadline})
+    assert endpoint.started == 0
+
+
+@pytest.mark.asyncio
+async def test_other_timeouts_pass_through() -> None:
+    """Timeouts raised by the endpoint itself are not deadline errors."""
+
+    async def _endpoint(context: dict[str, Any] | None = None) -> None:
+        assert context is not None
+        error_msg = "artifact manager timed out"
+        raise TimeoutError(error_msg)
+
+    with pytest.raises(TimeoutError) as exc_info:
+        await with_deadline(_endpoint, 1, "applications.get")(context=CONTEXT)
+    assert not isinstance(exc_info.value, DeadlineExceededError)
+
+
+@pytest.mark.asyncio
+async def test_stream_deadline_covers_whole_stream() -> None:
+    """A stream fails once its deadline passes, even between items."""
+    closed: list[bool] = []
+
+    async def _iterate(context: dict[str, Any] | None = None) -> Any:
+        assert context is not None
+        try:
+            for delay in (0.02, 0.02, 0.02):
+                await asyncio.sleep(delay)
+                yield delay
+        finally:
+            closed.append(True)
+
+    stream = with_deadline(_iterate, 0.1, "query.iterate")(context=CONTEXT)
+    assert await anext(stream) == 0.02  # noqa: PLR2004
+    assert await anext(stream) == 0.02  # noqa: PLR2004
+    # A stalled consumer uses up the deadline of the whole stream
+    await asyncio.sleep(0.1)
+    with pytest.raises(DeadlineExceededError):
+        await anext(stream)
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_leave_queue_at_deadline() -> None:
+    """Calls waiting for admission are shed once their deadline passes."""
+    admission = AdmissionController(max_running=1)
+    running = _SlowEndpoint(0.1)
+    queued = _SlowEndpoint(0)
+    endpoints = admit_endpoints(
+        {"query": {"hybrid": running, "fetch_objects": queued}},
+        admission,
+        {"query.fetch_objects": 0.01},
+    )
+
+    first = asyncio.create_task(endpoints["query"]["hybrid"](context=CONTEXT))
+    await asyncio.sleep(0)
+    with pytest.raises(DeadlineExceededError):
+        await endpoints["query"]["fetch_objects"](context=CONTEXT)
+
+    assert admission.stats()["interactive"]["queued"] == 0
+    assert await first == "done"
+    assert queued.started == 0
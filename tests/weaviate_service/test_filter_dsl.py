@@ -0,0 +1,121 @@
+"""Unit tests for the JSON filter DSL."""
+
+from typing import Any
+
+import pytest
+from weaviate.classes.query import Filter
+from weaviate.collections.classes.filters import (
+    _FilterAnd,  # type: ignore[reportPrivateUsage]
+    _FilterOr,  # type: ignore[reportPrivateUsage]
+)
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.filter_dsl import (
+    canonical_filter,
+    compile_filter,
+    resolve_filter,
+)
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+
+def test_compiles_nested_filters() -> None:
+    """Logical operators and conditions compile to Weaviate filters."""
+    compiled: Any = compile_filter(
+        {
+            "and": [
+                {"eq": ["entity_type", "node"]},
+                {"or": [{"gte": ["year", 2000]}, {"is_null": ["year", True]}]},
+            ],
+        },
+    )
+
+    assert isinstance(compiled, _FilterAnd)
+    assert compiled.filters[0] == Filter.by_property("entity_type").equal("node")
+    assert isinstance(compiled.filters[1], _FilterOr)
+    assert compiled.filters[1].filters == [
+        Filter.by_property("year").greater_or_equal(2000),
+        Filter.by_property("year").is_none(True),  # noqa: FBT003
+    ]
+
+
+def test_metadata_properties() -> None:
+    """Object IDs and times are filtered through their dedicated builders."""
+    uuid = "123e4567-e89b-12d3-a456-426614174000"
+
+    assert compile_filter({"eq": ["_id", uuid]}) == Filter.by_id().equal(uuid)
+    assert (
+        compile_filter(
+            {"gt": ["_creation_time", "2024-01-01T00:00:00+00:00"]},
+        )
+        is not None
+    )
+
+
+def test_equal_filters_share_compilation() -> None:
+    """Key order does not change the canonical form or the compiled filter."""
+    first = {"and": [{"eq": ["a", 1]}], "_": None}
+    second = {"_": None, "and": [{"eq": ["a", 1]}]}
+
+    assert canonical_filter(first) == canonical_filter(second)
+    assert compile_filter({"eq": ["a", 1]}) is compile_filter({"eq": ["a", 1]})
+
+
+@pytest.mark.parametrize(
+    ("dsl", "message"),
+    [
+        ({"eq": ["a", 1], "ne": ["b", 2]}, "exactly one operator"),
+        ({"between": ["a", [1, 2]]}, "unknown filter operator"),
+        ({"and": []}, "non-empty list"),
+        ({"eq": ["a"]}, r"\[property, value\] pair"),
+        ({"gt": ["_id", "x"]}, "not supported on '_id'"),
+        ({"or": [{"eq": [1, 2]}]}, r"filter\.or\[0\]: property"),
+    ],
+)
+def test_invalid_filters(dsl: dict[str, Any], message: str) -> None:
+    """Invalid filters are rejected with the path of the problem."""
+    with pytest.raises(ValueError, match=message):
+        compile_filter(dsl)
+
+
+def test_resolve_passes_filters_through() -> None:
+    """Weaviate filters and None are not compiled."""
+    weaviate_filter = Filter.by_property("a").equal(1)
+
+    assert resolve_filter(weaviate_filter) is weaviate_filter
+    assert resolve_filter(None) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_many_accepts_dsl(monkeypatch: Any) -> None:
+    """data_delete_many compiles the DSL and adds the application filter."""
+    received: dict[str, Any] = {}
+
+    class _FakeDeleteManyReturn:
+        failed = 0
+        matches = 0
+        objects = None
+        successful = 0
+
+    class _FakeData:
+        async def delete_many(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+            received.update(kwargs)
+            return _FakeDeleteManyReturn()
+
+    class _FakeTenantCollection:
+        data = _FakeData()
+
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection())
+
+    await w_methods.data_delete_many(
+        None,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        where={"eq": ["genre", "Drama"]},
+    )
+
+    where = received["where"]
+    assert isinstance(where, _FilterAnd)
+    assert where.filters == [
+        Filter.by_property("genre").equal("Drama"),
+        Filter.by_property("application_id").equal(APP_ID),
+    ]
@@ -0,0 +1,99 @@
+"""Unit tests for the generation cache."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from hypha_startup_services.weaviate_service.utils.generation_cache import (
+    GenerationCache,
+)
+
+MOVIE = "Shared__DELIM__Movie"
+OPTIONS = {"grouped_task": "Summarize", "grouped_properties": ["text"]}
+
+
+@dataclass
+class _FakeMetadata:
+    last_update_time: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class _FakeObject:
+    uuid: UUID = field(default_factory=uuid4)
+    metadata: _FakeMetadata = field(default_factory=_FakeMetadata)
+
+
+def test_key_ignores_order_and_tracks_updates() -> None:
+    """Keys do not depend on ranking but change when an object changes."""
+    cache = GenerationCache()
+    objects = [_FakeObject(), _FakeObject()]
+
+    key = cache.key(MOVIE, "app", "ws", OPTIONS, objects)  # type: ignore[arg-type]
+    reversed_key = cache.key(MOVIE, "app", "ws", OPTIONS, objects[::-1])  # type: ignore[arg-type]
+    assert key == reversed_key
+
+    objects[0].metadata.last_update_time += timedelta(seconds=1)
+    assert cache.key(MOVIE, "app", "ws", OPTIONS, objects) != key  # type: ignore[arg-type]
+
+
+def test_cache_is_bounded() -> None:
+    """The least recently used generation is evicted first."""
+    cache = GenerationCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_entries_expire() -> None:
+    """Generations older than the TTL are not served."""
+    cache = GenerationCache(ttl=0)
+    cache.put("a", "A")
+
+    assert cache.get("a") is None
+
+
+def test_invalidate_drops_application() -> None:
+    """Invalidating an application changes its keys only."""
+    cache = GenerationCache()
+    objects = [_FakeObject()]
+    key = cache.key(MOVIE, "app", "ws", OPTIONS, objects)  # type: ignore[arg-type]
+    other = cache.key(MOVIE, "other", "ws", OPTIONS, objects)  # type: ignore[arg-type]
+    cache.put(key, "A")
+
+    cache.invalidate(MOVIE, "app")
+
+    assert cache.key(MOVIE, "app", "ws", OPTIONS, objects) != key  # type: ignore[arg-type]
+    assert cache.key(MOVIE, "other", "ws", OPTIONS, objects) == other  # type: ignore[arg-type]
+
+
+def test_write_invalidates_after_it_finishes() -> None:
+    """A generation cached while a write runs is not served after it."""
+    cache = GenerationCache()
+    objects = [_FakeObject()]
+
+    with cache.invalidating(MOVIE, "app"):
+        key = cache.key(MOVIE, "app", "ws", OPTIONS, objects)  # type: ignore[arg-type]
+        cache.put(key, "stale")
+
+    assert cache.key(MOVIE, "app", "ws", OPTIONS, objects) != key  # type: ignore[arg-type]
+
+
+def test_versions_are_bounded() -> None:
+    """Too many versioned applications reset all versions and entries."""
+    cache = GenerationCache(max_entries=2)
+    objects = [_FakeObject()]
+    key = cache.key(MOVIE, "app", "ws", OPTIONS, objects)  # type: ignore[arg-type]
+    cache.put(key, "A")
+
+    for application_id in ("first", "second", "third"):
+        cache.invalidate(MOVIE, application_id)
+
+    assert len(cache._versions) <= 2  # noqa: PLR2004, SLF001
+    assert cache.get(key) is None
+    assert cache.key(MOVIE, "app", "ws", OPTIONS, objects) != key  # type: ignore[arg-type]
@@ -0,0 +1,365 @@
+"""Unit tests for generation modes, token budgets, concurrency and streaming."""
+
+import asyncio
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils import query_utils
+from hypha_startup_services.weaviate_service.utils.config_cache import config_cache
+from hypha_startup_services.weaviate_service.utils.generation_cache import (
+    generation_cache,
+)
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+
+@dataclass
+class _FakeGenerative:
+    text: str
+
+
+@dataclass
+class _FakeMetadata:
+    last_update_time: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class _FakeObject:
+    properties: dict[str, Any]
+    uuid: UUID = field(default_factory=uuid4)
+    collection: str = "Shared__DELIM__Movie"
+    generative: _FakeGenerative | None = None
+    metadata: _FakeMetadata = field(default_factory=_FakeMetadata)
+
+
+@dataclass
+class _FakeResponse:
+    objects: list[_FakeObject]
+    generative: _FakeGenerative | None = None
+
+
+def _objects() -> list[_FakeObject]:
+    return [
+        _FakeObject({"text": "one two three four", "name": "A"}),
+        _FakeObject({"text": "five six seven eight", "name": "B"}),
+        _FakeObject({"text": "nine ten eleven twelve", "name": "C"}),
+    ]
+
+
+class _FakeQuery:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.objects = objects
+        self.calls: list[dict[str, Any]] = []
+
+    async def near_text(self, **kwargs: Any) -> _FakeResponse:  # NOSONAR S7503
+        self.calls.append(kwargs)
+        return _FakeResponse(self.objects)
+
+
+class _FakeGenerate:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.objects = objects
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = 0
+
+    async def _generate(
+        self,
+        method: str,
+        kwargs: dict[str, Any],
+        objects: list[_FakeObject],
+    ) -> _FakeResponse:
+        self.calls.append((method, kwargs))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # A grouped task writes about the context of all results
+            grouped = "grouped_task" in kwargs
+            await asyncio.sleep(0.01 * (len(self.objects) if grouped else len(objects)))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+        return _FakeResponse(
+            [
+                replace(obj, generative=_FakeGenerative(obj.properties["name"]))
+                for obj in objects
+            ],
+            _FakeGenerative("summary"),
+        )
+
+    async def near_text(self, **kwargs: Any) -> _FakeResponse:
+        return await self._generate("near_text", kwargs, self.objects)
+
+    async def fetch_objects(self, **kwargs: Any) -> _FakeResponse:
+        ids = set(kwargs["filters"].value)
+        objects = [obj for obj in self.objects if str(obj.uuid) in ids]
+        return await self._generate("fetch_objects", kwargs, objects)
+
+
+@dataclass
+class _FakeConfig:
+    generative_config: str = "openai: gpt-4o"
+
+
+class _FakeConfigHandle:
+    def __init__(self) -> None:
+        self.current = _FakeConfig()
+
+    async def get(self) -> _FakeConfig:  # NOSONAR S7503
+        return self.current
+
+
+class _FakeCollections:
+    def __init__(self) -> None:
+        self.handle = _FakeConfigHandle()
+        self.config = self.handle
+
+    def get(self, _name: str) -> "_FakeCollections":
+        return self
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.collections = _FakeCollections()
+
+
+fake_client = _FakeClient()
+
+
+class _FakeTenantCollection:
+    name = "Shared__DELIM__Movie"
+    tenant = "ws-user-1"
+
+    def __init__(self) -> None:
+        objects = _objects()
+        self.query = _FakeQuery(objects)
+        self.generate = _FakeGenerate(objects)
+
+
+@pytest.fixture
+def fake_tenant(monkeypatch: pytest.MonkeyPatch) -> _FakeTenantCollection:
+    """Patch tenant preparation to return a fake collection."""
+    tenant = _FakeTenantCollection()
+    generation_cache.clear()
+    config_cache.invalidate()
+    fake_client.collections.handle.current = _FakeConfig()
+
+    patch_tenant_collection(monkeypatch, tenant)
+    monkeypatch.setattr(
+        query_utils,
+        "count_tokens",
+        lambda text, *_args: len(text.split()),
+    )
+    monkeypatch.setattr(
+        query_utils,
+        "truncate_tokens",
+        lambda text, max_tokens, *_args: " ".join(text.split()[:max_tokens]),
+    )
+    return tenant
+
+
+async def _generate(**kwargs: Any) -> Any:
+    return await w_methods.generate_near_text(
+        fake_client,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        query="microscopy",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_grouped_mode_drops_single_prompt(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """Grouped mode runs only the grouped task."""
+    result = await _generate(
+        generation_mode="grouped",
+        single_prompt="Describe {name}",
+        grouped_task="Summarize",
+    )
+
+    ((method, kwargs),) = fake_tenant.generate.calls
+    assert method == "fetch_objects"
+    assert "single_prompt" not in kwargs
+    assert "single_prompt" not in fake_tenant.query.calls[0]
+    assert kwargs["grouped_task"] == "Summarize"
+    assert result["generated"] == "summary"
+
+
+@pytest.mark.asyncio
+async def test_none_mode_skips_generation(fake_tenant: _FakeTenantCollection) -> None:
+    """Mode "none" and calls without prompts search without generating."""
+    result = await _generate(generation_mode="none", grouped_task="Summarize")
+    await _generate()
+
+    assert not fake_tenant.generate.calls
+    assert len(fake_tenant.query.calls) == 2  # noqa: PLR2004
+    assert "grouped_task" not in fake_tenant.query.calls[0]
+    assert result["generated"] is None
+    assert len(result["objects"]) == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_invalid_modes_are_rejected() -> None:
+    """Unknown modes, missing prompts and misplaced budgets are rejected."""
+    with pytest.raises(ValueError, match="Unknown generation mode"):
+        await _generate(generation_mode="all")
+    with pytest.raises(ValueError, match="needs a single_prompt"):
+        await _generate(generation_mode="single", grouped_task="Summarize")
+    with pytest.raises(ValueError, match="needs generation_mode 'grouped'"):
+        await _generate(single_prompt="Describe {name}", grouped_token_budget=10)
+
+
+@pytest.mark.asyncio
+async def test_token_budget_limits_grouped_context(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """Only the best results that fit in the budget feed the grouped task."""
+    result = await _generate(
+        grouped_task="Summarize",
+        grouped_properties=["text"],
+        return_properties=["name"],
+        grouped_token_budget=10,
+    )
+
+    assert fake_tenant.query.calls[0]["return_properties"] == ["name", "text"]
+    ((method, kwargs),) = fake_tenant.generate.calls
+    assert method == "fetch_objects"
+    assert kwargs["grouped_task"] == "Summarize"
+    assert kwargs["grouped_properties"] == kwargs["return_properties"] == ["text"]
+    assert kwargs["filters"].value == [
+        str(obj.uuid) for obj in fake_tenant.query.objects[:2]
+    ]
+    assert len(result["objects"]) == 3  # noqa: PLR2004
+    assert result["generated"] == "summary"
+
+
+@pytest.mark.asyncio
+async def test_budget_sends_oversized_first_object_alone(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """A best result larger than the budget is the only object sent."""
+    await _generate(
+        grouped_task="Summarize",
+        grouped_properties=["text"],
+        grouped_token_budget=3,
+    )
+
+    ((_, kwargs),) = fake_tenant.generate.calls
+    assert kwargs["filters"].value == [str(fake_tenant.query.objects[0].uuid)]
+
+
+@pytest.mark.usefixtures("fake_tenant")
+def test_budget_keeps_first_object() -> None:
+    """The best result is kept even if it exceeds the budget."""
+    objects = _objects()
+
+    selected = query_utils.select_within_token_budget(
+        objects,  # type: ignore[arg-type]
+        ["name"],
+        1,
+    )
+
+    assert selected == objects[:1]
+
+
+@pytest.mark.asyncio
+async def test_generation_concurrency_is_bounded(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """Generative requests wait for the limiter."""
+    limiter = asyncio.Semaphore(2)
+
+    await asyncio.gather(
+        *(
+            _generate(single_prompt="Describe {name}", generation_limiter=limiter)
+            for _ in range(5)
+        ),
+    )
+
+    assert len(fake_tenant.generate.calls) == 5  # noqa: PLR2004
+    assert fake_tenant.generate.max_running == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_objects_then_generations(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """Objects come first, then every generation as it completes."""
+    events = [
+        event
+        async for event in w_methods.generate_near_text_stream(
+            fake_client,  # type: ignore[arg-type]
+            "Movie",
+            APP_ID,
+            query="microscopy",
+            single_prompt="Describe {name}",
+            grouped_task="Summarize",
+        )
+    ]
+
+    assert events[0]["type"] == "objects"
+    assert len(events[0]["objects"]) == 3  # noqa: PLR2004
+    singles = {event["uuid"]: event["text"] for event in events[1:-1]}
+    assert singles == {
+        obj.uuid: obj.properties["name"] for obj in fake_tenant.query.objects
+    }
+    # The grouped task covers three objects and finishes last
+    assert events[-1] == {"type": "grouped", "text": "summary"}
+    assert all("single_prompt" not in call for call in fake_tenant.query.calls)
+
+
+@pytest.mark.asyncio
+async def test_stream_cancels_pending_generations(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """Closing the stream early cancels generations still running."""
+    stream = w_methods.generate_near_text_stream(
+        fake_client,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        query="microscopy",
+        single_prompt="Describe {name}",
+        grouped_task="Summarize",
+    )
+
+    assert (await anext(stream))["type"] == "objects"
+    assert (await anext(stream))["type"] == "single"
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert fake_tenant.generate.cancelled >= 1
+    assert fake_tenant.generate.running == 0
+
+
+@pytest.mark.asyncio
+async def test_grouped_generation_is_cached(
+    fake_tenant: _FakeTenantCollection,
+) -> None:
+    """The same objects reuse a grouped generation until data or module change."""
+    first = await _generate(grouped_task="Summarize")
+    second = await _generate(grouped_task="Summarize")
+    assert first["generated"] == second["generated"] == "summary"
+    assert len(fake_tenant.generate.calls) == 1
+    assert fake_tenant.query.calls[0]["return_metadata"].last_update_time
+
+    await _generate(grouped_task="Summarize", cache_generation=False)
+    await _generate(grouped_task="Summarize differently")
+    assert len(fake_tenant.generate.calls) == 3  # noqa: PLR2004
+
+    generation_cache.invalidate(fake_tenant.name, APP_ID)
+    await _generate(grouped_task="Summarize")
+    assert len(fake_tenant.generate.calls) == 4  # noqa: PLR2004
+
+    fake_client.collections.handle.current = _FakeConfig("cohere: command-r")
+    config_cache.invalidate()
+    await _generate(grouped_task="Summarize")
+    assert len(fake_tenant.generate.calls) == 5  # noqa: PLR2004
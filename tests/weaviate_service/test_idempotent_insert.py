@@ -0,0 +1,271 @@
+"""Unit tests for idempotent inserts with deterministic UUIDs."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.collection_utils import (
+    deterministic_uuid,
+    to_data_object,
+)
+from hypha_startup_services.weaviate_service.utils.jobs import JobManager
+from tests.weaviate_service.utils import (
+    APP_ID,
+    FakeBatchReturn,
+    patch_tenant_collection,
+)
+
+
+@dataclass
+class _FakeFetched:
+    uuid: UUID
+    vector: dict[str, Any] = field(default_factory=dict)
+
+
+class _FakeTenantCollection:
+    """Tenant collection storing inserted objects by UUID."""
+
+    name = "Movie"
+    tenant = APP_ID
+
+    def __init__(self) -> None:
+        self.stored: dict[str, Any] = {}
+        self.inserted: list[list[Any]] = []
+        self.data = self
+        self.query = self
+
+    async def insert_many(self, objects: list[Any]) -> Any:  # NOSONAR S7503
+        self.inserted.append(objects)
+        self.stored.update(
+            (str(obj.uuid), obj.vector if obj.vector is not None else [0.5])
+            for obj in objects
+        )
+        return FakeBatchReturn(
+            uuids={index: obj.uuid for index, obj in enumerate(objects)},
+        )
+
+    async def fetch_objects(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        stored = self.stored
+        include_vector = kwargs.get("include_vector", False)
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.objects = [
+                    _FakeFetched(
+                        uuid=UUID(uuid),
+                        vector={"default": vector} if include_vector else {},
+                    )
+                    for uuid, vector in stored.items()
+                ]
+
+        return _Resp()
+
+
+def test_deterministic_uuid_is_stable() -> None:
+    """The same content or key always maps to the same UUID per application."""
+    properties = {"title": "Inception", "year": 2010}
+
+    assert deterministic_uuid(APP_ID, properties) == deterministic_uuid(
+        APP_ID,
+        {"year": 2010, "title": "Inception"},
+    )
+    assert deterministic_uuid(APP_ID, properties) != deterministic_uuid(
+        "OtherApp",
+        properties,
+    )
+    assert deterministic_uuid(
+        APP_ID,
+        {"doc": "a", "text": "old"},
+        id_property="doc",
+    ) == deterministic_uuid(APP_ID, {"doc": "a", "text": "new"}, id_property="doc")
+
+
+def test_deterministic_uuid_separates_chunks() -> None:
+    """Chunks of one keyed object get distinct UUIDs."""
+    first = deterministic_uuid(APP_ID, {"doc": "a", "chunk_index": 0}, "doc")
+    second = deterministic_uuid(APP_ID, {"doc": "a", "chunk_index": 1}, "doc")
+
+    assert first != second
+
+
+def test_deterministic_uuid_requires_key() -> None:
+    """A missing key property is rejected instead of colliding."""
+    with pytest.raises(ValueError, match="id_property"):
+        deterministic_uuid(APP_ID, {"title": "x"}, id_property="doc")
+
+
+def test_to_data_object_keeps_explicit_uuid() -> None:
+    """An explicit UUID wins over the derived one."""
+    explicit = UUID(int=7)
+
+    data_object = to_data_object({"uuid": explicit, "title": "x"}, APP_ID)
+
+    assert data_object.uuid == explicit
+
+
+@pytest.mark.asyncio
+async def test_idempotent_insert_many_skips_existing(monkeypatch: Any) -> None:
+    """Re-running an idempotent insert does not insert anything again."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    objects = [{"title": "a"}, {"title": "b"}]
+
+    async def _insert(items: list[dict[str, Any]]) -> Any:
+        return await w_methods.data_insert_many(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            objects=items,
+            idempotent=True,
+        )
+
+    first = await _insert(objects)
+    second = await _insert([*objects, {"title": "c"}])
+
+    assert first["skipped"] == []
+    assert second["skipped"] == ["0", "1"]
+    assert [len(batch) for batch in fake_tenant.inserted] == [2, 1]
+    assert fake_tenant.inserted[1][0].properties["title"] == "c"
+    assert second["uuids"]["0"] == first["uuids"]["0"]
+    assert sorted(second["uuids"]) == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_idempotent_job_skips_existing(monkeypatch: Any) -> None:
+    """Ingest jobs skip objects that already exist, keeping their UUIDs."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    job_manager = JobManager()
+    context = {"user": {"scope": {"current_workspace": "ws-user-owner"}}}
+
+    async def _run_job() -> Any:
+        job = await w_methods.data_submit_insert_job(
+            client=None,  # type: ignore[arg-type]
+            job_manager=job_manager,
+            collection_name="Movie",
+            application_id=APP_ID,
+            objects=[{"title": "a"}, {"title": "b"}],
+            context=context,
+            idempotent=True,
+        )
+        current = asyncio.current_task()
+        await asyncio.gather(
+            *(task for task in asyncio.all_tasks() if task is not current),
+        )
+        return await w_methods.jobs_result(job_manager, job["job_id"], context)
+
+    first = await _run_job()
+    second = await _run_job()
+
+    assert first["job"]["skipped_objects"] == 0
+    assert second["job"]["skipped_objects"] == len(second["uuids"])
+    assert second["uuids"] == first["uuids"]
+    assert len(fake_tenant.inserted) == 1
+
+
+@pytest.mark.asyncio
+async def test_idempotent_update_keeps_stored_vectors(monkeypatch: Any) -> None:
+    """Updating existing objects reuses their vectors instead of re-embedding."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    async def _insert(items: list[dict[str, Any]]) -> Any:
+        return await w_methods.data_insert_many(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            objects=items,
+            idempotent=True,
+            id_property="doc",
+            on_existing="update",
+        )
+
+    await _insert([{"doc": "a", "text": "old"}])
+    await _insert(
+        [
+            {"doc": "a", "text": "new"},
+            {"doc": "b", "text": "new"},
+            {"doc": "c", "vector": [0.25]},
+        ],
+    )
+
+    updated = {obj.properties["doc"]: obj for obj in fake_tenant.inserted[1]}
+    assert updated["a"].vector == [0.5]
+    assert updated["a"].properties["text"] == "new"
+    assert updated["b"].vector is None
+    assert list(updated["c"].vector) == [0.25]
+
+
+@pytest.mark.asyncio
+async def test_idempotent_insert_reports_missing_keys(monkeypatch: Any) -> None:
+    """Objects without a key are reported per object, the others inserted."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.data_insert_many(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        objects=[{"doc": "a"}, {"doc": ""}, {"doc": "c"}],
+        idempotent=True,
+        id_property="doc",
+    )
+
+    assert result["has_errors"]
+    assert sorted(result["errors"]) == ["1"]
+    assert "id_property" in result["errors"]["1"].message
+    assert result["errors"]["1"].object_.index == 1
+    assert sorted(result["uuids"]) == ["0", "2"]
+    assert [obj.properties["doc"] for obj in fake_tenant.inserted[0]] == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_existing_policy_is_rejected(monkeypatch: Any) -> None:
+    """A misspelled on_existing policy fails instead of acting as "update"."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    with pytest.raises(ValueError, match="on_existing"):
+        await w_methods.data_insert_many(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            objects=[{"title": "a"}],
+            idempotent=True,
+            on_existing="skipp",  # type: ignore[arg-type]
+        )
+    assert not fake_tenant.inserted
+
+
+@pytest.mark.asyncio
+async def test_idempotent_job_reports_missing_keys(monkeypatch: Any) -> None:
+    """Ingest jobs count objects without a key as failed."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    job_manager = JobManager()
+    context = {"user": {"scope": {"current_workspace": "ws-user-owner"}}}
+
+    job = await w_methods.data_submit_insert_job(
+        client=None,  # type: ignore[arg-type]
+        job_manager=job_manager,
+        collection_name="Movie",
+        application_id=APP_ID,
+        objects=[{"doc": "a"}, {"title": "no key"}],
+        context=context,
+        idempotent=True,
+        id_property="doc",
+    )
+    current = asyncio.current_task()
+    await asyncio.gather(
+        *(task for task in asyncio.all_tasks() if task is not current),
+    )
+    result = await w_methods.jobs_result(job_manager, job["job_id"], context)
+
+    assert result["job"]["failed_objects"] == 1
+    assert result["job"]["total_objects"] == 2  # noqa: PLR2004
+    assert result["job"]["errors"][0].startswith("Object 1:")
+    assert list(result["uuids"]) == ["0"]
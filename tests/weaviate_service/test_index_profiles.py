@@ -0,0 +1,77 @@
+"""Unit tests for vector index performance profiles."""
+
+from typing import Any
+
+import pytest
+
+from hypha_startup_services.weaviate_service.utils.index_profiles import (
+    PERFORMANCE_PROFILES,
+    apply_performance_profile,
+    estimate_memory,
+)
+
+
+def test_profile_expands_into_index_config() -> None:
+    """A profile fills the vector index settings, keeping explicit values."""
+    settings: Any = {
+        "class": "Movie",
+        "vectorIndexConfig": {"distance": "cosine", "maxConnections": 24},
+    }
+
+    profiled = apply_performance_profile(settings, "low-memory")
+
+    assert profiled["vectorIndexType"] == "hnsw"
+    assert profiled["vectorIndexConfig"]["bq"] == {"enabled": True}
+    assert profiled["vectorIndexConfig"]["distance"] == "cosine"
+    assert profiled["vectorIndexConfig"]["maxConnections"] == 24  # noqa: PLR2004
+    assert "vectorIndexType" not in settings
+
+
+def test_profile_applies_to_named_vectors() -> None:
+    """Every named vector gets the profile, and explicit compression wins."""
+    settings: Any = {
+        "class": "Movie",
+        "vectorConfig": {
+            "title": {"vectorIndexType": "hnsw"},
+            "body": {"vectorIndexConfig": {"pq": {"enabled": True}}},
+        },
+    }
+
+    profiled = apply_performance_profile(settings, "balanced")
+    named = profiled["vectorConfig"]
+
+    assert named["title"]["vectorIndexConfig"]["sq"]["enabled"] is True
+    assert "sq" not in named["body"]["vectorIndexConfig"]
+    assert named["body"]["vectorIndexConfig"]["pq"] == {"enabled": True}
+
+
+def test_profile_rejects_other_index_types() -> None:
+    """Profiles only apply to HNSW indexes."""
+    with pytest.raises(ValueError, match="HNSW"):
+        apply_performance_profile(
+            {"class": "Movie", "vectorIndexType": "flat"},
+            "balanced",
+        )
+
+    with pytest.raises(ValueError, match="Unknown performance profile"):
+        apply_performance_profile({"class": "Movie"}, "fast")  # type: ignore[arg-type]
+
+
+def test_estimate_memory_orders_profiles() -> None:
+    """Compressed profiles need less memory than uncompressed ones."""
+    estimates = {
+        profile: estimate_memory(1_000_000, 768, profile)
+        for profile in PERFORMANCE_PROFILES
+    }
+
+    assert estimates["max-recall"]["vector_bytes"] == 1_000_000 * 768 * 4
+    assert estimates["balanced"]["vector_bytes"] == 1_000_000 * 768
+    assert estimates["low-memory"]["vector_bytes"] == 1_000_000 * 96
+    # Layer 0 holds 2 * 16 links per node, the higher layers 16 / 15 more
+    assert estimates["low-memory"]["graph_bytes"] == 330_666_667  # noqa: PLR2004
+    assert (
+        estimates["low-memory"]["total_bytes"]
+        < estimates["balanced"]["total_bytes"]
+        < estimates["max-recall"]["total_bytes"]
+    )
+    assert estimates["low-memory"]["compression"] == "bq"
@@ -0,0 +1,142 @@
+"""Unit tests for background ingest jobs."""
+
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.jobs import JobManager
+from tests.weaviate_service.utils import (
+    APP_ID,
+    FakeBatchError,
+    FakeBatchReturn,
+    patch_tenant_collection,
+)
+
+OWNER_WS = "ws-user-owner"
+CONTEXT = {"user": {"scope": {"current_workspace": OWNER_WS}}}
+OTHER_CONTEXT = {"user": {"scope": {"current_workspace": "ws-user-other"}}}
+
+
+class _FakeData:
+    def __init__(self, release: asyncio.Event | None = None) -> None:
+        self.release = release
+        self.batches: list[list[Any]] = []
+
+    async def insert_many(self, objects: list[Any]) -> FakeBatchReturn:
+        if self.release is not None:
+            await self.release.wait()
+        self.batches.append(objects)
+        response = FakeBatchReturn()
+        for index, obj in enumerate(objects):
+            if obj.properties.get("title") == "bad":
+                response.errors[index] = FakeBatchError("invalid title")
+            else:
+                response.uuids[index] = uuid4()
+        return response
+
+
+class _FakeTenantCollection:
+    def __init__(self, release: asyncio.Event | None = None) -> None:
+        self.data = _FakeData(release)
+
+
+async def _submit(
+    job_manager: JobManager,
+    titles: list[str],
+    batch_size: int = 2,
+) -> Any:
+    return await w_methods.data_submit_insert_job(
+        client=None,  # type: ignore[arg-type]
+        job_manager=job_manager,
+        collection_name="Movie",
+        application_id=APP_ID,
+        objects=[{"title": title} for title in titles],
+        context=CONTEXT,
+        batch_size=batch_size,
+    )
+
+
+async def _wait_for_jobs() -> None:
+    current = asyncio.current_task()
+    await asyncio.gather(
+        *(task for task in asyncio.all_tasks() if task is not current),
+        return_exceptions=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_inserts_in_batches(monkeypatch: Any) -> None:
+    """A job returns immediately and reports UUIDs and errors once finished."""
+    release = asyncio.Event()
+    fake_tenant = _FakeTenantCollection(release)
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    job_manager = JobManager()
+
+    titles = ["a", "b", "bad", "c", "d"]
+    job = await _submit(job_manager, titles)
+
+    assert job["status"] == "pending"
+    assert job["total_objects"] == len(titles)
+    with pytest.raises(ValueError, match="not finished"):
+        await w_methods.jobs_result(job_manager, job["job_id"], CONTEXT)
+
+    release.set()
+    await _wait_for_jobs()
+    result = await w_methods.jobs_result(job_manager, job["job_id"], CONTEXT)
+
+    assert [len(batch) for batch in fake_tenant.data.batches] == [2, 2, 1]
+    assert result["job"]["status"] == "completed"
+    assert result["job"]["processed_objects"] == len(titles)
+    assert result["job"]["failed_objects"] == 1
+    assert result["job"]["errors"] == ["Object 2: invalid title"]
+    assert result["has_errors"] is True
+    assert sorted(result["uuids"]) == ["0", "1", "3", "4"]
+    assert all(
+        obj.properties["application_id"] == APP_ID
+        for batch in fake_tenant.data.batches
+        for obj in batch
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_cancel(monkeypatch: Any) -> None:
+    """Cancelling a running job marks it as cancelled."""
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection(asyncio.Event()))
+    job_manager = JobManager()
+
+    job = await _submit(job_manager, ["a", "b"])
+    await asyncio.sleep(0)
+    await w_methods.jobs_cancel(job_manager, job["job_id"], CONTEXT)
+    await _wait_for_jobs()
+
+    status = await w_methods.jobs_status(job_manager, job["job_id"], CONTEXT)
+    assert status["status"] == "cancelled"
+    assert status["finished_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_job_is_private_to_owner(monkeypatch: Any) -> None:
+    """Other workspaces cannot see a job."""
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection())
+    job_manager = JobManager()
+
+    job = await _submit(job_manager, ["a"])
+
+    with pytest.raises(ValueError, match="does not exist"):
+        await w_methods.jobs_status(job_manager, job["job_id"], OTHER_CONTEXT)
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_expire(monkeypatch: Any) -> None:
+    """Finished jobs are discarded after the retention period."""
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection())
+    job_manager = JobManager(retention_seconds=0)
+
+    job = await _submit(job_manager, ["a"])
+    await _wait_for_jobs()
+
+    with pytest.raises(ValueError, match="does not exist"):
+        await w_methods.jobs_status(job_manager, job["job_id"], CONTEXT)
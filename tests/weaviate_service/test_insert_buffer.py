@@ -0,0 +1,149 @@
+"""Unit tests for buffered (write-coalescing) single inserts."""
+
+import asyncio
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils import insert_buffer
+from tests.weaviate_service.utils import (
+    APP_ID,
+    FakeBatchError,
+    FakeBatchReturn,
+    patch_tenant_collection,
+)
+
+CONTEXT = {"user": {"scope": {"current_workspace": "ws-user-test"}}}
+
+
+class _FakeData:
+    def __init__(self) -> None:
+        self.batches: list[list[Any]] = []
+
+    async def insert_many(self, objects: list[Any]) -> FakeBatchReturn:
+        await asyncio.sleep(0)
+        self.batches.append(objects)
+        response = FakeBatchReturn()
+        for index, obj in enumerate(objects):
+            if obj.properties.get("title") == "bad":
+                response.errors[index] = FakeBatchError("invalid title")
+            else:
+                response.uuids[index] = obj.uuid or uuid4()
+        return response
+
+
+class _FakeTenantCollection:
+    def __init__(self) -> None:
+        self.data = _FakeData()
+
+
+def _missing_application(application_id: str) -> _FakeTenantCollection:
+    error_msg = f"Application {application_id} does not exist"
+    raise ValueError(error_msg)
+
+
+async def _insert(title: str, **kwargs: Any) -> UUID:
+    return await w_methods.data_insert(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        properties={"title": title},
+        context=CONTEXT,  # type: ignore[arg-type]
+        buffered=True,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_buffered_inserts_are_coalesced(monkeypatch: Any) -> None:
+    """Concurrent buffered inserts share one preparation and one batch."""
+    fake_tenant = _FakeTenantCollection()
+    prepared = patch_tenant_collection(monkeypatch, fake_tenant)
+    given_uuid = uuid4()
+
+    results = await asyncio.gather(
+        _insert("a", uuid=given_uuid),
+        *(_insert(f"movie {i}") for i in range(9)),
+    )
+
+    assert prepared == [("Movie", APP_ID)]
+    assert len(fake_tenant.data.batches) == 1
+    assert len(fake_tenant.data.batches[0]) == len(results)
+    assert results[0] == given_uuid
+    assert len(set(results)) == len(results)
+    assert all(
+        obj.properties["application_id"] == APP_ID
+        for obj in fake_tenant.data.batches[0]
+    )
+    assert not insert_buffer._coalescers  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_when_full(monkeypatch: Any) -> None:
+    """Reaching the batch size flushes without waiting for the delay."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+    monkeypatch.setattr(insert_buffer, "INSERT_BUFFER_MAX_DELAY", 60)
+    monkeypatch.setattr(insert_buffer, "INSERT_BUFFER_MAX_BATCH_SIZE", 3)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(_insert(f"movie {i}") for i in range(6))),
+        timeout=5,
+    )
+
+    assert [len(batch) for batch in fake_tenant.data.batches] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_buffered_errors_map_to_callers(monkeypatch: Any) -> None:
+    """An object rejected by Weaviate only fails its own caller."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    results = await asyncio.gather(
+        _insert("good"),
+        _insert("bad"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], UUID)
+    assert isinstance(results[1], RuntimeError)
+    assert "invalid title" in str(results[1])
+
+
+@pytest.mark.asyncio
+async def test_buffered_prepare_failure_fails_batch(monkeypatch: Any) -> None:
+    """A failing preparation is raised to every caller of the batch."""
+    patch_tenant_collection(monkeypatch, _missing_application)
+
+    results = await asyncio.gather(
+        _insert("a"),
+        _insert("b"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_buffered_insert_rejects_chunking() -> None:
+    """Chunked inserts cannot be buffered."""
+    with pytest.raises(ValueError, match="chunking"):
+        await _insert("a", enable_chunking=True)
+
+
+@pytest.mark.asyncio
+async def test_abandoned_buffered_inserts_are_skipped(monkeypatch: Any) -> None:
+    """Inserts whose callers stopped waiting are not written."""
+    fake_tenant = _FakeTenantCollection()
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    kept = asyncio.create_task(_insert("kept"))
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(_insert("abandoned"), timeout=0.001)
+    await kept
+
+    ((written,),) = fake_tenant.data.batches
+    assert written.properties["title"] == "kept"
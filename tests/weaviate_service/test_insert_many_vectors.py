@@ -8,6 +8,7 @@ kept out of properties.
 from collections.abc import Callable, Coroutine
 from typing import Any
 
+import numpy as np
 import pytest
 from weaviate.collections.classes.data import DataObject
 
@@ -139,3 +140,43 @@ async def test_insert_many_accepts_legacy_id_key(monkeypatch: Any) -> None:
     assert "id" not in props
     assert "uuid" not in props
     assert props["application_id"] == APP_ID
+
+
+@pytest.mark.asyncio
+async def test_insert_many_accepts_batch_vectors(monkeypatch: Any) -> None:
+    """Ensure packed batch vectors are split into float32 rows per object."""
+    fake_tenant = _FakeTenantCollection()
+    _fake_prepare_tenant_collection = get_fake_prepare_tenant_collection(fake_tenant)
+
+    monkeypatch.setattr(
+        w_methods,
+        "prepare_tenant_collection",
+        _fake_prepare_tenant_collection,
+    )
+
+    vectors = np.arange(6, dtype=np.float32).reshape(2, 3)
+    packed = {"dtype": "<f4", "shape": [2, 3], "data": vectors.tobytes()}
+
+    await w_methods.data_insert_many(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        objects=[{"title": "First"}, {"title": "Second"}],
+        context=None,
+        vectors=packed,  # type: ignore[arg-type]
+    )
+
+    received = fake_tenant.data.received_objects
+    assert [dobj.properties["title"] for dobj in received] == ["First", "Second"]
+    np.testing.assert_array_equal(received[1].vector, [3.0, 4.0, 5.0])
+    assert received[1].vector.dtype == np.float32
+
+    with pytest.raises(ValueError, match="one vector per object"):
+        await w_methods.data_insert_many(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            objects=[{"title": "Only"}],
+            context=None,
+            vectors=vectors,
+        )
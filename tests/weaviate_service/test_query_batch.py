@@ -0,0 +1,167 @@
+"""Unit tests for the batch query endpoint."""
+
+from typing import Any
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from tests.weaviate_service.utils import APP_ID, USER1_APP_ID, patch_tenant_collection
+
+FAILING_APP_ID = "NoAccessApp"
+
+
+class _FakeQuery:
+    async def _respond(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        if kwargs.get("limit") == 0:
+            error_msg = "limit must be positive"
+            raise ValueError(error_msg)
+
+        class _Resp:
+            def __init__(self, objects: list[Any]) -> None:
+                self.objects = objects
+
+        return _Resp([])
+
+    async def hybrid(self, **kwargs: Any) -> Any:
+        return await self._respond(**kwargs)
+
+    async def near_vector(self, **kwargs: Any) -> Any:
+        return await self._respond(**kwargs)
+
+    async def fetch_objects(self, **kwargs: Any) -> Any:
+        return await self._respond(**kwargs)
+
+
+class _FakeTenantCollection:
+    def __init__(self) -> None:
+        self.query = _FakeQuery()
+
+
+def _tenant_for(application_id: str) -> _FakeTenantCollection:
+    if application_id == FAILING_APP_ID:
+        error_msg = f"No access to {application_id}"
+        raise PermissionError(error_msg)
+    return _FakeTenantCollection()
+
+
+@pytest.mark.asyncio
+async def test_query_batch_prepares_each_application_once(monkeypatch: Any) -> None:
+    """Tenant preparation runs once per distinct application."""
+    prepared = patch_tenant_collection(monkeypatch, _tenant_for)
+
+    results = await w_methods.query_batch(
+        client=None,  # type: ignore[arg-type]
+        queries=[
+            {
+                "type": "hybrid",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+                "query": "dreams",
+            },
+            {
+                "type": "near_vector",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+                "near_vector": [0.1],
+            },
+            {
+                "type": "fetch_objects",
+                "collection_name": "Movie",
+                "application_id": USER1_APP_ID,
+            },
+        ],
+        context={},
+    )
+
+    assert sorted(prepared) == [("Movie", APP_ID), ("Movie", USER1_APP_ID)]
+    assert all("objects" in result for result in results)
+
+
+@pytest.mark.asyncio
+async def test_query_batch_isolates_errors(monkeypatch: Any) -> None:
+    """Failing queries and targets do not affect the other queries."""
+    patch_tenant_collection(monkeypatch, _tenant_for)
+
+    results = await w_methods.query_batch(
+        client=None,  # type: ignore[arg-type]
+        queries=[
+            {
+                "type": "hybrid",
+                "collection_name": "Movie",
+                "application_id": FAILING_APP_ID,
+                "query": "dreams",
+            },
+            {
+                "type": "hybrid",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+                "query": "dreams",
+                "limit": 0,
+            },
+            {
+                "type": "hybrid",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+                "query": "dreams",
+            },
+        ],
+        context={},
+    )
+
+    assert results[0] == {"error": f"No access to {FAILING_APP_ID}"}
+    assert results[1] == {"error": "limit must be positive"}
+    assert results[2] == {"objects": []}
+
+
+@pytest.mark.asyncio
+async def test_query_batch_reports_malformed_specs(monkeypatch: Any) -> None:
+    """A spec missing its target fails on its own, not the whole batch."""
+    prepared = patch_tenant_collection(monkeypatch, _tenant_for)
+
+    results = await w_methods.query_batch(
+        client=None,  # type: ignore[arg-type]
+        queries=[
+            {"type": "hybrid", "collection_name": "Movie", "query": "dreams"},
+            {
+                "type": "hybrid",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+                "query": "dreams",
+            },
+        ],
+        context={},
+    )
+
+    assert results[0] == {"error": "Query spec needs a non-empty application_id"}
+    assert results[1] == {"objects": []}
+    assert prepared == [("Movie", APP_ID)]
+
+
+@pytest.mark.asyncio
+async def test_query_batch_reports_unknown_types_per_query(monkeypatch: Any) -> None:
+    """Unknown query types and non-dict specs fail on their own."""
+    prepared = patch_tenant_collection(monkeypatch, _tenant_for)
+
+    results = await w_methods.query_batch(
+        client=None,  # type: ignore[arg-type]
+        queries=[
+            {
+                "type": "generate",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+            },
+            "hybrid",  # type: ignore[list-item]
+            {
+                "type": "hybrid",
+                "collection_name": "Movie",
+                "application_id": APP_ID,
+                "query": "dreams",
+            },
+        ],
+        context={},
+    )
+
+    assert "Query type must be one of" in results[0]["error"]
+    assert results[1] == {"error": "Query spec must be a dictionary, got str"}
+    assert results[2] == {"objects": []}
+    assert prepared == [("Movie", APP_ID)]
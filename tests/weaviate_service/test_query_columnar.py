@@ -0,0 +1,158 @@
+"""Unit tests for columnar query results."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.service_codecs import (
+    decode_columnar,
+    encode_columnar,
+)
+from hypha_startup_services.weaviate_service.utils.vector_utils import (
+    PACKED_VECTOR_DTYPE,
+)
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+
+@dataclass
+class _FakeMetadata:
+    distance: float | None = None
+    score: float | None = None
+
+
+@dataclass
+class _FakeObject:
+    properties: dict[str, Any]
+    vector: dict[str, Any] = field(default_factory=dict)
+    metadata: _FakeMetadata = field(default_factory=_FakeMetadata)
+    uuid: UUID = field(default_factory=uuid4)
+    collection: str = "Movie"
+
+
+class _FakeQuery:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.objects = objects
+
+    async def near_vector(self, **_kwargs: Any) -> Any:  # NOSONAR S7503
+        return self
+
+
+class _FakeTenantCollection:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.query = _FakeQuery(objects)
+
+
+def _objects() -> list[_FakeObject]:
+    return [
+        _FakeObject(
+            {"title": "Alien", "year": 1979},
+            {"default": [0.5, 1.0, 1.5]},
+            _FakeMetadata(distance=0.1),
+        ),
+        _FakeObject(
+            {"title": "Heat"},
+            {"default": [2.0, 2.5, 3.0]},
+            _FakeMetadata(distance=0.2),
+            collection="Book",
+        ),
+    ]
+
+
+def test_columns_per_property() -> None:
+    """Properties become columns and collection names are deduplicated."""
+    objects = [*_objects(), _FakeObject({"title": "Up"})]
+
+    columns = encode_columnar(objects)  # type: ignore[arg-type]
+
+    assert columns["count"] == 3  # noqa: PLR2004
+    assert columns["uuids"] == [str(obj.uuid) for obj in objects]
+    assert columns["properties"] == {
+        "title": ["Alien", "Heat", "Up"],
+        "year": [1979, None, None],
+    }
+    assert columns["collections"] == ["Movie", "Book"]
+    assert columns["collection_index"] == [0, 1, 0]
+
+
+def test_only_requested_metadata() -> None:
+    """Only the requested metadata fields are encoded."""
+    assert encode_columnar(_objects())["metadata"] == {}  # type: ignore[arg-type]
+    assert encode_columnar(_objects(), ["distance"])["metadata"] == {  # type: ignore[arg-type]
+        "distance": [0.1, 0.2],
+    }
+
+
+def test_vectors_are_packed() -> None:
+    """Vectors of equal length are packed into one float32 buffer."""
+    columns = encode_columnar(_objects())  # type: ignore[arg-type]
+
+    packed = columns["vectors"]["default"]
+    assert isinstance(packed, dict)
+    assert packed["dtype"] == PACKED_VECTOR_DTYPE
+    assert packed["shape"] == [2, 3]
+    assert isinstance(packed["data"], bytes)
+    assert len(packed["data"]) == 2 * 3 * 4
+
+
+def test_uneven_vectors_stay_lists() -> None:
+    """Missing vectors and multi-vectors are not packed."""
+    objects = [
+        _FakeObject({}, {"default": [1.0], "colbert": [[1.0, 2.0]]}),
+        _FakeObject({}, {"colbert": [[3.0, 4.0]]}),
+    ]
+
+    columns = encode_columnar(objects)  # type: ignore[arg-type]
+
+    assert columns["vectors"] == {
+        "default": [[1.0], None],
+        "colbert": [[[1.0, 2.0]], [[3.0, 4.0]]],
+    }
+
+
+def test_decode_round_trip() -> None:
+    """Decoding restores one dictionary per object."""
+    objects = _objects()
+
+    decoded = decode_columnar(encode_columnar(objects, ["distance"]))  # type: ignore[arg-type]
+
+    assert [row["properties"] for row in decoded] == [obj.properties for obj in objects]
+    assert [row["collection"] for row in decoded] == ["Movie", "Book"]
+    assert [row["metadata"] for row in decoded] == [
+        {"distance": 0.1},
+        {"distance": 0.2},
+    ]
+    np.testing.assert_array_equal(decoded[1]["vector"]["default"], [2.0, 2.5, 3.0])
+
+
+@pytest.mark.asyncio
+async def test_query_returns_columnar(monkeypatch: Any) -> None:
+    """Queries return columns when asked for the columnar format."""
+    fake_tenant = _FakeTenantCollection(_objects())
+
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.query_near_vector(
+        None,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        near_vector=[0.1, 0.2, 0.3],
+        return_metadata={"distance": True, "score": False},
+        result_format="columnar",
+    )
+
+    columns: Any = result["objects"]
+    assert columns["format"] == "columnar"
+    assert list(columns["metadata"]) == ["distance"]
+
+    with pytest.raises(ValueError, match="Unknown result format"):
+        await w_methods.query_near_vector(
+            None,  # type: ignore[arg-type]
+            "Movie",
+            APP_ID,
+            near_vector=[0.1, 0.2, 0.3],
+            result_format="rows",  # type: ignore[arg-type]
+        )
@@ -0,0 +1,175 @@
+"""Unit tests for application query defaults and text truncation."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils import (
+    artifact_utils,
+    service_utils,
+)
+from hypha_startup_services.weaviate_service.utils.collection_utils import (
+    attach_query_defaults,
+    query_defaults_of,
+)
+from hypha_startup_services.weaviate_service.utils.query_utils import (
+    truncate_text_properties,
+)
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+LONG_TEXT = "Segmentation of nuclei in fluorescence microscopy images. " * 20
+
+
+@dataclass
+class _FakeObject:
+    properties: dict[str, Any]
+    uuid: UUID = field(default_factory=uuid4)
+    collection: str = "Shared__DELIM__Movie"
+
+
+class _FakeQuery:
+    def __init__(self) -> None:
+        self.last_kwargs: dict[str, Any] = {}
+
+    async def hybrid(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        self.last_kwargs = kwargs
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.objects = [
+                    _FakeObject({"name": "Nuclei", "description": LONG_TEXT}),
+                ]
+
+        return _Resp()
+
+
+class _FakeTenantCollection:
+    def __init__(self) -> None:
+        self.query = _FakeQuery()
+
+
+def test_truncate_long_strings() -> None:
+    """Long strings are cut while other properties stay untouched."""
+    objects = [_FakeObject({"text": LONG_TEXT, "year": 2024, "tags": ["a"]})]
+
+    truncate_text_properties(objects, max_chars=12)  # type: ignore[arg-type]
+    assert objects[0].properties == {
+        "text": LONG_TEXT[:12],
+        "year": 2024,
+        "tags": ["a"],
+    }
+
+    with pytest.raises(ValueError, match="at least 1"):
+        truncate_text_properties(objects, max_chars=0)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_application_defaults_apply(monkeypatch: Any) -> None:
+    """Application defaults project properties and truncate text."""
+    fake_tenant = _FakeTenantCollection()
+    attach_query_defaults(
+        fake_tenant,  # type: ignore[arg-type]
+        {"return_properties": ["name", "description"], "max_text_chars": 20},
+    )
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.query_hybrid(
+        None,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        query="nuclei",
+    )
+
+    assert fake_tenant.query.last_kwargs["return_properties"] == [
+        "name",
+        "description",
+    ]
+    assert "max_text_chars" not in fake_tenant.query.last_kwargs
+    assert result["objects"][0].properties["description"] == LONG_TEXT[:20]
+
+
+@pytest.mark.asyncio
+async def test_query_options_override_defaults(monkeypatch: Any) -> None:
+    """Options passed to a query, including None, take precedence."""
+    fake_tenant = _FakeTenantCollection()
+    attach_query_defaults(
+        fake_tenant,  # type: ignore[arg-type]
+        {"return_properties": ["name"], "max_text_chars": 20},
+    )
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.query_hybrid(
+        None,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        query="nuclei",
+        return_properties=None,
+        max_text_chars=None,
+    )
+
+    assert fake_tenant.query.last_kwargs["return_properties"] is None
+    assert result["objects"][0].properties["description"] == LONG_TEXT
+
+
+@pytest.mark.asyncio
+async def test_invalid_defaults_are_rejected() -> None:
+    """Unknown options and non-positive limits are rejected."""
+    with pytest.raises(ValueError, match="Unknown query defaults: limit"):
+        await w_methods.applications_set_query_defaults(
+            None,  # type: ignore[arg-type]
+            "Movie",
+            APP_ID,
+            {"limit": 5},  # type: ignore[typeddict-unknown-key]
+        )
+
+    with pytest.raises(ValueError, match="max_text_tokens must be at least 1"):
+        await w_methods.applications_set_query_defaults(
+            None,  # type: ignore[arg-type]
+            "Movie",
+            APP_ID,
+            {"max_text_tokens": 0},
+        )
+
+
+@pytest.mark.asyncio
+async def test_prepare_reads_defaults_with_the_artifact(monkeypatch: Any) -> None:
+    """Defaults come from the one artifact read, so changes elsewhere apply."""
+    reads: list[str] = []
+    stored: dict[str, Any] = {"return_properties": ["name"]}
+
+    async def _fake_get_artifact(artifact_id: str) -> dict[str, Any]:  # NOSONAR S7503
+        reads.append(artifact_id)
+        return {"manifest": {"metadata": {"query_defaults": dict(stored)}}}
+
+    async def _fake_get_permitted_collection(  # NOSONAR S7503
+        *_args: Any,
+        **_kwargs: Any,
+    ) -> _FakeTenantCollection:
+        return _FakeTenantCollection()
+
+    monkeypatch.setattr(artifact_utils, "get_artifact", _fake_get_artifact)
+    monkeypatch.setattr(
+        service_utils,
+        "get_permitted_collection",
+        _fake_get_permitted_collection,
+    )
+    context = {"user": {"scope": {"current_workspace": "ws-user-owner"}}}
+
+    async def _prepare() -> Any:
+        return await service_utils.prepare_tenant_collection(
+            None,  # type: ignore[arg-type]
+            "Movie",
+            APP_ID,
+            context=context,
+        )
+
+    first = await _prepare()
+    stored["return_properties"] = ["name", "description"]
+    second = await _prepare()
+
+    assert query_defaults_of(first) == {"return_properties": ["name"]}
+    assert query_defaults_of(second)["return_properties"] == ["name", "description"]
+    assert len(reads) == 2  # noqa: PLR2004
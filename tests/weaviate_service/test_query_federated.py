@@ -0,0 +1,147 @@
+"""Unit tests for federated search across applications."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.query_utils import (
+    fuse_ranked_lists,
+)
+from tests.weaviate_service.utils import (
+    APP_ID,
+    USER1_APP_ID,
+    USER2_APP_ID,
+    patch_tenant_collection,
+)
+
+
+@dataclass
+class _FakeMetadata:
+    score: float | None
+
+
+@dataclass
+class _FakeObject:
+    name: str
+    metadata: _FakeMetadata
+    uuid: UUID = field(default_factory=uuid4)
+    collection: str = "Shared__DELIM__Movie"
+
+
+class _FakeQuery:
+    def __init__(self, scored: list[tuple[str, float]]) -> None:
+        self.scored = scored
+        self.last_kwargs: dict[str, Any] | None = None
+
+    async def hybrid(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        self.last_kwargs = kwargs
+
+        class _Resp:
+            def __init__(self, objects: list[_FakeObject]) -> None:
+                self.objects = objects
+
+        return _Resp(
+            [
+                _FakeObject(name=name, metadata=_FakeMetadata(score))
+                for name, score in self.scored
+            ],
+        )
+
+
+class _FakeTenantCollection:
+    def __init__(self, scored: list[tuple[str, float]]) -> None:
+        self.query = _FakeQuery(scored)
+
+
+def test_rrf_interleaves_rankings() -> None:
+    """RRF only uses ranks, so the top items of every list come first."""
+    merged = fuse_ranked_lists(
+        [[("a1", 100.0), ("a2", 90.0)], [("b1", 0.1), ("b2", 0.05)]],
+        limit=3,
+    )
+
+    assert [item for _, item, _ in merged] == ["a1", "b1", "a2"]
+    assert [source for source, _, _ in merged] == [0, 1, 0]
+
+
+def test_score_fusion_normalises_each_list() -> None:
+    """Score fusion compares lists on a normalised [0, 1] scale."""
+    merged = fuse_ranked_lists(
+        [[("a1", 100.0), ("a2", 50.0), ("a3", 0.0)], [("b1", 0.9), ("b2", 0.6)]],
+        limit=5,
+        method="score",
+    )
+
+    scores = {item: score for _, item, score in merged}
+    assert scores["a1"] == scores["b1"] == 1.0
+    assert scores["a2"] == pytest.approx(0.5)
+    assert scores["a3"] == scores["b2"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_query_federated_merges_targets(monkeypatch: Any) -> None:
+    """Each target is asked for `limit` objects and failures are reported."""
+    first = _FakeTenantCollection([("a1", 0.9), ("a2", 0.2)])
+    second = _FakeTenantCollection([("b1", 0.8)])
+    tenants = {APP_ID: first, USER1_APP_ID: second}
+    patch_tenant_collection(monkeypatch, tenants.__getitem__)
+
+    result = await w_methods.query_federated(
+        client=None,  # type: ignore[arg-type]
+        targets=[
+            {"collection_name": "Movie", "application_id": APP_ID},
+            {"collection_name": "Movie", "application_id": USER2_APP_ID},
+            {"collection_name": "Movie", "application_id": USER1_APP_ID},
+        ],
+        query="dreams",
+        limit=2,
+        fusion="score",
+        context={},
+    )
+
+    assert [obj.name for obj in result["objects"]] == ["a1", "b1"]
+    assert result["targets"] == [0, 2]
+    assert set(result["errors"]) == {"1"}
+    assert first.query.last_kwargs is not None
+    assert first.query.last_kwargs["limit"] == 2
+    assert first.query.last_kwargs["return_metadata"].score is True
+
+
+@pytest.mark.asyncio
+async def test_query_federated_rejects_columnar_results() -> None:
+    """Merging needs objects, so columnar results are rejected up front."""
+    with pytest.raises(ValueError, match="columnar"):
+        await w_methods.query_federated(
+            client=None,  # type: ignore[arg-type]
+            targets=[{"collection_name": "Movie", "application_id": APP_ID}],
+            query="dreams",
+            context={},
+            result_format="columnar",
+        )
+
+
+@pytest.mark.asyncio
+async def test_query_federated_validates_targets_and_kwargs() -> None:
+    """Malformed targets and reserved arguments fail with a clear error."""
+    with pytest.raises(ValueError, match="Federated target 1 needs a non-empty"):
+        await w_methods.query_federated(
+            client=None,  # type: ignore[arg-type]
+            targets=[
+                {"collection_name": "Movie", "application_id": APP_ID},
+                {"collection_name": "Movie"},  # type: ignore[typeddict-item]
+            ],
+            query="dreams",
+            context={},
+        )
+    with pytest.raises(ValueError, match="sets application_id itself"):
+        await w_methods.query_federated(
+            None,  # type: ignore[arg-type]
+            [{"collection_name": "Movie", "application_id": APP_ID}],
+            "dreams",
+            10,
+            {},
+            application_id=APP_ID,
+        )
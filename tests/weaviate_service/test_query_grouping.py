@@ -0,0 +1,133 @@
+"""Unit tests for grouped (chunk-collapsing) hybrid and near_vector queries."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.query_utils import (
+    GROUP_OVERFETCH_FACTOR,
+    collapse_by_property,
+)
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+
+@dataclass
+class _FakeObject:
+    properties: dict[str, Any]
+    uuid: UUID = field(default_factory=uuid4)
+    collection: str = "Shared__DELIM__Movie"
+
+
+def _chunks(*doc_ids: str | None) -> list[_FakeObject]:
+    return [_FakeObject(properties={"doc_id": doc_id}) for doc_id in doc_ids]
+
+
+class _FakeQuery:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.objects = objects
+        self.last_kwargs: dict[str, Any] | None = None
+
+    async def _respond(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        self.last_kwargs = kwargs
+
+        class _Resp:
+            def __init__(self, objects: list[_FakeObject]) -> None:
+                self.objects = objects
+
+        return _Resp(self.objects)
+
+    async def hybrid(self, **kwargs: Any) -> Any:
+        return await self._respond(**kwargs)
+
+    async def near_vector(self, **kwargs: Any) -> Any:
+        return await self._respond(**kwargs)
+
+
+class _FakeTenantCollection:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.query = _FakeQuery(objects)
+
+
+def test_collapse_keeps_best_chunk_per_document() -> None:
+    """Each document keeps only its best-ranked chunk."""
+    objects = _chunks("a", "a", "b", "a", "c")
+
+    collapsed = collapse_by_property(objects, "doc_id", limit=10)
+
+    assert [obj.properties["doc_id"] for obj in collapsed] == ["a", "b", "c"]
+    assert collapsed[0] is objects[0]
+
+
+def test_collapse_group_size_and_limit() -> None:
+    """Groups keep up to group_size members and at most `limit` groups."""
+    objects = _chunks("a", "b", "a", "c", "b", "a")
+
+    collapsed = collapse_by_property(objects, "doc_id", limit=2, group_size=2)
+
+    assert collapsed == [objects[0], objects[2], objects[1], objects[4]]
+
+
+def test_collapse_missing_key_is_its_own_group() -> None:
+    """Objects without the grouping property are never merged together."""
+    objects = _chunks(None, None, "a")
+
+    collapsed = collapse_by_property(objects, "doc_id", limit=10)
+
+    assert len(collapsed) == len(objects)
+
+
+def test_collapse_keeps_values_of_different_types_apart() -> None:
+    """Values that only match as strings, like 1 and "1", are distinct groups."""
+    objects = [_FakeObject(properties={"doc_id": doc_id}) for doc_id in (1, "1", 1)]
+
+    collapsed = collapse_by_property(objects, "doc_id", limit=10)
+
+    assert collapsed == objects[:2]
+
+
+@pytest.mark.asyncio
+async def test_query_hybrid_grouped_overfetches(monkeypatch: Any) -> None:
+    """Grouped hybrid queries over-fetch and return distinct documents."""
+    fake_tenant = _FakeTenantCollection(_chunks("a", "a", "b", "b", "c"))
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.query_hybrid(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        query="dreams",
+        limit=2,
+        return_properties=["title"],
+        group_by_property="doc_id",
+    )
+
+    kwargs = fake_tenant.query.last_kwargs
+    assert kwargs is not None
+    assert kwargs["limit"] == 2 * GROUP_OVERFETCH_FACTOR
+    assert kwargs["return_properties"] == ["title", "doc_id"]
+    assert [obj.properties["doc_id"] for obj in result["objects"]] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_query_near_vector_ungrouped_unchanged(monkeypatch: Any) -> None:
+    """Without group_by_property, kwargs and results pass through untouched."""
+    objects = _chunks("a", "a")
+    fake_tenant = _FakeTenantCollection(objects)
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.query_near_vector(
+        client=None,  # type: ignore[arg-type]
+        collection_name="Movie",
+        application_id=APP_ID,
+        near_vector=[0.1, 0.2],
+        limit=5,
+    )
+
+    kwargs = fake_tenant.query.last_kwargs
+    assert kwargs is not None
+    assert kwargs["limit"] == 5
+    assert "return_properties" not in kwargs
+    assert len(result["objects"]) == len(objects)
@@ -0,0 +1,114 @@
+"""Unit tests for cursor-based iteration over application objects."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+
+@dataclass
+class _FakeObject:
+    uuid: UUID
+    properties: dict[str, Any] = field(default_factory=dict)
+    collection: str = "Shared__DELIM__Movie"
+
+
+def _make_objects(app_ids: list[str]) -> list[_FakeObject]:
+    return [
+        _FakeObject(uuid=UUID(int=index + 1), properties={"application_id": app_id})
+        for index, app_id in enumerate(app_ids)
+    ]
+
+
+class _FakeQuery:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.objects = objects
+        self.calls: list[dict[str, Any]] = []
+
+    async def fetch_objects(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        self.calls.append(kwargs)
+        after = kwargs["after"]
+        start = 0
+        if after is not None:
+            start = next(
+                index + 1
+                for index, obj in enumerate(self.objects)
+                if str(obj.uuid) == after
+            )
+
+        class _Resp:
+            def __init__(self, objects: list[_FakeObject]) -> None:
+                self.objects = objects
+
+        return _Resp(self.objects[start : start + kwargs["limit"]])
+
+
+class _FakeTenantCollection:
+    def __init__(self, objects: list[_FakeObject]) -> None:
+        self.query = _FakeQuery(objects)
+
+
+async def _collect(**kwargs: Any) -> list[Any]:
+    return [
+        batch
+        async for batch in w_methods.query_iterate(
+            client=None,  # type: ignore[arg-type]
+            collection_name="Movie",
+            application_id=APP_ID,
+            **kwargs,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iterate_streams_only_application_objects(monkeypatch: Any) -> None:
+    """Objects of other applications sharing the tenant are skipped."""
+    objects = _make_objects([APP_ID, "Other", APP_ID, APP_ID, "Other", APP_ID, APP_ID])
+    fake_tenant = _FakeTenantCollection(objects)
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    batches = await _collect(batch_size=2)
+
+    streamed = [obj for batch in batches for obj in batch["objects"]]
+    assert [obj.uuid.int for obj in streamed] == [1, 3, 4, 6, 7]
+    assert all(obj.collection == "Movie" for obj in streamed)
+    assert [batch["done"] for batch in batches] == [False, False, True]
+    assert all(call["limit"] == 2 for call in fake_tenant.query.calls)
+
+
+@pytest.mark.asyncio
+async def test_iterate_resumes_from_cursor(monkeypatch: Any) -> None:
+    """A batch cursor resumes the scan right after the batch."""
+    objects = _make_objects([APP_ID] * 5)
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection(objects))
+
+    first = await _collect(batch_size=2)
+    resumed = await _collect(batch_size=2, cursor=first[0]["cursor"])
+
+    assert [obj.uuid.int for obj in first[0]["objects"]] == [1, 2]
+    streamed = [obj.uuid.int for batch in resumed for obj in batch["objects"]]
+    assert streamed == [3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_iterate_projection_keeps_application_id(monkeypatch: Any) -> None:
+    """application_id is fetched for scoping but only returned if asked for."""
+    fake_tenant = _FakeTenantCollection(_make_objects([APP_ID, "Other"]))
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    (batch,) = await _collect(return_properties=["title"])
+
+    call = fake_tenant.query.calls[0]
+    assert call["return_properties"] == ["title", "application_id"]
+    assert call["after"] is None
+    assert [obj.properties for obj in batch["objects"]] == [{}]
+
+    patch_tenant_collection(monkeypatch, _FakeTenantCollection(_make_objects([APP_ID])))
+    (batch,) = await _collect(return_properties=["title", "application_id"])
+    assert [obj.properties for obj in batch["objects"]] == [
+        {"application_id": APP_ID},
+    ]
@@ -0,0 +1,86 @@
+"""Unit tests for the pydantic codec schema caches."""
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from weaviate.classes.query import Filter
+
+from hypha_startup_services.weaviate_service import service_codecs
+from hypha_startup_services.weaviate_service.service_codecs import (
+    model_from_schema,
+    register_weaviate_codecs,
+)
+
+
+class _Movie(BaseModel):
+    title: str
+    year: int
+
+
+class _FakeServer:
+    def __init__(self) -> None:
+        self.codecs: dict[str, dict[str, Any]] = {}
+
+    def register_codec(self, codec: dict[str, Any]) -> None:
+        self.codecs[codec["name"]] = codec
+
+
+def _pydantic_codec() -> dict[str, Any]:
+    server = _FakeServer()
+    register_weaviate_codecs(server)  # type: ignore[arg-type]
+    return server.codecs["pydantic_model"]
+
+
+def test_decoded_models_are_cached() -> None:
+    """Decoding the same schema twice reuses the generated model class."""
+    codec = _pydantic_codec()
+
+    first = codec["decoder"](codec["encoder"](_Movie(title="Alien", year=1979)))
+    second = codec["decoder"](codec["encoder"](_Movie(title="Heat", year=1995)))
+
+    assert type(first) is type(second)
+    assert second.model_dump() == {"title": "Heat", "year": 1995}
+
+
+def test_schema_always_sent() -> None:
+    """Every encoding carries the schema, whichever peer receives it."""
+    codec = _pydantic_codec()
+
+    first = codec["encoder"](_Movie(title="Alien", year=1979))
+    second = codec["encoder"](_Movie(title="Heat", year=1995))
+
+    assert second["_rschema"] == first["_rschema"]
+    assert second["_rschema_ref"] == first["_rschema_ref"]
+
+
+def test_missing_schema_is_rejected(monkeypatch: Any) -> None:
+    """A model sent without its schema cannot be decoded."""
+    monkeypatch.setattr(service_codecs, "_decoded_models", {})
+
+    with pytest.raises(ValueError, match="without its schema"):
+        model_from_schema(None, "0" * 64)
+
+
+def test_mismatched_reference_is_not_trusted(monkeypatch: Any) -> None:
+    """A new schema is cached under its own hash, not the reference sent."""
+    monkeypatch.setattr(service_codecs, "_decoded_models", {})
+
+    class _Book(BaseModel):
+        author: str
+
+    movie = model_from_schema(_Movie.model_json_schema(), "forged")
+    book = model_from_schema(_Book.model_json_schema(), "forged")
+
+    assert movie is not book
+    assert list(book.model_fields) == ["author"]
+
+
+def test_filter_values_round_trip() -> None:
+    """Weaviate filters still decode to filter values."""
+    codec = _pydantic_codec()
+    value = Filter.by_property("year").greater_than(2000)
+
+    decoded = codec["decoder"](codec["encoder"](value))
+
+    assert decoded == value
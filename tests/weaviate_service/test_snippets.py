@@ -0,0 +1,122 @@
+"""Unit tests for query-aware snippet extraction."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from hypha_startup_services.weaviate_service import methods as w_methods
+from hypha_startup_services.weaviate_service.utils.snippets import (
+    SNIPPET_INFO_PROPERTY,
+    best_window,
+    extract_snippets,
+    query_terms,
+)
+from tests.weaviate_service.utils import APP_ID, patch_tenant_collection
+
+FILLER = "Unrelated words about lab logistics and shipping schedules. " * 10
+MATCH = "Cell segmentation of nuclei works well on fluorescence images."
+TEXT = FILLER + MATCH + " " + FILLER
+
+
+@dataclass
+class _FakeObject:
+    properties: dict[str, Any]
+    uuid: UUID = field(default_factory=uuid4)
+    collection: str = "Shared__DELIM__Movie"
+
+
+class _FakeQuery:
+    def __init__(self) -> None:
+        self.last_kwargs: dict[str, Any] = {}
+
+    async def hybrid(self, **kwargs: Any) -> Any:  # NOSONAR S7503
+        self.last_kwargs = kwargs
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.objects = [_FakeObject({"name": "Nuclei", "text": TEXT})]
+
+        return _Resp()
+
+
+class _FakeTenantCollection:
+    def __init__(self) -> None:
+        self.query = _FakeQuery()
+
+
+def test_query_terms() -> None:
+    """Queries are split into lowercased words."""
+    assert query_terms("Nuclei, cell-segmentation!") == {
+        "nuclei",
+        "cell",
+        "segmentation",
+    }
+
+
+def test_best_window_covers_matches() -> None:
+    """The chosen window contains the densest run of query terms."""
+    start, end = best_window(TEXT, query_terms("nuclei segmentation"), 80)
+
+    assert end - start <= 80  # noqa: PLR2004
+    assert "segmentation of nuclei" in TEXT[start:end]
+    assert TEXT[start - 1] == " "
+
+
+def test_best_window_without_match() -> None:
+    """Without matching terms the window starts at the beginning."""
+    assert best_window(TEXT, {"zebrafish"}, 40)[0] == 0
+
+
+def test_extract_snippets_adds_offsets() -> None:
+    """The property is replaced by its snippet and offsets are recorded."""
+    objects = [_FakeObject({"text": TEXT, "year": 2024}), _FakeObject({})]
+
+    extract_snippets(objects, "nuclei", "text", 60)  # type: ignore[arg-type]
+
+    info = objects[0].properties[SNIPPET_INFO_PROPERTY]
+    assert objects[0].properties["text"] == TEXT[info["start"] : info["end"]]
+    assert "nuclei" in objects[0].properties["text"]
+    assert info["property"] == "text"
+    assert info["length"] == len(TEXT)
+    assert objects[1].properties == {}
+
+    with pytest.raises(ValueError, match="at least 1"):
+        extract_snippets(objects, "nuclei", "text", 0)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_query_returns_snippets(monkeypatch: Any) -> None:
+    """Hybrid queries fetch the snippet property and shorten it."""
+    fake_tenant = _FakeTenantCollection()
+
+    patch_tenant_collection(monkeypatch, fake_tenant)
+
+    result = await w_methods.query_hybrid(
+        None,  # type: ignore[arg-type]
+        "Movie",
+        APP_ID,
+        query="fluorescence nuclei",
+        return_properties=["name"],
+        snippet_property="text",
+        snippet_chars=100,
+    )
+
+    assert fake_tenant.query.last_kwargs["return_properties"] == ["name", "text"]
+    snippet = result["objects"][0].properties["text"]
+    assert len(snippet) <= 100  # noqa: PLR2004
+    assert "nuclei" in snippet
+    assert "fluorescence" in snippet
+
+
+@pytest.mark.asyncio
+async def test_snippets_need_text_query() -> None:
+    """Snippets are rejected for queries without text."""
+    with pytest.raises(ValueError, match="Snippets need a text query"):
+        await w_methods._execute_query(  # noqa: SLF001
+            _FakeTenantCollection(),  # type: ignore[arg-type]
+            "hybrid",
+            APP_ID,
+            snippet_property="text",
+        )
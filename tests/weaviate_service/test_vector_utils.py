@@ -0,0 +1,50 @@
+"""Unit tests for binary vector encodings."""
+
+import numpy as np
+import pytest
+
+from hypha_startup_services.weaviate_service.utils.vector_utils import (
+    PACKED_VECTOR_DTYPE,
+    as_vector_array,
+    decode_vector,
+    pack_vectors,
+    split_batch_vectors,
+)
+
+
+def test_packed_vectors_round_trip() -> None:
+    """Packed vectors are read back as a float32 array."""
+    packed = pack_vectors([[1.0, 2.0], [3.0, 4.0]])
+
+    assert isinstance(packed, dict)
+    assert packed["dtype"] == PACKED_VECTOR_DTYPE
+    np.testing.assert_array_equal(as_vector_array(packed), [[1, 2], [3, 4]])
+
+
+def test_decode_vector_keeps_lists() -> None:
+    """Lists pass through unchanged and arrays are converted to float32."""
+    assert decode_vector([0.1, 0.2]) == [0.1, 0.2]
+
+    decoded = decode_vector({"title": np.ones(3, dtype=np.float64)})
+
+    assert decoded["title"].dtype == np.float32
+
+
+def test_decode_vector_rejects_integers() -> None:
+    """Integer arrays are not accepted as vectors."""
+    with pytest.raises(ValueError, match="floating point"):
+        decode_vector(np.ones(3, dtype=np.int64))
+
+
+def test_split_named_batch_vectors() -> None:
+    """Named batch vectors are split into one dictionary per object."""
+    batch = {
+        "title": np.zeros((2, 3), dtype=np.float32),
+        "body": pack_vectors([[1.0], [2.0]]),
+    }
+
+    rows = split_batch_vectors(batch, 2)  # type: ignore[arg-type]
+
+    assert list(rows[1]) == ["title", "body"]
+    np.testing.assert_array_equal(rows[1]["body"], [2.0])
+    assert np.shares_memory(rows[0]["title"], batch["title"])
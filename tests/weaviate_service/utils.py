@@ -1,12 +1,16 @@
 """Common utilities for Weaviate tests."""
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TypedDict
+from typing import Any, TypedDict
+from uuid import UUID
 
+import pytest
 from hypha_rpc.rpc import RemoteException, RemoteService
 
+from hypha_startup_services.weaviate_service import methods as w_methods
 from hypha_startup_services.weaviate_service.utils.models import CollectionConfig
 
 logging.basicConfig(level=logging.DEBUG)
@@ -264,3 +268,58 @@ async def create_test_application(weaviate_service: RemoteService) -> None:
         collection_name="Movie",
         description="An application for movie data",
     )
+
+
+@dataclass
+class FakeBatchError:
+    """Error of one object in a fake batch insert."""
+
+    message: str
+
+
+@dataclass
+class FakeBatchReturn:
+    """Result of a fake batch insert."""
+
+    uuids: dict[int, UUID] = field(default_factory=dict)
+    errors: dict[int, FakeBatchError] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def has_errors(self) -> bool:
+        """Whether any object failed."""
+        return bool(self.errors)
+
+
+def patch_tenant_collection(
+    monkeypatch: pytest.MonkeyPatch,
+    tenant: object | Callable[[str], object],
+) -> list[tuple[str, str]]:
+    """Make tenant preparation return a fake tenant collection.
+
+    Args:
+        monkeypatch: Fixture used to patch the service methods
+        tenant: Fake returned for every application, or a function taking
+            the application ID and returning its fake or raising
+
+    Returns:
+        The collection name and application ID of every preparation, in order
+
+    """
+    prepared: list[tuple[str, str]] = []
+
+    async def _fake_prepare_tenant_collection(  # NOSONAR S7503
+        _client: Any,
+        collection_name: str,
+        application_id: str,
+        **_kwargs: Any,
+    ) -> object:
+        prepared.append((collection_name, application_id))
+        return tenant(application_id) if callable(tenant) else tenant
+
+    monkeypatch.setattr(
+        w_methods,
+        "prepare_tenant_collection",
+        _fake_prepare_tenant_collection,
+    )
+    return prepared